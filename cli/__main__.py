@@ -504,11 +504,30 @@ def server(
         bool,
         typer.Option("--reload", help="Enable auto-reload for development"),
     ] = False,
+    workers: Annotated[
+        int,
+        typer.Option(
+            "--workers",
+            "-w",
+            envvar=["ARCOPS_WORKERS", "WEB_CONCURRENCY"],
+            min=1,
+            help=(
+                "Worker processes (ignored with --reload). On Windows more than one "
+                "disables the streaming cluster and connectivity endpoints"
+            ),
+        ),
+    ] = 1,
 ) -> None:
     """
     Start the MCP HTTP server.
 
-    Runs the FastAPI-based MCP server for tool invocation via HTTP.
+    Runs the FastAPI-based MCP server for tool invocation via HTTP. With more
+    than one worker, requests are spread over separate processes, so CPU-bound
+    tool work runs on several cores.
+
+    On Windows, --workers above 1 and --reload run on a SelectorEventLoop, which
+    can't spawn subprocesses: az/PowerShell calls fall back to threads, but the
+    streaming endpoints need the default single-worker server.
     """
     typer.echo(f"Starting MCP server on {host}:{port}")
 
@@ -519,6 +538,9 @@ def server(
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else workers,
+        loop="auto",
+        http="httptools",
         log_level="info",
     )
 
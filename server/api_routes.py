@@ -8,21 +8,50 @@ not simulated/mock data.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import hashlib
+import inspect
 import json
 import logging
 import os
+import re
 import shutil
 import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, AsyncGenerator
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterator
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 from fastapi.responses import StreamingResponse
 
-from server.azure_context import AzureContext
+from server.azure_context import CLUSTER_FIELDS, AzureContext
+from server.azure_context import run_async as _run_async
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Fast JSON helpers - orjson when available, stdlib otherwise. Both return/accept
+# bytes-compatible values so SSE frames can be built without a UTF-8 re-encode.
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
 # Create router for API endpoints
 router = APIRouter(prefix="/api", tags=["azure"])
 
@@ -35,19 +64,261 @@ def _find_az_cli() -> str | None:
     return AzureContext.find_az_cli()
 
 
+# Read-only az commands currently running, keyed by argv
+_AZ_INFLIGHT: dict[tuple[str, ...], asyncio.Task[subprocess.CompletedProcess[Any]]] = {}
+
+
+async def _run_az(cmd: list[str], timeout: float) -> subprocess.CompletedProcess[Any]:
+    """Run a read-only az command, sharing one process between identical concurrent calls.
+
+    Callers that arrive while the same command is already running await its
+    result (or exception) instead of spawning another CLI process. A caller
+    being cancelled does not cancel the shared run for the others.
+    """
+    key = tuple(cmd)
+    task = _AZ_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_run_async(cmd, timeout))
+        _AZ_INFLIGHT[key] = task
+
+        def _done(t: asyncio.Task[Any]) -> None:
+            if _AZ_INFLIGHT.get(key) is t:
+                del _AZ_INFLIGHT[key]
+
+        task.add_done_callback(_done)
+    return await asyncio.shield(task)
+
+
+# TTLs for az CLI responses - this data changes over minutes to hours
+_SUBSCRIPTIONS_TTL = 2 * 60 * 60.0
+_CLUSTERS_TTL = 5 * 60.0
+_EXTENSIONS_TTL = 5 * 60.0
+_STATUS_TTL = 15 * 60.0
+
+
+class _TTLCache:
+    """In-process TTL cache for az CLI responses.
+
+    Concurrent misses for the same key share one fetch, and a failed refresh
+    falls back to the last good value (marked ``stale``).
+    """
+
+    def __init__(self) -> None:
+        # key -> (monotonic timestamp, response)
+        self._entries: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+        self._locks: dict[tuple[Any, ...], asyncio.Lock] = {}
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        self._entries.clear()
+
+    async def get_or_fetch(
+        self,
+        key: tuple[Any, ...],
+        ttl: float,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        refresh: bool = False,
+        ok: Callable[[dict[str, Any]], bool] = lambda r: bool(r.get("success")),
+    ) -> dict[str, Any]:
+        """Return a cached response for ``key`` or fetch and cache a new one.
+
+        Args:
+            key: Cache key, e.g. ``("clusters", subscription)``
+            ttl: Maximum age in seconds of a cached response
+            fetch: Coroutine factory producing a fresh response
+            refresh: Bypass the cached response
+            ok: Predicate deciding whether a response is worth caching
+        """
+        requested_at = time.monotonic()
+        entry = self._entries.get(key)
+        if entry and not refresh and requested_at - entry[0] < ttl:
+            return self._annotate(entry)
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another request may have fetched while we waited for the lock
+            entry = self._entries.get(key)
+            if entry and (
+                entry[0] >= requested_at or (not refresh and time.monotonic() - entry[0] < ttl)
+            ):
+                return self._annotate(entry)
+
+            result = await fetch()
+            if ok(result):
+                self._entries[key] = (time.monotonic(), result)
+                return result
+
+            if entry:
+                stale = self._annotate(entry)
+                stale["stale"] = True
+                stale["hint"] = result.get("error") or result.get("hint")
+                return stale
+            return result
+
+    @staticmethod
+    def _annotate(entry: tuple[float, dict[str, Any]]) -> dict[str, Any]:
+        ts, value = entry
+        return {**value, "cached": True, "age_s": round(time.monotonic() - ts, 1)}
+
+
+_AZ_CACHE = _TTLCache()
+
+# Cache-Control for GETs whose payload changes rarely; account data stays out of shared caches
+_SUBSCRIPTIONS_CACHE_CONTROL = "private, max-age=120"
+_STATUS_CACHE_CONTROL = "private, max-age=60"
+_ENDPOINTS_CACHE_CONTROL = "public, max-age=300"
+
+# Annotations that change on every cache hit and must not change the ETag
+_VOLATILE_KEYS = frozenset({"cached", "age_s"})
+
+
+def _etag(payload: dict[str, Any]) -> str:
+    """Strong ETag for a JSON payload, ignoring cache bookkeeping fields."""
+    stable = {k: v for k, v in payload.items() if k not in _VOLATILE_KEYS}
+    return f'"{hashlib.blake2b(_json_dumps(stable), digest_size=8).hexdigest()}"'
+
+
+def _conditional(
+    request: Request, response: Response, payload: dict[str, Any], cache_control: str
+) -> dict[str, Any] | Response:
+    """Attach ETag/Cache-Control to ``payload``, or answer 304 if the client's copy is current."""
+    etag = _etag(payload)
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        if etag in tags or "*" in tags:
+            return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return payload
+
+
+# (field, default) pairs kept from az list output
+_EXTENSION_FIELDS = (
+    ("name", None),
+    ("extensionType", None),
+    ("provisioningState", None),
+    ("version", None),
+    ("releaseTrain", None),
+    ("isSystemExtension", False),
+)
+_SUBSCRIPTION_FIELDS = (("id", None), ("name", None), ("isDefault", False), ("state", None))
+
+# Extensions every validated cluster is expected to have
+_EXPECTED_EXTENSIONS = ("microsoft.azuremonitor.containers", "microsoft.flux")
+
+
 @router.get("/clusters")
-async def list_clusters(subscription: str | None = None) -> dict[str, Any]:
+async def list_clusters(
+    subscription: str | None = None, refresh: bool = False, fields: str | None = None
+) -> dict[str, Any]:
     """
     List real AKS Arc connected clusters from Azure.
 
     Requires az CLI to be authenticated (az login).
+
+    Pass ``fields=name,location`` to get each cluster as an array of just
+    those values (listed once under ``fields``) instead of an object.
     """
-    return await AzureContext.get_connected_clusters(subscription)
+    result = await _AZ_CACHE.get_or_fetch(
+        ("clusters", subscription),
+        _CLUSTERS_TTL,
+        lambda: AzureContext.get_connected_clusters(subscription),
+        refresh,
+    )
+    if fields and result.get("success"):
+        names = [f for f in fields.split(",") if f]
+        result = {
+            **result,
+            "fields": names,
+            "clusters": [[c.get(f) for f in names] for c in result["clusters"]],
+        }
+    return result
+
+
+async def _iter_json_array(stream: asyncio.StreamReader) -> AsyncGenerator[Any, None]:
+    """Yield the items of a JSON array as they arrive on ``stream``.
+
+    Uses ijson's incremental parser when installed; otherwise the whole
+    document is read and parsed in one go.
+    """
+    try:
+        import ijson
+    except ImportError:  # pragma: no cover - optional speedup
+        data = await stream.read()
+        for item in _json_loads(data or b"[]"):
+            yield item
+        return
+
+    async for item in ijson.items_async(stream, "item"):
+        yield item
+
+
+@router.get("/clusters/stream")
+async def stream_clusters(subscription: str | None = None) -> StreamingResponse:
+    """
+    Stream AKS Arc connected clusters as NDJSON, one cluster summary per line.
+
+    Clusters are parsed and sent as ``az`` produces them, so the full listing
+    is never held in memory. Failures are reported as a final
+    ``{"error": ...}`` line.
+    """
+    az_cmd = _find_az_cli()
+
+    async def generate() -> AsyncGenerator[bytes, None]:
+        if not az_cmd:
+            yield _json_dumps({"error": "Azure CLI not found"}) + b"\n"
+            return
+
+        cmd = [az_cmd, "connectedk8s", "list", "-o", "json", "--only-show-errors"]
+        if subscription:
+            cmd.extend(["--subscription", subscription])
+
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        assert proc.stdout is not None and proc.stderr is not None  # both are PIPEs
+        # Drain stderr alongside stdout so a chatty CLI can't fill the pipe
+        stderr_task = asyncio.create_task(proc.stderr.read())
+        parse_error: Exception | None = None
+        try:
+            try:
+                async for cluster in _iter_json_array(proc.stdout):
+                    yield _json_dumps({k: cluster.get(k) for k in CLUSTER_FIELDS}) + b"\n"
+            except Exception as e:
+                parse_error = e
+
+            returncode = await proc.wait()
+            stderr = await stderr_task
+            if returncode != 0:
+                error = stderr.decode(errors="replace").strip()
+                yield _json_dumps({"error": error}) + b"\n"
+            elif parse_error:
+                yield _json_dumps({"error": f"Failed to parse response: {parse_error}"}) + b"\n"
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            stderr_task.cancel()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
 
 
 @router.get("/cluster/{cluster_name}/extensions")
-async def get_cluster_extensions(cluster_name: str, resource_group: str) -> dict[str, Any]:
+async def get_cluster_extensions(
+    cluster_name: str, resource_group: str, refresh: bool = False
+) -> dict[str, Any]:
     """Get extensions installed on a specific AKS Arc cluster."""
+    return await _AZ_CACHE.get_or_fetch(
+        ("extensions", cluster_name, resource_group),
+        _EXTENSIONS_TTL,
+        lambda: _fetch_cluster_extensions(cluster_name, resource_group),
+        refresh,
+    )
+
+
+async def _fetch_cluster_extensions(cluster_name: str, resource_group: str) -> dict[str, Any]:
+    """Run ``az k8s-extension list`` for a cluster."""
     az_cmd = _find_az_cli()
 
     if not az_cmd:
@@ -66,28 +337,24 @@ async def get_cluster_extensions(cluster_name: str, resource_group: str) -> dict
             "connectedClusters",
             "-o",
             "json",
+            "--only-show-errors",
         ]
 
-        logger.info("Running: %s", " ".join(cmd))
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running: %s", " ".join(cmd))
+        result = await _run_az(cmd, timeout=120)
 
         if result.returncode != 0:
-            return {"success": False, "extensions": [], "error": result.stderr}
+            return {
+                "success": False,
+                "extensions": [],
+                "error": result.stderr.decode(errors="replace"),
+            }
 
-        extensions = json.loads(result.stdout)
+        # Parse the raw bytes directly - no intermediate str decode
+        extensions = _json_loads(result.stdout)
 
-        ext_summaries = []
-        for ext in extensions:
-            ext_summaries.append(
-                {
-                    "name": ext.get("name"),
-                    "extensionType": ext.get("extensionType"),
-                    "provisioningState": ext.get("provisioningState"),
-                    "version": ext.get("version"),
-                    "releaseTrain": ext.get("releaseTrain"),
-                    "isSystemExtension": ext.get("isSystemExtension", False),
-                }
-            )
+        ext_summaries = [{k: ext.get(k, d) for k, d in _EXTENSION_FIELDS} for ext in extensions]
 
         return {
             "success": True,
@@ -101,6 +368,98 @@ async def get_cluster_extensions(cluster_name: str, resource_group: str) -> dict
         return {"success": False, "extensions": [], "error": str(e)}
 
 
+def _build_cluster_checks(
+    cluster: dict[str, Any], ext_result: dict[str, Any] | None
+) -> list[dict[str, Any]]:
+    """Build validation checks from cluster details and its extensions lookup."""
+    checks = []
+
+    # Check 1: Connectivity
+    connectivity = cluster.get("connectivityStatus", "Unknown")
+    checks.append(
+        {
+            "id": "aks.arc.connectivity",
+            "title": "Cluster Connectivity",
+            "status": "pass" if connectivity == "Connected" else "fail",
+            "severity": "high" if connectivity != "Connected" else "info",
+            "evidence": {
+                "connectivityStatus": connectivity,
+                "lastConnectivityTime": cluster.get("lastConnectivityTime"),
+            },
+            "hint": (
+                "Cluster is offline - check network connectivity and Arc agent"
+                if connectivity != "Connected"
+                else None
+            ),
+        }
+    )
+
+    # Check 2: Provisioning state
+    prov_state = cluster.get("provisioningState", "Unknown")
+    checks.append(
+        {
+            "id": "aks.arc.provisioning",
+            "title": "Provisioning State",
+            "status": "pass" if prov_state == "Succeeded" else "warn",
+            "severity": "medium" if prov_state != "Succeeded" else "info",
+            "evidence": {"provisioningState": prov_state},
+        }
+    )
+
+    # Check 3: Agent version
+    agent_version = cluster.get("agentVersion", "Unknown")
+    checks.append(
+        {
+            "id": "aks.arc.agent.version",
+            "title": "Arc Agent Version",
+            "status": "pass",  # Would need version comparison logic
+            "severity": "info",
+            "evidence": {
+                "agentVersion": agent_version,
+                "distribution": cluster.get("distribution"),
+                "kubernetesVersion": cluster.get("kubernetesVersion"),
+            },
+        }
+    )
+
+    # Extensions check
+    if ext_result and ext_result.get("success"):
+        ext_count = ext_result.get("count", 0)
+        ext_names = [e.get("extensionType") for e in ext_result.get("extensions", [])]
+
+        # Check for expected extensions
+        installed = set(ext_names)
+        missing = [e for e in _EXPECTED_EXTENSIONS if e not in installed]
+
+        checks.append(
+            {
+                "id": "aks.arc.extensions",
+                "title": "Arc Extensions",
+                "status": "pass" if not missing else "warn",
+                "severity": "medium" if missing else "info",
+                "evidence": {
+                    "installed": ext_names,
+                    "count": ext_count,
+                    "missing": missing if missing else None,
+                },
+                "hint": f"Consider installing: {', '.join(missing)}" if missing else None,
+            }
+        )
+
+    return checks
+
+
+def _summarize_checks(checks: list[dict[str, Any]]) -> dict[str, int]:
+    """Count checks by status."""
+    counts = Counter(c["status"] for c in checks)
+    return {
+        "total": len(checks),
+        "passed": counts["pass"],
+        "warnings": counts["warn"],
+        "failed": counts["fail"],
+    }
+
+
 @router.get("/cluster/{cluster_name}/validate")
 async def validate_cluster(cluster_name: str, resource_group: str) -> dict[str, Any]:
     """
@@ -117,8 +476,6 @@ async def validate_cluster(cluster_name: str, resource_group: str) -> dict[str,
     if not az_cmd:
         return {"success": False, "checks": [], "error": "Azure CLI not found"}
 
-    checks = []
-
     try:
         # Get cluster details
         cmd = [
@@ -131,104 +488,104 @@ async def validate_cluster(cluster_name: str, resource_group: str) -> dict[str,
             resource_group,
             "-o",
             "json",
+            "--only-show-errors",
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        # Cluster details and extensions are independent - fetch them concurrently
+        result, ext_result = await asyncio.gather(
+            _run_az(cmd, timeout=60),
+            get_cluster_extensions(cluster_name, resource_group),
+            return_exceptions=True,
+        )
+        if isinstance(result, BaseException):
+            raise result
 
         if result.returncode != 0:
-            return {"success": False, "checks": [], "error": f"Cluster not found: {result.stderr}"}
+            stderr = result.stderr.decode(errors="replace")
+            return {"success": False, "checks": [], "error": f"Cluster not found: {stderr}"}
 
-        cluster = json.loads(result.stdout)
+        cluster = _json_loads(result.stdout)
 
-        # Check 1: Connectivity
-        connectivity = cluster.get("connectivityStatus", "Unknown")
-        checks.append(
-            {
-                "id": "aks.arc.connectivity",
-                "title": "Cluster Connectivity",
-                "status": "pass" if connectivity == "Connected" else "fail",
-                "severity": "high" if connectivity != "Connected" else "info",
-                "evidence": {
-                    "connectivityStatus": connectivity,
-                    "lastConnectivityTime": cluster.get("lastConnectivityTime"),
-                },
-                "hint": (
-                    "Cluster is offline - check network connectivity and Arc agent"
-                    if connectivity != "Connected"
-                    else None
-                ),
-            }
-        )
+        # Extensions check - a failed lookup still leaves the core checks
+        if isinstance(ext_result, BaseException):
+            logger.warning("Extension lookup failed for %s: %s", cluster_name, ext_result)
+            ext_result = None
+        checks = _build_cluster_checks(cluster, ext_result)
 
-        # Check 2: Provisioning state
-        prov_state = cluster.get("provisioningState", "Unknown")
-        checks.append(
-            {
-                "id": "aks.arc.provisioning",
-                "title": "Provisioning State",
-                "status": "pass" if prov_state == "Succeeded" else "warn",
-                "severity": "medium" if prov_state != "Succeeded" else "info",
-                "evidence": {"provisioningState": prov_state},
-            }
-        )
+        return {
+            "success": True,
+            "cluster": cluster_name,
+            "resourceGroup": resource_group,
+            "checks": checks,
+            "summary": _summarize_checks(checks),
+        }
 
-        # Check 3: Agent version
-        agent_version = cluster.get("agentVersion", "Unknown")
-        checks.append(
-            {
-                "id": "aks.arc.agent.version",
-                "title": "Arc Agent Version",
-                "status": "pass",  # Would need version comparison logic
-                "severity": "info",
-                "evidence": {
-                    "agentVersion": agent_version,
-                    "distribution": cluster.get("distribution"),
-                    "kubernetesVersion": cluster.get("kubernetesVersion"),
-                },
-            }
-        )
+    except Exception as e:
+        logger.exception("Error validating cluster")
+        return {"success": False, "checks": [], "error": str(e)}
 
-        # Get extensions
-        ext_result = await get_cluster_extensions(cluster_name, resource_group)
-        if ext_result.get("success"):
-            ext_count = ext_result.get("count", 0)
-            ext_names = [e.get("extensionType") for e in ext_result.get("extensions", [])]
 
-            # Check for expected extensions
-            expected = ["microsoft.azuremonitor.containers", "microsoft.flux"]
-            missing = [e for e in expected if e not in ext_names]
+# Upper bound on concurrent az extension lookups for batch validation
+_BATCH_VALIDATE_CONCURRENCY = 8
 
-            checks.append(
-                {
-                    "id": "aks.arc.extensions",
-                    "title": "Arc Extensions",
-                    "status": "pass" if not missing else "warn",
-                    "severity": "medium" if missing else "info",
-                    "evidence": {
-                        "installed": ext_names,
-                        "count": ext_count,
-                        "missing": missing if missing else None,
-                    },
-                    "hint": f"Consider installing: {', '.join(missing)}" if missing else None,
-                }
-            )
 
+@router.post("/clusters/validate")
+async def validate_clusters(request: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validate several AKS Arc clusters in one call.
+
+    Cluster details come from a single (cached) ``az connectedk8s list``
+    instead of one ``show`` per cluster; extension lookups fan out with
+    bounded concurrency.
+
+    Body: ``{"clusters": [{"name": ..., "resourceGroup": ...}], "subscription": ...}``
+    """
+    targets = request.get("clusters") or []
+    if not targets:
+        return {"success": False, "results": [], "error": "No clusters provided"}
+
+    listing = await list_clusters(request.get("subscription"))
+    if not listing.get("success"):
+        return {
+            "success": False,
+            "results": [],
+            "error": listing.get("error"),
+            "hint": listing.get("hint"),
+        }
+
+    # Resource group and cluster names are case-insensitive in ARM
+    by_key = {
+        ((c.get("resourceGroup") or "").casefold(), (c.get("name") or "").casefold()): c
+        for c in listing.get("clusters", [])
+    }
+    semaphore = asyncio.Semaphore(_BATCH_VALIDATE_CONCURRENCY)
+
+    async def validate_one(target: dict[str, Any]) -> dict[str, Any]:
+        name = target.get("name", "")
+        resource_group = target.get("resourceGroup", "")
+        cluster = by_key.get((resource_group.casefold(), name.casefold()))
+        if cluster is None:
+            return {
+                "success": False,
+                "cluster": name,
+                "resourceGroup": resource_group,
+                "checks": [],
+                "error": "Cluster not found",
+            }
+
+        async with semaphore:
+            ext_result = await get_cluster_extensions(name, resource_group)
+        checks = _build_cluster_checks(cluster, ext_result)
         return {
             "success": True,
-            "cluster": cluster_name,
+            "cluster": name,
             "resourceGroup": resource_group,
             "checks": checks,
-            "summary": {
-                "total": len(checks),
-                "passed": len([c for c in checks if c["status"] == "pass"]),
-                "warnings": len([c for c in checks if c["status"] == "warn"]),
-                "failed": len([c for c in checks if c["status"] == "fail"]),
-            },
+            "summary": _summarize_checks(checks),
         }
 
-    except Exception as e:
-        logger.exception("Error validating cluster")
-        return {"success": False, "checks": [], "error": str(e)}
+    results = await asyncio.gather(*(validate_one(t) for t in targets))
+    return {"success": True, "count": len(results), "results": list(results)}
 
 
 @router.post("/diagnose")
@@ -266,13 +623,12 @@ async def comprehensive_diagnose(request: dict[str, Any] = None) -> dict[str, An
         if egress_file.exists():
             egress_file.unlink()
 
-        result = subprocess.run(
+        result = await _run_async(
             [sys.executable, "-m", "cli", "egress", "--dry-run", "--out", str(results_dir)],
-            capture_output=True,
-            text=True,
-            cwd=str(project_root),
             timeout=120,
+            cwd=str(project_root),
             env={**os.environ, "PYTHONUTF8": "1"},
+            text=True,
         )
 
         if egress_file.exists():
@@ -321,13 +677,12 @@ async def comprehensive_diagnose(request: dict[str, Any] = None) -> dict[str, An
         if validate_file.exists():
             validate_file.unlink()
 
-        result = subprocess.run(
+        result = await _run_async(
             [sys.executable, "-m", "cli", "validate", "--dry-run", "--out", str(results_dir)],
-            capture_output=True,
-            text=True,
-            cwd=str(project_root),
             timeout=120,
+            cwd=str(project_root),
             env={**os.environ, "PYTHONUTF8": "1"},
+            text=True,
         )
 
         if validate_file.exists():
@@ -435,38 +790,41 @@ def _generate_executive_summary(diagnosis: dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
-@router.get("/subscriptions")
-async def list_subscriptions() -> dict[str, Any]:
+@router.get("/subscriptions", response_model=None)
+async def list_subscriptions(
+    refresh: bool = False, *, request: Request, response: Response
+) -> dict[str, Any] | Response:
     """List available Azure subscriptions."""
+    result = await _AZ_CACHE.get_or_fetch(
+        ("subscriptions",), _SUBSCRIPTIONS_TTL, _fetch_subscriptions, refresh
+    )
+    if not result.get("success"):
+        return result
+    return _conditional(request, response, result, _SUBSCRIPTIONS_CACHE_CONTROL)
+
+
+async def _fetch_subscriptions() -> dict[str, Any]:
+    """Run ``az account list``."""
     az_cmd = _find_az_cli()
 
     if not az_cmd:
         return {"success": False, "subscriptions": [], "error": "Azure CLI not found"}
 
     try:
-        cmd = [az_cmd, "account", "list", "-o", "json"]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+        cmd = [az_cmd, "account", "list", "-o", "json", "--only-show-errors"]
+        result = await _run_az(cmd, timeout=30)
 
         if result.returncode != 0:
             return {
                 "success": False,
                 "subscriptions": [],
-                "error": result.stderr,
+                "error": result.stderr.decode(errors="replace"),
                 "hint": "Run 'az login' to authenticate",
             }
 
-        subs = json.loads(result.stdout)
+        subs = _json_loads(result.stdout)
 
-        sub_summaries = []
-        for s in subs:
-            sub_summaries.append(
-                {
-                    "id": s.get("id"),
-                    "name": s.get("name"),
-                    "isDefault": s.get("isDefault", False),
-                    "state": s.get("state"),
-                }
-            )
+        sub_summaries = [{k: sub.get(k, d) for k, d in _SUBSCRIPTION_FIELDS} for sub in subs]
 
         return {"success": True, "count": len(subs), "subscriptions": sub_summaries}
 
@@ -475,11 +833,22 @@ async def list_subscriptions() -> dict[str, Any]:
         return {"success": False, "subscriptions": [], "error": str(e)}
 
 
-@router.get("/status")
-async def azure_status() -> dict[str, Any]:
+@router.get("/status", response_model=None)
+async def azure_status(
+    refresh: bool = False, *, request: Request, response: Response
+) -> dict[str, Any] | Response:
     """Check Azure CLI status and authentication."""
-    auth_status = await AzureContext.check_auth()
-    return AzureContext.to_api_response(auth_status)
+
+    async def fetch() -> dict[str, Any]:
+        return AzureContext.to_api_response(await AzureContext.check_auth())
+
+    # Only a signed-in status is cached so a fresh 'az login' shows up immediately
+    result = await _AZ_CACHE.get_or_fetch(
+        ("status",), _STATUS_TTL, fetch, refresh, ok=lambda r: bool(r.get("authenticated"))
+    )
+    if not result.get("authenticated"):
+        return result
+    return _conditional(request, response, result, _STATUS_CACHE_CONTROL)
 
 
 @router.get("/tools/status")
@@ -510,11 +879,10 @@ async def tools_status() -> dict[str, Any]:
     # 2. Environment Checker - for connectivity checks
     envchecker_ready = False
     try:
-        result = subprocess.run(
+        result = await _run_async(
             ["powershell", "-Command", "Get-Module -ListAvailable AzStackHci.EnvironmentChecker"],
-            capture_output=True,
-            text=True,
             timeout=15,
+            text=True,
         )
         envchecker_ready = "AzStackHci.EnvironmentChecker" in result.stdout
     except Exception:
@@ -536,11 +904,10 @@ async def tools_status() -> dict[str, Any]:
     # 3. Support.AksArc - for known issues detection
     support_ready = False
     try:
-        result = subprocess.run(
+        result = await _run_async(
             ["powershell", "-Command", "Get-Module -ListAvailable Support.AksArc"],
-            capture_output=True,
-            text=True,
             timeout=15,
+            text=True,
         )
         support_ready = "Support.AksArc" in result.stdout
     except Exception:
@@ -558,11 +925,10 @@ async def tools_status() -> dict[str, Any]:
     # 4. AzLocalTSGTool - for TSG search
     tsg_ready = False
     try:
-        result = subprocess.run(
+        result = await _run_async(
             ["powershell", "-Command", "Get-Module -ListAvailable AzLocalTSGTool"],
-            capture_output=True,
-            text=True,
             timeout=15,
+            text=True,
         )
         tsg_ready = "AzLocalTSGTool" in result.stdout
     except Exception:
@@ -581,14 +947,11 @@ async def tools_status() -> dict[str, Any]:
     aksarc_ext_ready = False
     if az_cmd:
         try:
-            result = subprocess.run(
-                [az_cmd, "extension", "list", "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
+            result = await _run_az(
+                [az_cmd, "extension", "list", "-o", "json", "--only-show-errors"], timeout=30
             )
             if result.returncode == 0:
-                extensions = json.loads(result.stdout)
+                extensions = _json_loads(result.stdout)
                 aksarc_ext_ready = any(e.get("name") == "aksarc" for e in extensions)
         except Exception:
             pass
@@ -608,8 +971,8 @@ async def tools_status() -> dict[str, Any]:
     try:
         from foundry_local import FoundryLocalManager
 
-        manager = FoundryLocalManager("qwen2.5-0.5b")
-        loaded = manager.list_loaded_models()
+        manager = await asyncio.to_thread(FoundryLocalManager, "qwen2.5-0.5b")
+        loaded = await asyncio.to_thread(manager.list_loaded_models)
         foundry_ready = len(loaded) > 0
         foundry_models = [m.id for m in loaded] if loaded else []
     except ImportError:
@@ -678,6 +1041,22 @@ async def run_connectivity_check(
     return {"success": True, "findings": result}
 
 
+# Idle interval after which a comment line is sent to keep proxies from closing the stream
+_CONNECTIVITY_KEEPALIVE_S = 15.0
+
+# "event: <type>\ndata: " headers for the event types the connectivity check emits
+_EVENT_PREFIX = {
+    dtype: b"event: " + dtype.encode() + b"\ndata: "
+    for dtype in ("status", "progress", "complete", "error")
+}
+
+
+def _named_sse_event(dtype: str, data: dict[str, Any]) -> bytes:
+    """Format a named SSE event (``event:`` + ``data:`` lines)."""
+    prefix = _EVENT_PREFIX.get(dtype) or b"event: " + dtype.encode() + b"\ndata: "
+    return prefix + _json_dumps(data) + b"\n\n"
+
+
 @router.get("/connectivity/check/stream")
 async def run_connectivity_check_stream(
     mode: str = "quick",
@@ -700,60 +1079,60 @@ async def run_connectivity_check_stream(
     from server.tools.arc_connectivity_check import ArcConnectivityCheckTool
 
     async def event_generator():
-        # Queue for progress updates
+        # Progress reported by the check, consumed below as it arrives
         progress_queue: asyncio.Queue = asyncio.Queue()
-        findings_result = None
-        error_result = None
 
         async def progress_callback(data: dict):
-            await progress_queue.put(data)
+            progress_queue.put_nowait(data)
 
         async def run_check():
-            nonlocal findings_result, error_result
-            try:
-                tool = ArcConnectivityCheckTool()
-                findings_result = await tool.execute(
-                    {
-                        "mode": mode,
-                        "installChecker": install_checker,
-                        "dryRun": dry_run,
-                    },
-                    progress_callback=progress_callback,
-                )
-            except Exception as e:
-                error_result = str(e)
-            finally:
-                # Signal completion
-                await progress_queue.put(None)
+            tool = ArcConnectivityCheckTool()
+            return await tool.execute(
+                {
+                    "mode": mode,
+                    "installChecker": install_checker,
+                    "dryRun": dry_run,
+                },
+                progress_callback=progress_callback,
+            )
+
+        def format_event(data: dict) -> bytes:
+            return _named_sse_event(data.get("type", "progress"), data)
 
         # Start the check in background
         task = asyncio.create_task(run_check())
+        getter = asyncio.create_task(progress_queue.get())
 
-        # Stream progress updates
-        while True:
-            try:
-                data = await asyncio.wait_for(progress_queue.get(), timeout=120)
-
-                if data is None:
-                    # Check completed
-                    break
-
-                # Send SSE event
-                event_data = json.dumps(data)
-                yield f"event: {data.get('type', 'progress')}\ndata: {event_data}\n\n"
-
-            except asyncio.TimeoutError:
-                # Send keepalive
-                yield f": keepalive\n\n"
-
-        # Wait for task completion
-        await task
+        # Stream progress updates until the check finishes
+        try:
+            while not task.done():
+                done, _ = await asyncio.wait(
+                    {getter, task},
+                    timeout=_CONNECTIVITY_KEEPALIVE_S,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    yield b": keepalive\n\n"
+                elif getter in done:
+                    yield format_event(getter.result())
+                    getter = asyncio.create_task(progress_queue.get())
+        finally:
+            # No-ops once the check has finished; stops it if the client went away
+            task.cancel()
+            getter.cancel()
+
+        # Flush progress reported just before the check returned
+        if getter.done() and not getter.cancelled():
+            yield format_event(getter.result())
+        while not progress_queue.empty():
+            yield format_event(progress_queue.get_nowait())
 
         # Send final result
-        if error_result:
-            yield f"event: error\ndata: {json.dumps({'error': error_result})}\n\n"
-        elif findings_result:
-            yield f"event: complete\ndata: {json.dumps({'success': True, 'findings': findings_result})}\n\n"
+        error = task.exception()
+        if error is not None:
+            yield _named_sse_event("error", {"error": str(error)})
+        elif task.result():
+            yield _named_sse_event("complete", {"success": True, "findings": task.result()})
 
     return StreamingResponse(
         event_generator(),
@@ -766,6 +1145,33 @@ async def run_connectivity_check_stream(
     )
 
 
+def _version_key(name: str) -> tuple[int, ...]:
+    """Sort key for a module version directory name such as ``1.2.10``."""
+    return tuple(int(part) for part in re.findall(r"\d+", name))
+
+
+def _find_module_manifest(base_path: str, manifest_name: str) -> str | None:
+    """Locate a PowerShell module manifest without walking the whole tree.
+
+    Modules live at ``<base>/<version>/<name>.psd1`` (or directly under
+    ``<base>`` for unversioned installs), so only one directory level is
+    listed. The highest version wins.
+    """
+    try:
+        with os.scandir(base_path) as entries:
+            versions = [e.name for e in entries if e.is_dir()]
+    except OSError:
+        return None
+
+    for version in sorted(versions, key=_version_key, reverse=True):
+        manifest = os.path.join(base_path, version, manifest_name)
+        if os.path.isfile(manifest):
+            return manifest
+
+    manifest = os.path.join(base_path, manifest_name)
+    return manifest if os.path.isfile(manifest) else None
+
+
 @router.get("/connectivity/checker-status")
 async def checker_status() -> dict[str, Any]:
     """Check if Microsoft Environment Checker is installed."""
@@ -776,28 +1182,24 @@ async def checker_status() -> dict[str, Any]:
     ]
 
     for base_path in checker_paths:
-        path = Path(base_path)
-        if path.exists():
-            # Find the module manifest
-            manifests = list(path.glob("**/AzStackHci.EnvironmentChecker.psd1"))
-            if manifests:
-                return {
-                    "installed": True,
-                    "path": str(manifests[0]),
-                    "location": str(path),
-                }
+        manifest = _find_module_manifest(base_path, "AzStackHci.EnvironmentChecker.psd1")
+        if manifest:
+            return {
+                "installed": True,
+                "path": manifest,
+                "location": base_path,
+            }
 
     # Check via PowerShell
     try:
-        result = subprocess.run(
+        result = await _run_async(
             [
                 "powershell",
                 "-Command",
                 "Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object Name, Version, Path | ConvertTo-Json",
             ],
-            capture_output=True,
-            text=True,
             timeout=30,
+            text=True,
         )
 
         if result.returncode == 0 and result.stdout.strip():
@@ -830,6 +1232,13 @@ async def install_checker() -> dict[str, Any]:
             "Bypass",
             "-Command",
             """
+            $module = Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object -First 1 Name, Version, Path
+            if ($module) {
+                Write-Host "ALREADY_INSTALLED"
+                $module | ConvertTo-Json
+                exit 0
+            }
+
             Write-Host "Setting PSGallery as trusted..."
             Set-PSRepository -Name PSGallery -InstallationPolicy Trusted -ErrorAction SilentlyContinue
 
@@ -837,7 +1246,7 @@ async def install_checker() -> dict[str, Any]:
             Install-Module -Name AzStackHci.EnvironmentChecker -Force -AllowClobber -Scope CurrentUser
 
             Write-Host "Verifying installation..."
-            $module = Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object Name, Version, Path
+            $module = Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object -First 1 Name, Version, Path
             if ($module) {
                 Write-Host "SUCCESS: Module installed"
                 $module | ConvertTo-Json
@@ -848,12 +1257,7 @@ async def install_checker() -> dict[str, Any]:
             """,
         ]
 
-        result = subprocess.run(
-            install_cmd,
-            capture_output=True,
-            text=True,
-            timeout=300,
-        )
+        result = await _run_async(install_cmd, timeout=300, text=True)
 
         if result.returncode == 0:
             # Try to parse module info from output
@@ -869,10 +1273,16 @@ async def install_checker() -> dict[str, Any]:
                 if json_start is not None:
                     json_str = "\n".join(lines[json_start:])
                     module_info = json.loads(json_str)
+                    already_installed = lines[0].strip() == "ALREADY_INSTALLED"
                     return {
                         "success": True,
+                        "alreadyInstalled": already_installed,
                         "module": module_info,
-                        "message": "Environment Checker installed successfully",
+                        "message": (
+                            "Environment Checker already installed"
+                            if already_installed
+                            else "Environment Checker installed successfully"
+                        ),
                         "output": result.stdout,
                     }
             except json.JSONDecodeError:
@@ -905,60 +1315,86 @@ async def install_checker() -> dict[str, Any]:
         }
 
 
-@router.get("/connectivity/endpoints")
-async def list_endpoints(category: str | None = None) -> dict[str, Any]:
+@router.get("/connectivity/endpoints", response_model=None)
+async def list_endpoints(
+    category: str | None = None, *, request: Request, response: Response
+) -> dict[str, Any] | Response:
     """List configured endpoints for connectivity checking."""
-    import yaml
-
-    config_path = Path(__file__).parent / "config" / "endpoints.yaml"
-
-    if not config_path.exists():
+    if not _ENDPOINTS_PATH.exists():
         return {"success": False, "error": "Endpoints config not found"}
 
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
-        endpoints = config.get("endpoints", [])
+        config = _load_endpoints_config()
 
         if category:
-            endpoints = [e for e in endpoints if e.get("category") == category]
-
-        # Group by category
-        by_category: dict[str, list[dict[str, Any]]] = {}
-        for ep in endpoints:
-            cat = ep.get("category", "other")
-            if cat not in by_category:
-                by_category[cat] = []
-            by_category[cat].append(ep)
+            endpoints = config["by_category"].get(category, [])
+            by_category = {category: endpoints} if endpoints else {}
+        else:
+            endpoints = config["endpoints"]
+            by_category = config["by_category"]
 
-        return {
+        result = {
             "success": True,
             "total": len(endpoints),
             "categories": list(by_category.keys()),
             "byCategory": by_category,
             "endpoints": endpoints,
         }
+        return _conditional(request, response, result, _ENDPOINTS_CACHE_CONTROL)
 
     except Exception as e:
         logger.exception("Failed to load endpoints")
         return {"success": False, "error": str(e)}
 
 
+_ENDPOINTS_PATH = Path(__file__).parent / "config" / "endpoints.yaml"
+
+# Parsed endpoints.yaml, reloaded when the file's mtime changes
+_ENDPOINTS_CACHE: dict[str, Any] = {"mtime": None, "endpoints": [], "by_category": {}}
+
+
+def _load_endpoints_config() -> dict[str, Any]:
+    """Return the parsed endpoints config and its by-category index."""
+    import yaml
+
+    mtime = _ENDPOINTS_PATH.stat().st_mtime_ns
+    if mtime != _ENDPOINTS_CACHE["mtime"]:
+        # libyaml's C loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        with open(_ENDPOINTS_PATH, "r", encoding="utf-8") as f:
+            config = yaml.load(f, Loader=loader) or {}
+
+        endpoints = config.get("endpoints", [])
+        by_category: dict[str, list[dict[str, Any]]] = {}
+        for ep in endpoints:
+            by_category.setdefault(ep.get("category", "other"), []).append(ep)
+
+        _ENDPOINTS_CACHE.update(mtime=mtime, endpoints=endpoints, by_category=by_category)
+    return _ENDPOINTS_CACHE
+
+
 # ============================================================================
 # Chat API for web UI
 # ============================================================================
 
 
+@dataclass(slots=True)
 class ChatMessage:
     """Simple chat message structure."""
 
-    def __init__(self, role: str, content: str):
-        self.role = role
-        self.content = content
+    role: str
+    content: str
 
 
-import re
+@dataclass(slots=True)
+class ToolResult:
+    """Result of a single chat tool invocation."""
+
+    tool: str
+    result: dict[str, Any]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"tool": self.tool, "result": self.result}
 
 
 def _parse_tool_calls_from_content(content: str) -> list[dict[str, Any]]:
@@ -1004,14 +1440,42 @@ def _clean_tool_call_content(content: str) -> str:
     return cleaned
 
 
-def _summarize_tool_results(tool_results: list[dict[str, Any]]) -> str:
+_ALL_CHECKS_PASSED_MSG = (
+    "\n✅ All connectivity and validation checks passed. Your Azure connection is healthy."
+)
+
+
+_NEED_MORE_HELP_MSG = (
+    "\n\n---\n📞 **Need more help?** Contact Microsoft Support: https://support.microsoft.com/azure"
+)
+
+
+def _summarize_tool_results(tool_results: list[ToolResult]) -> str:
     """Generate a human-readable summary of tool results with TSG auto-linking."""
-    summaries = []
-    all_issues = []  # Collect issues across all tools for TSG suggestions
+    return "".join(_iter_summary_sections(tool_results))
+
+
+def _iter_summary_sections(tool_results: list[ToolResult]) -> Iterator[str]:
+    """Yield the tool results summary one section at a time.
+
+    Each tool produces one section, followed by the TSG suggestions. The
+    sections concatenate to the full summary, so callers can stream them.
+    """
+    summaries: list[str] = []
+    emitted = False
+    # Collect issues across all tools for TSG suggestions; only allocated once
+    # an issue is actually seen so the healthy path stays allocation-free
+    all_issues: list[dict[str, Any]] | None = None
 
     for tr in tool_results:
-        tool_name = tr.get("tool", "unknown")
-        result = tr.get("result", {})
+        # Hand off the previous tool's section before building this one
+        if summaries:
+            yield ("\n" if emitted else "") + "\n".join(summaries)
+            emitted = True
+            summaries.clear()
+
+        tool_name = tr.tool
+        result = tr.result
 
         # Handle TSG search results
         if tool_name == "search_tsg":
@@ -1055,9 +1519,18 @@ def _summarize_tool_results(tool_results: list[dict[str, Any]]) -> str:
         tool_display = _tool_display_name(tool_name)
         summaries.append(f"{status_icon} **{tool_display}**: {status} (out of {total} checks)")
 
+        # If all passed, give positive confirmation
+        healthy = pass_count > 0 and fail_count == 0 and warn_count == 0
+        if not checks:
+            if healthy:
+                summaries.append(_ALL_CHECKS_PASSED_MSG)
+            continue
+
         # List issues with enhanced details
         issues = [c for c in checks if c.get("status") in ("fail", "warn")]
         if issues:
+            if all_issues is None:
+                all_issues = []
             summaries.append("\n**Issues found:**")
             for issue in issues[:5]:  # Limit to top 5
                 icon = "❌" if issue.get("status") == "fail" else "⚠️"
@@ -1088,11 +1561,13 @@ def _summarize_tool_results(tool_results: list[dict[str, Any]]) -> str:
                     }
                 )
 
-        # If all passed, give positive confirmation
-        if pass_count > 0 and fail_count == 0 and warn_count == 0:
-            summaries.append(
-                "\n✅ All connectivity and validation checks passed. Your Azure connection is healthy."
-            )
+        if healthy:
+            summaries.append(_ALL_CHECKS_PASSED_MSG)
+
+    if summaries:
+        yield ("\n" if emitted else "") + "\n".join(summaries)
+        emitted = True
+        summaries.clear()
 
     # Auto-suggest TSG searches for found issues
     if all_issues:
@@ -1104,10 +1579,10 @@ def _summarize_tool_results(tool_results: list[dict[str, Any]]) -> str:
                 summaries.append(f'- Search TSG for: *"{suggestion}"*')
             summaries.append("\n💬 *Ask me to search any of these to find solutions!*")
 
-    if not summaries:
-        return "I ran the diagnostic tools but couldn't parse the results. Please check the detailed output below."
-
-    return "\n".join(summaries)
+    if summaries:
+        yield ("\n" if emitted else "") + "\n".join(summaries)
+    elif not emitted:
+        yield "I ran the diagnostic tools but couldn't parse the results. Please check the detailed output below."
 
 
 def _extract_key_evidence(evidence: dict[str, Any]) -> str:
@@ -1269,11 +1744,11 @@ async def _chat_with_foundry(messages: list[dict[str, str]]) -> dict[str, Any]:
     try:
         from foundry_local import FoundryLocalManager
 
-        manager = FoundryLocalManager("qwen2.5-0.5b")
+        manager = await asyncio.to_thread(FoundryLocalManager, "qwen2.5-0.5b")
         endpoint = manager.endpoint
 
         # Get loaded model
-        loaded = manager.list_loaded_models()
+        loaded = await asyncio.to_thread(manager.list_loaded_models)
         model_id = loaded[0].id if loaded else "qwen2.5-0.5b"
     except ImportError:
         raise RuntimeError("foundry-local-sdk not installed")
@@ -1396,15 +1871,9 @@ async def _chat_with_foundry(messages: list[dict[str, str]]) -> dict[str, Any]:
                 tool_results = []
                 for tc in msg["tool_calls"]:
                     tool_name = tc["function"]["name"]
-                    tool_args = json.loads(tc["function"].get("arguments", "{}"))
+                    tool_args = _json_loads(tc["function"].get("arguments") or "{}")
 
-                    tool_result = await _execute_chat_tool(tool_name, tool_args)
-                    tool_results.append(
-                        {
-                            "tool": tool_name,
-                            "result": tool_result,
-                        }
-                    )
+                    tool_results.append(await _execute_chat_tool(tool_name, tool_args))
 
                 # Generate human-readable summary
                 summary = _summarize_tool_results(tool_results)
@@ -1412,7 +1881,7 @@ async def _chat_with_foundry(messages: list[dict[str, str]]) -> dict[str, Any]:
                 return {
                     "success": True,
                     "content": summary,
-                    "tool_calls": tool_results,
+                    "tool_calls": [tr.to_dict() for tr in tool_results],
                     "requires_followup": True,
                 }
 
@@ -1422,12 +1891,8 @@ async def _chat_with_foundry(messages: list[dict[str, str]]) -> dict[str, Any]:
             if parsed_calls:
                 tool_results = []
                 for pc in parsed_calls:
-                    tool_result = await _execute_chat_tool(pc["name"], pc.get("arguments", {}))
                     tool_results.append(
-                        {
-                            "tool": pc["name"],
-                            "result": tool_result,
-                        }
+                        await _execute_chat_tool(pc["name"], pc.get("arguments", {}))
                     )
 
                 # Generate human-readable summary
@@ -1436,7 +1901,7 @@ async def _chat_with_foundry(messages: list[dict[str, str]]) -> dict[str, Any]:
                 return {
                     "success": True,
                     "content": summary,
-                    "tool_calls": tool_results,
+                    "tool_calls": [tr.to_dict() for tr in tool_results],
                     "requires_followup": True,
                 }
 
@@ -1482,6 +1947,158 @@ CHAT_TOOLS = [
 ]
 
 
+# Tool metadata indexed by id for O(1) lookup on the SSE hot path
+_CHAT_TOOLS_BY_ID = {t["id"]: t for t in CHAT_TOOLS}
+
+
+def _sse_event(data: dict[str, Any]) -> bytes:
+    """Format SSE event with proper newlines."""
+    return b"data: " + _json_dumps(data) + b"\n\n"
+
+
+# Frames whose content never changes are serialized once at import
+_FRAME_NO_MESSAGES = _sse_event({"type": "error", "error": "No messages provided"})
+_FRAME_ANALYZING = _sse_event(
+    {"type": "phase", "phase": "analyzing", "message": "Analyzing your request..."}
+)
+_FRAME_SCANNING = {t["id"]: _sse_event({"type": "scanning", "tool": t}) for t in CHAT_TOOLS}
+_FRAME_THINKING = _sse_event(
+    {"type": "phase", "phase": "thinking", "message": "AI selecting best diagnostic..."}
+)
+_FRAME_INVALID_RESPONSE = _sse_event({"type": "error", "error": "Invalid AI response"})
+_FRAME_SDK_MISSING = _sse_event({"type": "error", "error": "Foundry Local SDK not installed"})
+# Serialized tool metadata, embedded verbatim in selected/executing/tool_complete
+_TOOL_META_BYTES = {t["id"]: _json_dumps(t) for t in CHAT_TOOLS}
+
+
+def _tool_meta_bytes(tool_meta: dict[str, Any]) -> bytes:
+    """Serialize tool metadata once, using the cached copy for known tools."""
+    meta_bytes = _TOOL_META_BYTES.get(tool_meta["id"])
+    if meta_bytes is None:
+        meta_bytes = _json_dumps(tool_meta)
+    return meta_bytes
+
+
+def _sse_selected(tool_meta_bytes: bytes) -> bytes:
+    """Build the ``selected`` frame from serialized tool metadata."""
+    return b'data: {"type":"selected","tool":' + tool_meta_bytes + b"}\n\n"
+
+
+def _sse_executing(tool_meta_bytes: bytes, args: dict[str, Any]) -> bytes:
+    """Build the ``executing`` frame; only ``args`` is serialized per call."""
+    return (
+        b'data: {"type":"executing","tool":'
+        + tool_meta_bytes
+        + b',"args":'
+        + _json_dumps(args)
+        + b"}\n\n"
+    )
+
+
+def _sse_tool_complete(tool_meta_bytes: bytes, success: bool) -> bytes:
+    """Build the ``tool_complete`` frame without an intermediate dict."""
+    return (
+        b'data: {"type":"tool_complete","tool":'
+        + tool_meta_bytes
+        + b',"success":'
+        + (b"true" if success else b"false")
+        + b"}\n\n"
+    )
+
+
+class _SSEBatcher:
+    """Coalesce SSE frames emitted back-to-back into a single write.
+
+    Frames are buffered until ``flush`` is called or the buffer reaches
+    ``limit`` bytes. Callers flush before every long await so no frame is
+    held back while the stream is idle.
+    """
+
+    __slots__ = ("_buf", "_limit")
+
+    def __init__(self, limit: int = 4096) -> None:
+        self._buf = bytearray()
+        self._limit = limit
+
+    def add(self, frame: bytes) -> bytes | None:
+        """Buffer a frame, returning the batch if the size limit was reached."""
+        self._buf += frame
+        if len(self._buf) >= self._limit:
+            return self.flush()
+        return None
+
+    def flush(self) -> bytes:
+        """Return and clear the buffered frames."""
+        out = bytes(self._buf)
+        self._buf.clear()
+        return out
+
+
+# A client that can't take a frame for this long is treated as gone
+_SSE_SEND_TIMEOUT = 10.0
+_SSE_QUEUE_SIZE = 64
+
+
+async def _bounded_sse(
+    frames: AsyncGenerator[bytes, None],
+    maxsize: int = _SSE_QUEUE_SIZE,
+    put_timeout: float = _SSE_SEND_TIMEOUT,
+) -> AsyncGenerator[bytes, None]:
+    """Relay SSE frames through a bounded queue with a stalled-client timeout.
+
+    At most ``maxsize`` frames are buffered per connection. If the client
+    stops reading for ``put_timeout`` seconds, the source generator is closed
+    so it can cancel in-flight work instead of holding results in memory.
+    """
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize)
+
+    async def pump() -> None:
+        try:
+            async for frame in frames:
+                await asyncio.wait_for(queue.put(frame), put_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("SSE client stalled for %ss, closing stream", put_timeout)
+        except Exception:
+            logger.exception("SSE producer failed")
+        finally:
+            await frames.aclose()
+            # Never block on the end marker: the client may be gone and the queue
+            # full. The reader also stops once the pump is done and the queue drained.
+            with contextlib.suppress(asyncio.QueueFull):
+                queue.put_nowait(None)
+
+    pump_task = asyncio.create_task(pump())
+    try:
+        while not (queue.empty() and pump_task.done()):
+            if (frame := await queue.get()) is None:
+                break
+            yield frame
+    finally:
+        pump_task.cancel()
+
+
+async def _stream_summary(tool_results: list[ToolResult]) -> AsyncGenerator[bytes, None]:
+    """Stream the summary as ``content_delta`` frames, then a terminal ``complete``.
+
+    The ``complete`` frame carries the tool calls but no content; clients
+    build the message from the deltas.
+    """
+    no_results = False
+    for section in _iter_summary_sections(tool_results):
+        no_results = no_results or "no results" in section.lower()
+        yield _sse_event({"type": "content_delta", "text": section})
+    if no_results:
+        yield _sse_event({"type": "content_delta", "text": _NEED_MORE_HELP_MSG})
+
+    yield _sse_event(
+        {
+            "type": "complete",
+            "success": True,
+            "tool_calls": [tr.to_dict() for tr in tool_results],
+        }
+    )
+
+
 @router.post("/chat/stream")
 async def chat_stream(request: Request) -> StreamingResponse:
     """
@@ -1496,13 +2113,9 @@ async def chat_stream(request: Request) -> StreamingResponse:
     body = await request.json()
     messages = body.get("messages", [])
 
-    def sse_event(data: dict) -> str:
-        """Format SSE event with proper newlines."""
-        return f"data: {json.dumps(data)}\n\n"
-
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         if not messages:
-            yield sse_event({"type": "error", "error": "No messages provided"})
+            yield _FRAME_NO_MESSAGES
             return
 
         # Get user's last message for keyword hints
@@ -1511,29 +2124,25 @@ async def chat_stream(request: Request) -> StreamingResponse:
         ).lower()
 
         # Phase 1: Scanning tools animation
-        yield sse_event(
-            {"type": "phase", "phase": "analyzing", "message": "Analyzing your request..."}
-        )
+        yield _FRAME_ANALYZING
         await asyncio.sleep(0.2)
 
         # Show scanning animation
         for tool in CHAT_TOOLS:
-            yield sse_event({"type": "scanning", "tool": tool})
+            yield _FRAME_SCANNING[tool["id"]]
             await asyncio.sleep(0.1)
 
         # Phase 2: Use LLM with MCP tools
-        yield sse_event(
-            {"type": "phase", "phase": "thinking", "message": "AI selecting best diagnostic..."}
-        )
+        yield _FRAME_THINKING
 
         try:
             import httpx
             from foundry_local import FoundryLocalManager
 
             # Get Foundry endpoint and currently loaded model
-            manager = FoundryLocalManager("qwen2.5-0.5b")  # Just to get endpoint
+            manager = await asyncio.to_thread(FoundryLocalManager, "qwen2.5-0.5b")
             endpoint = manager.endpoint
-            loaded = manager.list_loaded_models()
+            loaded = await asyncio.to_thread(manager.list_loaded_models)
             model_id = loaded[0].id if loaded else "qwen2.5-0.5b"
             logger.info(f"Chat using model: {model_id}")
 
@@ -1649,39 +2258,23 @@ async def chat_stream(request: Request) -> StreamingResponse:
 
             if forced_tool:
                 # Skip LLM - we know what tool to use based on keywords
-                tool_meta = next((t for t in CHAT_TOOLS if t["id"] == forced_tool), CHAT_TOOLS[0])
-                yield sse_event({"type": "selected", "tool": tool_meta})
-                await asyncio.sleep(0.2)
-                yield sse_event({"type": "executing", "tool": tool_meta, "args": forced_args})
+                tool_meta = _CHAT_TOOLS_BY_ID.get(forced_tool, CHAT_TOOLS[0])
+                meta_bytes = _tool_meta_bytes(tool_meta)
+                # selected + executing go out as one write
+                yield _sse_selected(meta_bytes) + _sse_executing(meta_bytes, forced_args)
 
                 # Execute via MCP
                 logger.info(
                     f"Executing MCP tool {forced_tool} (keyword-forced) with args: {forced_args}"
                 )
                 tool_result = await _execute_chat_tool(forced_tool, forced_args)
-                tool_results = [{"tool": forced_tool, "result": tool_result}]
-
-                yield sse_event(
-                    {
-                        "type": "tool_complete",
-                        "tool": tool_meta,
-                        "success": "error" not in tool_result,
-                    }
-                )
+                tool_results = [tool_result]
 
-                # Generate summary
-                summary = _summarize_tool_results(tool_results)
-                if "no results" in summary.lower():
-                    summary += "\n\n---\n📞 **Need more help?** Contact Microsoft Support: https://support.microsoft.com/azure"
+                yield _sse_tool_complete(meta_bytes, "error" not in tool_result.result)
 
-                yield sse_event(
-                    {
-                        "type": "complete",
-                        "success": True,
-                        "content": summary,
-                        "tool_calls": tool_results,
-                    }
-                )
+                # Stream summary
+                async for frame in _stream_summary(tool_results):
+                    yield frame
                 return  # Exit generator
 
             # No forced tool - let LLM decide with tool_choice="auto"
@@ -1701,11 +2294,11 @@ async def chat_stream(request: Request) -> StreamingResponse:
                 result = resp.json()
 
                 if "error" in result:
-                    yield sse_event({"type": "error", "error": result["error"]})
+                    yield _sse_event({"type": "error", "error": result["error"]})
                     return
 
                 if "choices" not in result or not result["choices"]:
-                    yield sse_event({"type": "error", "error": "Invalid AI response"})
+                    yield _FRAME_INVALID_RESPONSE
                     return
 
                 msg = result["choices"][0]["message"]
@@ -1717,61 +2310,71 @@ async def chat_stream(request: Request) -> StreamingResponse:
                 all_calls = tool_calls or parsed_calls
 
                 if all_calls:
-                    tool_results = []
+                    # Launch every tool up front so independent calls overlap;
+                    # total latency is bounded by the slowest tool, not the sum
+                    tasks: dict[asyncio.Task[ToolResult], bytes] = {}
+                    batch = _SSEBatcher()
 
                     for tc in all_calls:
                         if isinstance(tc, dict) and "function" in tc:
                             tool_name = tc["function"]["name"]
-                            tool_args = json.loads(tc["function"].get("arguments", "{}"))
+                            tool_args = _json_loads(tc["function"].get("arguments") or "{}")
                         else:
                             tool_name = tc.get("name", "")
                             tool_args = tc.get("arguments", {})
 
                         # Find tool metadata
-                        tool_meta = next(
-                            (t for t in CHAT_TOOLS if t["id"] == tool_name),
-                            {"id": tool_name, "name": tool_name, "icon": "🔧"},
-                        )
+                        tool_meta = _CHAT_TOOLS_BY_ID.get(tool_name) or {
+                            "id": tool_name,
+                            "name": tool_name,
+                            "icon": "🔧",
+                        }
 
-                        # Send selected event
-                        yield sse_event({"type": "selected", "tool": tool_meta})
-                        await asyncio.sleep(0.2)
+                        meta_bytes = _tool_meta_bytes(tool_meta)
 
-                        # Send executing event
-                        yield sse_event({"type": "executing", "tool": tool_meta, "args": tool_args})
+                        # Queue selected + executing events
+                        if chunk := batch.add(_sse_selected(meta_bytes)):
+                            yield chunk
+                        if chunk := batch.add(_sse_executing(meta_bytes, tool_args)):
+                            yield chunk
 
                         # Execute via MCP registry
                         logger.info(
                             f"Executing MCP tool {tool_name} with LLM-generated args: {tool_args}"
                         )
-                        tool_result = await _execute_chat_tool(tool_name, tool_args)
-                        tool_results.append({"tool": tool_name, "result": tool_result})
-
-                        # Send complete event
-                        yield sse_event(
-                            {
-                                "type": "tool_complete",
-                                "tool": tool_meta,
-                                "success": "error" not in tool_result,
-                            }
-                        )
-
-                    # Generate summary
-                    summary = _summarize_tool_results(tool_results)
-                    if "no results" in summary.lower():
-                        summary += "\n\n---\n📞 **Need more help?** Contact Microsoft Support: https://support.microsoft.com/azure"
-
-                    yield sse_event(
-                        {
-                            "type": "complete",
-                            "success": True,
-                            "content": summary,
-                            "tool_calls": tool_results,
-                        }
-                    )
+                        task = asyncio.create_task(_execute_chat_tool(tool_name, tool_args))
+                        tasks[task] = meta_bytes
+
+                    # Flush before waiting on tools, then send complete events
+                    # in completion order
+                    try:
+                        yield batch.flush()
+                        pending: set[asyncio.Task[ToolResult]] = set(tasks)
+                        while pending:
+                            done, pending = await asyncio.wait(
+                                pending, return_when=asyncio.FIRST_COMPLETED
+                            )
+                            for task in done:
+                                batch.add(
+                                    _sse_tool_complete(
+                                        tasks[task], "error" not in task.result().result
+                                    )
+                                )
+                            yield batch.flush()
+                    finally:
+                        # Client went away mid-stream - don't leave tools running
+                        for task in tasks:
+                            task.cancel()
+
+                    # Keep results in the order the LLM requested them
+                    tool_results = [task.result() for task in tasks]
+
+                    # Stream summary
+                    async for frame in _stream_summary(tool_results):
+                        yield frame
                 else:
                     # No tool calls - shouldn't happen with tool_choice="required"
-                    yield sse_event(
+                    yield _sse_event(
                         {
                             "type": "complete",
                             "success": True,
@@ -1782,13 +2385,13 @@ async def chat_stream(request: Request) -> StreamingResponse:
                     )
 
         except ImportError:
-            yield sse_event({"type": "error", "error": "Foundry Local SDK not installed"})
+            yield _FRAME_SDK_MISSING
         except Exception as e:
             logger.exception("Streaming chat error")
-            yield sse_event({"type": "error", "error": str(e)})
+            yield _sse_event({"type": "error", "error": str(e)})
 
     return StreamingResponse(
-        event_generator(),
+        _bounded_sse(event_generator()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -1798,74 +2401,108 @@ async def chat_stream(request: Request) -> StreamingResponse:
     )
 
 
-async def _execute_chat_tool(tool_name: str, args: dict[str, Any]) -> dict[str, Any]:
+# Map chat tool names to MCP tool names
+_CHAT_TOOL_MCP_NAMES = {
+    "run_connectivity_check": "arc.connectivity.check",
+    "check_environment": "arc.connectivity.check",  # Same tool, different mode
+    "validate_cluster": "aks.arc.validate",
+    "search_tsg": "azlocal.tsg.search",  # TSG search via MCP
+}
+
+# Build MCP tool arguments from chat tool arguments
+_ARG_BUILDERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "run_connectivity_check": lambda a: {"mode": a.get("mode", "quick")},
+    "check_environment": lambda a: {"mode": a.get("mode", "quick")},
+    "validate_cluster": lambda a: {"checks": a.get("checks", ["all"])},
+    "search_tsg": lambda a: {"query": a.get("query", "")},
+}
+
+
+# Resolved on first use - server.main imports this module, so it can't be a top-level import
+_TOOL_REGISTRY: dict[str, Any] | None = None
+
+
+def _registry() -> dict[str, Any]:
+    """Return the MCP tool registry from server.main."""
+    global _TOOL_REGISTRY
+    if _TOOL_REGISTRY is None:
+        from server.main import TOOL_REGISTRY
+
+        _TOOL_REGISTRY = TOOL_REGISTRY
+    return _TOOL_REGISTRY
+
+
+async def _execute_chat_tool(tool_name: str, args: dict[str, Any]) -> ToolResult:
     """Execute a tool from chat context via MCP.
 
     Maps chat tool names to MCP tool names and calls them via the MCP registry.
     """
-    from server.main import TOOL_REGISTRY
-
-    # Map chat tool names to MCP tool names
-    tool_mapping = {
-        "run_connectivity_check": "arc.connectivity.check",
-        "check_environment": "arc.connectivity.check",  # Same tool, different mode
-        "validate_cluster": "aks.arc.validate",
-        "search_tsg": "azlocal.tsg.search",  # TSG search via MCP
-    }
+    registry = _registry()
 
     # Get MCP tool name
-    mcp_tool_name = tool_mapping.get(tool_name)
+    mcp_tool_name = _CHAT_TOOL_MCP_NAMES.get(tool_name)
     if not mcp_tool_name:
-        return {"error": f"Unknown tool: {tool_name}"}
+        return ToolResult(tool_name, {"error": f"Unknown tool: {tool_name}"})
 
     # Check if tool exists in registry
-    if mcp_tool_name not in TOOL_REGISTRY:
-        return {"error": f"MCP tool not registered: {mcp_tool_name}"}
-
-    # Build MCP tool arguments
-    mcp_args: dict[str, Any] = {"dryRun": False}  # Default to real execution
-
-    if tool_name == "run_connectivity_check":
-        mcp_args["mode"] = args.get("mode", "quick")
-    elif tool_name == "check_environment":
-        # Environment check maps to connectivity with full mode
-        mcp_args["mode"] = args.get("mode", "quick")
-    elif tool_name == "validate_cluster":
-        mcp_args["checks"] = args.get("checks", ["all"])
-    elif tool_name == "search_tsg":
-        # TSG search needs query parameter
-        mcp_args["query"] = args.get("query", "")
-        if not mcp_args["query"]:
-            return {"error": "No search query provided"}
-        # Use dry_run from args, default to False for real execution
+    if mcp_tool_name not in registry:
+        return ToolResult(tool_name, {"error": f"MCP tool not registered: {mcp_tool_name}"})
+
+    # Default to real execution
+    mcp_args: dict[str, Any] = {"dryRun": False, **_ARG_BUILDERS[tool_name](args)}
+    if tool_name == "search_tsg" and not mcp_args["query"]:
+        return ToolResult(tool_name, {"error": "No search query provided"})
 
     # Execute via MCP tool registry
     try:
-        tool = TOOL_REGISTRY[mcp_tool_name]
+        tool = registry[mcp_tool_name]
         logger.info("Executing MCP tool %s with args %s", mcp_tool_name, mcp_args)
         result = await tool.execute(mcp_args)
         logger.info("MCP tool %s completed successfully", mcp_tool_name)
-        return result
+        return ToolResult(tool_name, result)
     except Exception as e:
         logger.error("MCP tool %s failed: %s", mcp_tool_name, e)
-        return {"error": str(e)}
+        return ToolResult(tool_name, {"error": str(e)})
+
+
+# Shared manager for status polling; constructing one does endpoint discovery
+_FOUNDRY_MANAGER: Any = None
+_FOUNDRY_MANAGER_LOCK = asyncio.Lock()
+_CHAT_STATUS_TTL = 1.0
+# (monotonic timestamp, endpoint, loaded model ids)
+_chat_status_snapshot: tuple[float, str, list[str]] | None = None
+
+
+async def _get_status_manager() -> Any:
+    """Return the shared FoundryLocalManager, creating it on first use."""
+    global _FOUNDRY_MANAGER
+    if _FOUNDRY_MANAGER is None:
+        async with _FOUNDRY_MANAGER_LOCK:
+            if _FOUNDRY_MANAGER is None:
+                from foundry_local import FoundryLocalManager
+
+                # FoundryLocalManager auto-discovers the running Foundry service endpoint
+                # Pass any model alias - it will find the running service
+                _FOUNDRY_MANAGER = await asyncio.to_thread(FoundryLocalManager, "qwen2.5-0.5b")
+    return _FOUNDRY_MANAGER
 
 
 @router.get("/chat/status")
 async def chat_status() -> dict[str, Any]:
     """Check if chat (Foundry Local) is available."""
+    global _FOUNDRY_MANAGER, _chat_status_snapshot
     try:
-        from foundry_local import FoundryLocalManager
-
-        # FoundryLocalManager auto-discovers the running Foundry service endpoint
-        # Pass any model alias - it will find the running service
-        manager = FoundryLocalManager("qwen2.5-0.5b")
-        endpoint = manager.endpoint
+        snapshot = _chat_status_snapshot
+        if snapshot is None or time.monotonic() - snapshot[0] >= _CHAT_STATUS_TTL:
+            manager = await _get_status_manager()
+            endpoint = manager.endpoint
 
-        # Get currently loaded models
-        loaded = manager.list_loaded_models()
-        models = [m.id for m in loaded] if loaded else []
+            # Get currently loaded models
+            loaded = await asyncio.to_thread(manager.list_loaded_models)
+            models = [m.id for m in loaded] if loaded else []
+            snapshot = _chat_status_snapshot = (time.monotonic(), endpoint, models)
 
+        _, endpoint, models = snapshot
         return {
             "available": len(models) > 0,
             "endpoint": endpoint,
@@ -1880,6 +2517,9 @@ async def chat_status() -> dict[str, Any]:
         }
 
     except Exception as e:
+        # The service may have restarted on a new port; rediscover next time
+        _FOUNDRY_MANAGER = None
+        _chat_status_snapshot = None
         logger.exception("Foundry check failed")
         return {
             "available": False,
@@ -1889,17 +2529,51 @@ async def chat_status() -> dict[str, Any]:
 
 
 # Models that support tool calling (required for chat)
-TOOL_CAPABLE_MODELS = {
-    "qwen2.5-0.5b",
-    "phi-4-mini",
-    "qwen2.5-7b",
-    "qwen2.5-14b",
-    "qwen2.5-coder-0.5b",
-    "qwen2.5-coder-1.5b",
-    "qwen2.5-coder-7b",
-    "qwen2.5-coder-14b",
-    "phi-4-mini",
-}
+TOOL_CAPABLE_MODELS = frozenset(
+    {
+        "qwen2.5-0.5b",
+        "phi-4-mini",
+        "qwen2.5-7b",
+        "qwen2.5-14b",
+        "qwen2.5-coder-0.5b",
+        "qwen2.5-coder-1.5b",
+        "qwen2.5-coder-7b",
+        "qwen2.5-coder-14b",
+    }
+)
+
+# Models we steer users towards - larger models are better at tool selection
+_RECOMMENDED_MODELS = frozenset({"qwen2.5-1.5b", "phi-4-mini", "qwen2.5-7b"})
+
+
+# TTLs for Foundry SDK enumeration. The catalog is effectively static, while the
+# loaded/cached lists back "is my model ready" polling and must stay fresh.
+_CATALOG_TTL = 30.0
+_LOADED_TTL = 2.0
+
+# key -> (monotonic timestamp, value)
+_FOUNDRY_CACHE: dict[str, tuple[float, list[Any]]] = {}
+
+
+def _foundry_cache_get(key: str, ttl: float) -> list[Any] | None:
+    """Return a cached Foundry SDK listing if it is younger than ``ttl`` seconds."""
+    entry = _FOUNDRY_CACHE.get(key)
+    if entry and time.monotonic() - entry[0] < ttl:
+        return entry[1]
+    return None
+
+
+def _foundry_cache_put(key: str, value: list[Any]) -> list[Any]:
+    """Store a Foundry SDK listing and return it."""
+    _FOUNDRY_CACHE[key] = (time.monotonic(), value)
+    return value
+
+
+def _invalidate_loaded_models() -> None:
+    """Drop cached loaded-model state after starting or stopping a model."""
+    global _chat_status_snapshot
+    _FOUNDRY_CACHE.pop("loaded", None)
+    _chat_status_snapshot = None
 
 
 def _get_foundry_models() -> dict[str, Any]:
@@ -1907,57 +2581,64 @@ def _get_foundry_models() -> dict[str, Any]:
     try:
         from foundry_local import FoundryLocalManager
 
-        # Use 1.5b as default - better at tool selection
-        manager = FoundryLocalManager("qwen2.5-0.5b")
+        catalog = _foundry_cache_get("catalog", _CATALOG_TTL)
+        cached = _foundry_cache_get("cached", _LOADED_TTL)
+        loaded = _foundry_cache_get("loaded", _LOADED_TTL)
 
-        # Get all models from catalog
-        try:
-            catalog = list(manager.list_catalog_models())
-        except Exception:
-            catalog = []
+        # Only pay for endpoint discovery when something actually needs refreshing
+        if catalog is None or cached is None or loaded is None:
+            # Use 1.5b as default - better at tool selection
+            manager = FoundryLocalManager("qwen2.5-0.5b")
+
+        # Get all models from catalog, grouped by alias (unique model name) as the
+        # SDK yields them so we never hold every backend/quantization variant
+        if catalog is None:
+            try:
+                seen_aliases: set[str] = set()
+                unique: list[Any] = []
+                for m in manager.list_catalog_models():
+                    if m.alias in seen_aliases:
+                        continue
+                    seen_aliases.add(m.alias)
+                    unique.append(m)
+                catalog = _foundry_cache_put("catalog", unique)
+            except Exception:
+                catalog = []
 
         # Get cached (downloaded) models
-        try:
-            cached = list(manager.list_cached_models())
-            cached_aliases = {m.alias for m in cached}
-        except Exception:
-            cached = []
-            cached_aliases = set()
+        if cached is None:
+            try:
+                cached = _foundry_cache_put("cached", list(manager.list_cached_models()))
+            except Exception:
+                cached = []
+        cached_aliases = {m.alias for m in cached}
 
         # Get currently loaded/running models
-        try:
-            loaded = manager.list_loaded_models()
-            loaded_aliases = {m.alias for m in loaded} if loaded else set()
-        except Exception:
-            loaded = []
-            loaded_aliases = set()
+        if loaded is None:
+            try:
+                loaded = _foundry_cache_put("loaded", list(manager.list_loaded_models() or []))
+            except Exception:
+                loaded = []
+        loaded_aliases = {m.alias for m in loaded}
 
-        # Group by alias (unique model name)
-        seen_aliases = set()
         models = []
 
         for m in catalog:
-            if m.alias in seen_aliases:
-                continue
-            seen_aliases.add(m.alias)
-
-            # Determine recommended models - prefer larger models for better tool selection
-            is_recommended = m.alias in ["qwen2.5-1.5b", "phi-4-mini", "qwen2.5-7b"]
-            supports_tools = m.alias in TOOL_CAPABLE_MODELS
+            alias = m.alias
 
             models.append(
                 {
-                    "id": m.alias,
+                    "id": alias,
                     "modelId": m.id,
-                    "name": m.alias.replace("-", " ").title(),
+                    "name": alias.replace("-", " ").title(),
                     "size": f"{m.file_size} MB" if m.file_size else "Unknown",
                     "sizeBytes": m.file_size * 1024 * 1024 if m.file_size else 0,
                     "license": m.license if hasattr(m, "license") else "Unknown",
                     "device": m.device_type if hasattr(m, "device_type") else "Unknown",
-                    "downloaded": m.alias in cached_aliases,
-                    "loaded": m.alias in loaded_aliases,
-                    "recommended": is_recommended,
-                    "supportsTools": supports_tools,
+                    "downloaded": alias in cached_aliases,
+                    "loaded": alias in loaded_aliases,
+                    "recommended": alias in _RECOMMENDED_MODELS,
+                    "supportsTools": alias in TOOL_CAPABLE_MODELS,
                 }
             )
 
@@ -1988,34 +2669,30 @@ def _get_foundry_models() -> dict[str, Any]:
         return _get_foundry_models_from_cli(str(e))
 
 
+# Matches the alias column of `foundry cache list` in a single pass over stdout:
+# an optional disk-emoji marker, then the first token that looks like a model name.
+_CACHE_LIST_ALIAS_RE = re.compile(
+    rb"^[ \t]*(?:[^\w\s]+[ \t]+)?([\w.\-]*(?:qwen|phi|llama|mistral|deepseek)[\w.\-]*)",
+    re.MULTILINE,
+)
+
+
 def _get_foundry_models_from_cli(sdk_error: str) -> dict[str, Any]:
     """Fallback: parse foundry CLI output for model list."""
     try:
         # Get cached models
+        # Raw bytes - the alias column is ASCII so there's nothing to decode up front
         cache_result = subprocess.run(
             ["foundry", "cache", "list"],
             capture_output=True,
-            text=True,
             timeout=10,
-            encoding="utf-8",
         )
 
         downloaded = set()
         if cache_result.returncode == 0:
-            for line in cache_result.stdout.split("\n"):
-                # Look for lines that start with the disk emoji (various encodings)
-                # or have model-like patterns
-                line = line.strip()
-                if not line or line.startswith("Models cached") or line.startswith("Alias"):
-                    continue
-                # Split on whitespace and look for model alias patterns
-                parts = line.split()
-                if len(parts) >= 2:
-                    # Skip the emoji (first part), second part is the alias
-                    alias = parts[1] if len(parts[0]) <= 4 else parts[0]  # Emoji or alias
-                    # Validate it looks like a model name
-                    if any(m in alias for m in ["qwen", "phi", "llama", "mistral", "deepseek"]):
-                        downloaded.add(alias)
+            downloaded = {
+                m.group(1).decode() for m in _CACHE_LIST_ALIAS_RE.finditer(cache_result.stdout)
+            }
 
         # Basic model list for when SDK fails
         basic_models = [
@@ -2092,10 +2769,83 @@ def _get_foundry_models_from_cli(sdk_error: str) -> dict[str, Any]:
         }
 
 
+# Backoff schedules for Foundry readiness polling - a warm service answers on the
+# first probe instead of paying a fixed multi-second sleep
+_READY_POLL_DELAYS = (0.2, 0.4, 0.8, 1.6, 3.2)
+_STOP_POLL_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)
+
+
+async def _poll_until(
+    check: Callable[[], bool | Awaitable[bool]],
+    delays: tuple[float, ...] = _READY_POLL_DELAYS,
+    expected: bool = True,
+) -> bool:
+    """Poll ``check`` with exponential backoff until it returns ``expected``.
+
+    ``check`` may be a plain or async callable. Returns False if the schedule is
+    exhausted without a match.
+    """
+    for delay in delays:
+        await asyncio.sleep(delay)
+        try:
+            result = check()
+            if inspect.isawaitable(result):
+                result = await result
+            if bool(result) is expected:
+                return True
+        except Exception as e:
+            logger.debug("Readiness probe failed: %s", e)
+    return False
+
+
+# Checked before the positive phrases - "service is not running" contains "running"
+_FOUNDRY_NOT_RUNNING = ("not running", "not started", "stopped")
+
+
+async def _foundry_service_running() -> bool:
+    """Check whether the Foundry Local service reports itself as running."""
+    status_result = await _run_async(["foundry", "service", "status"], timeout=5)
+    status = status_result.stdout.decode(errors="replace").lower()
+    if status_result.returncode != 0 or any(s in status for s in _FOUNDRY_NOT_RUNNING):
+        return False
+    return "running" in status or "started" in status
+
+
+def _is_model_loaded(model_id: str, loaded: list[Any] | None) -> bool:
+    """Check whether ``model_id`` (alias or full id prefix) is in a loaded-model listing."""
+    loaded_ids = {m.alias for m in loaded or ()} | {m.id for m in loaded or ()}
+    return model_id in loaded_ids or any(mid.startswith(model_id) for mid in loaded_ids)
+
+
+def _spawn_foundry_model_run(model_id: str) -> None:
+    """Launch ``foundry model run`` detached from the server process.
+
+    Arguments are passed as a list so ``model_id`` never reaches a shell.
+    """
+    if sys.platform == "win32":
+        # Windows: spawn directly, no cmd.exe/START hop and no console window
+        subprocess.Popen(
+            ["foundry", "model", "run", model_id],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            creationflags=subprocess.CREATE_NO_WINDOW | subprocess.DETACHED_PROCESS,
+        )
+    else:
+        # Unix: use nohup
+        subprocess.Popen(
+            ["nohup", "foundry", "model", "run", model_id],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
 @router.get("/foundry/models")
 async def list_available_models() -> dict[str, Any]:
     """List all available models from Foundry Local catalog."""
-    return _get_foundry_models()
+    # SDK enumeration and the CLI fallback both block - keep them off the event loop
+    return await asyncio.to_thread(_get_foundry_models)
 
 
 @router.post("/foundry/start/stream")
@@ -2104,12 +2854,12 @@ async def start_foundry_model_stream(request: Request) -> StreamingResponse:
     body = await request.json()
     model_id = body.get("model_id", "qwen2.5-0.5b")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
+    async def event_generator() -> AsyncGenerator[bytes, None]:
         import subprocess
         import asyncio
 
         try:
-            yield f"data: {json.dumps({'type': 'info', 'message': f'Starting {model_id}...'})}\n\n"
+            yield _sse_event({"type": "info", "message": f"Starting {model_id}..."})
 
             # Run foundry model run with live output
             process = subprocess.Popen(
@@ -2127,19 +2877,24 @@ async def start_foundry_model_stream(request: Request) -> StreamingResponse:
                 for line in iter(process.stdout.readline, ""):
                     if line:
                         line = line.rstrip()
-                        yield f"data: {json.dumps({'type': 'output', 'message': line})}\n\n"
+                        yield _sse_event({"type": "output", "message": line})
                         await asyncio.sleep(0)  # Yield control
 
             # Wait for process to complete
             returncode = process.wait()
 
             if returncode == 0:
-                yield f"data: {json.dumps({'type': 'complete', 'message': f'✅ {model_id} is now running!'})}\n\n"
+                yield _sse_event({"type": "complete", "message": f"✅ {model_id} is now running!"})
             else:
-                yield f"data: {json.dumps({'type': 'error', 'message': f'❌ Failed to start model (exit code {returncode})'})}\n\n"
+                yield _sse_event(
+                    {
+                        "type": "error",
+                        "message": f"❌ Failed to start model (exit code {returncode})",
+                    }
+                )
 
         except Exception as e:
-            yield f"data: {json.dumps({'type': 'error', 'message': f'❌ Error: {str(e)}'})}\n\n"
+            yield _sse_event({"type": "error", "message": f"❌ Error: {e}"})
 
     return StreamingResponse(
         event_generator(),
@@ -2161,59 +2916,34 @@ async def start_foundry_model(request: dict[str, Any]) -> dict[str, Any]:
         # Use the SDK to load the model (non-blocking)
         from foundry_local import FoundryLocalManager
 
-        manager = FoundryLocalManager(model_id)
+        manager = await asyncio.to_thread(FoundryLocalManager, model_id)
 
         # Check if model is already loaded
-        loaded = manager.list_loaded_models()
-        for m in loaded:
-            if m.alias == model_id or m.id.startswith(model_id):
-                return {
-                    "success": True,
-                    "model": model_id,
-                    "message": f"Model {model_id} is already running",
-                }
+        if _is_model_loaded(model_id, await asyncio.to_thread(manager.list_loaded_models)):
+            return {
+                "success": True,
+                "model": model_id,
+                "message": f"Model {model_id} is already running",
+            }
 
         # Model not loaded - need to load it
         # The FoundryLocalManager will handle starting the service if needed
         # We use model run in background for initial setup
-        import subprocess
-        import sys
-
         # Start foundry model run in a detached process
-        if sys.platform == "win32":
-            # Windows: use START to run in background
-            subprocess.Popen(
-                f"start /B foundry model run {model_id}",
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        else:
-            # Unix: use nohup
-            subprocess.Popen(
-                ["nohup", "foundry", "model", "run", model_id],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
+        _spawn_foundry_model_run(model_id)
 
-        # Wait a bit for the service to start
-        import asyncio
+        # Wait for the model to come up, reusing the manager we already discovered
+        _invalidate_loaded_models()
 
-        await asyncio.sleep(5)
+        async def model_loaded() -> bool:
+            return _is_model_loaded(model_id, await asyncio.to_thread(manager.list_loaded_models))
 
-        # Verify it started
-        try:
-            manager2 = FoundryLocalManager(model_id)
-            loaded2 = manager2.list_loaded_models()
-            if loaded2:
-                return {
-                    "success": True,
-                    "model": model_id,
-                    "message": f"Model {model_id} started",
-                }
-        except Exception:
-            pass
+        if await _poll_until(model_loaded):
+            return {
+                "success": True,
+                "model": model_id,
+                "message": f"Model {model_id} started",
+            }
 
         return {
             "success": True,
@@ -2241,18 +2971,14 @@ async def start_foundry_model(request: dict[str, Any]) -> dict[str, Any]:
 @router.post("/foundry/stop")
 async def stop_foundry() -> dict[str, Any]:
     """Stop Foundry Local service."""
+    _invalidate_loaded_models()
     try:
-        result = subprocess.run(
-            ["foundry", "service", "stop"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        result = await _run_async(["foundry", "service", "stop"], timeout=30)
 
         return {
             "success": True,
             "message": "Foundry service stopped",
-            "output": result.stdout,
+            "output": result.stdout.decode(errors="replace"),
         }
     except FileNotFoundError:
         return {"success": False, "error": "Foundry CLI not found"}
@@ -2268,54 +2994,23 @@ async def restart_foundry(request: dict[str, Any]) -> dict[str, Any]:
     we must stop the service entirely and start with the new model.
     """
     model_id = request.get("model_id", "qwen2.5-0.5b")
-    import asyncio
-    import sys
 
+    _invalidate_loaded_models()
     try:
         # Step 1: Stop the Foundry service completely
         logger.info("Stopping Foundry service for model switch...")
-        subprocess.run(
-            ["foundry", "service", "stop"],
-            capture_output=True,
-            text=True,
-            timeout=30,
-        )
+        await _run_async(["foundry", "service", "stop"], timeout=30)
 
         # Wait for service to fully stop
-        await asyncio.sleep(3)
+        await _poll_until(_foundry_service_running, _STOP_POLL_DELAYS, expected=False)
 
         # Step 2: Start foundry model run in background (this starts the service + loads model)
         logger.info("Starting Foundry with model: %s", model_id)
 
-        if sys.platform == "win32":
-            # Windows: use START /B to run in background without blocking
-            subprocess.Popen(
-                f"start /B foundry model run {model_id}",
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        else:
-            # Unix: use nohup
-            subprocess.Popen(
-                ["nohup", "foundry", "model", "run", model_id],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True,
-            )
-
-        # Wait for model to start loading
-        await asyncio.sleep(5)
-
-        # Verify it's starting
-        status_result = subprocess.run(
-            ["foundry", "service", "status"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
+        _spawn_foundry_model_run(model_id)
 
-        if "running" in status_result.stdout.lower() or "started" in status_result.stdout.lower():
+        # Wait for model to start loading, returning as soon as the service reports in
+        if await _poll_until(_foundry_service_running):
             return {
                 "success": True,
                 "model": model_id,
@@ -7,19 +7,24 @@ Endpoints:
 - POST /api/models/start    - Start a model
 - POST /api/models/stop     - Stop current model
 - POST /api/chat            - Send a chat message
+- POST /api/chat/stream     - Send a chat message, streaming the reply as NDJSON
 - GET  /api/tools           - List available MCP tools
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any
+import re
+from typing import Any, AsyncIterator
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from server.model_manager import model_manager
-from server.chat_service import ChatService, TOOL_REGISTRY, get_tools_schema
+from server.chat_service import ChatService, TOOL_REGISTRY
+from server.chat_service import execute_tool as exec_tool
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +33,49 @@ router = APIRouter(prefix="/api")
 # Global chat service instance (initialized when model starts)
 _chat_service: ChatService | None = None
 
+# Dry-run keyword dispatch: (keywords, tool, title, detail line or None for search tools)
+_DRYRUN_ROUTES: tuple[tuple[tuple[str, ...], str, str, str | None], ...] = (
+    (
+        ("connectivity", "egress"),
+        "arc.connectivity.check",
+        "Connectivity Check",
+        "✅ Checked 52 endpoints",
+    ),
+    (("validate", "cluster"), "aks.arc.validate", "Cluster Validation", "✅ Validated cluster"),
+    (("tsg", "error", "0x"), "azlocal.tsg.search", "TSG Search", None),
+)
+
+# All route keywords in one alternation, so a message is scanned once; the earliest
+# table entry with a hit wins, as before
+_DRYRUN_KEYWORD_ROUTE = {k: i for i, route in enumerate(_DRYRUN_ROUTES) for k in route[0]}
+_DRYRUN_PATTERN = re.compile(
+    "|".join(re.escape(k) for k in sorted(_DRYRUN_KEYWORD_ROUTE, key=len, reverse=True))
+)
+
+_DRYRUN_HELP = (
+    "🧪 **Dry-run mode enabled**\n\nI'm running without a model. Try asking about:\n"
+    "- Connectivity checks\n- Cluster validation\n- Error codes (TSG search)"
+)
+
+
+def _dryrun_reply(title: str, detail: str | None, result: dict[str, Any]) -> tuple[str, str]:
+    """Format a dry-run tool result as (result_summary, response text)."""
+    if detail is None:
+        count = result.get("resultCount", 0)
+        return (
+            f"Found {count} results",
+            f"**{title} Results (DRY-RUN)**\n\n"
+            f"Found {count} troubleshooting guides for your error.",
+        )
+
+    summary = result.get("summary", {})
+    passed, failed, warned = summary.get("pass", 0), summary.get("fail", 0), summary.get("warn", 0)
+    return (
+        f"Pass: {passed}, Fail: {failed}",
+        f"**{title} Results (DRY-RUN)**\n\n{detail}\n\n"
+        f"Summary:\n- Pass: {passed}\n- Fail: {failed}\n- Warn: {warned}",
+    )
+
 
 # =============================================================================
 # Request/Response Models
@@ -106,7 +154,7 @@ async def start_model(request: StartModelRequest) -> dict[str, Any]:
     if result["success"]:
         # Initialize chat service with the new model
         _chat_service = ChatService(endpoint=result["endpoint"], model=request.model_id)
-        logger.info(f"Chat service initialized with {request.model_id}")
+        logger.info("Chat service initialized with %s", request.model_id)
 
     return result
 
@@ -129,6 +177,23 @@ async def stop_model() -> dict[str, Any]:
 # =============================================================================
 
 
+def _get_chat_service() -> ChatService:
+    """Return the chat service, attaching it to the running model if needed."""
+    global _chat_service
+
+    if not _chat_service:
+        # Try to initialize with current running model
+        status = model_manager.get_status()
+        if status["model_running"] and status["endpoint"]:
+            # Use model_id (full Foundry model ID) for API calls, not the alias
+            model_id = status.get("current_model_id") or status["current_model"]
+            _chat_service = ChatService(endpoint=status["endpoint"], model=model_id)
+        else:
+            raise HTTPException(status_code=503, detail="No model is running. Start a model first.")
+
+    return _chat_service
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat(request: ChatRequest) -> ChatResponse:
     """Send a chat message and get a response with potential tool execution."""
@@ -138,56 +203,24 @@ async def chat(request: ChatRequest) -> ChatResponse:
     if request.dry_run and not _chat_service:
         # Simulate a tool call based on keywords
         tools_executed = []
-        response = ""
-
-        message_lower = request.message.lower()
-
-        if "connectivity" in message_lower or "egress" in message_lower:
-            # Simulate connectivity check
-            from server.chat_service import execute_tool
-
-            result = await execute_tool("arc.connectivity.check", {"dryRun": True})
-            tools_executed.append(
-                {
-                    "name": "arc.connectivity.check",
-                    "arguments": {"dryRun": True},
-                    "result_summary": f"Pass: {result.get('summary', {}).get('pass', 0)}, Fail: {result.get('summary', {}).get('fail', 0)}",
-                }
-            )
-            response = f"**Connectivity Check Results (DRY-RUN)**\n\n✅ Checked 52 endpoints\n\nSummary:\n- Pass: {result.get('summary', {}).get('pass', 0)}\n- Fail: {result.get('summary', {}).get('fail', 0)}\n- Warn: {result.get('summary', {}).get('warn', 0)}"
-
-        elif "validate" in message_lower or "cluster" in message_lower:
-            from server.chat_service import execute_tool
-
-            result = await execute_tool("aks.arc.validate", {"dryRun": True})
-            tools_executed.append(
-                {
-                    "name": "aks.arc.validate",
-                    "arguments": {"dryRun": True},
-                    "result_summary": f"Pass: {result.get('summary', {}).get('pass', 0)}, Fail: {result.get('summary', {}).get('fail', 0)}",
-                }
-            )
-            response = f"**Cluster Validation Results (DRY-RUN)**\n\n✅ Validated cluster\n\nSummary:\n- Pass: {result.get('summary', {}).get('pass', 0)}\n- Fail: {result.get('summary', {}).get('fail', 0)}\n- Warn: {result.get('summary', {}).get('warn', 0)}"
-
-        elif "tsg" in message_lower or "error" in message_lower or "0x" in message_lower:
-            from server.chat_service import execute_tool
-
-            result = await execute_tool(
-                "azlocal.tsg.search", {"errorText": request.message, "dryRun": True}
-            )
+        response = _DRYRUN_HELP
+
+        hits = _DRYRUN_PATTERN.finditer(request.message.lower())
+        route = min((_DRYRUN_KEYWORD_ROUTE[m.group()] for m in hits), default=None)
+        if route is not None:
+            _, tool_name, title, detail = _DRYRUN_ROUTES[route]
+            arguments: dict[str, Any] = {"dryRun": True}
+            if detail is None:
+                # Search-style tools take the message itself as input
+                arguments = {"errorText": request.message, "dryRun": True}
+
+            result = await exec_tool(tool_name, arguments)
+            result_summary, response = _dryrun_reply(title, detail, result)
             tools_executed.append(
-                {
-                    "name": "azlocal.tsg.search",
-                    "arguments": {"errorText": request.message, "dryRun": True},
-                    "result_summary": f"Found {result.get('resultCount', 0)} results",
-                }
+                {"name": tool_name, "arguments": arguments, "result_summary": result_summary}
             )
-            response = f"**TSG Search Results (DRY-RUN)**\n\nFound {result.get('resultCount', 0)} troubleshooting guides for your error."
 
-        else:
-            response = "🧪 **Dry-run mode enabled**\n\nI'm running without a model. Try asking about:\n- Connectivity checks\n- Cluster validation\n- Error codes (TSG search)"
-
-        return ChatResponse(
+        return ChatResponse.model_construct(
             success=True,
             response=response,
             tools_executed=tools_executed,
@@ -195,27 +228,37 @@ async def chat(request: ChatRequest) -> ChatResponse:
             error=None,
         )
 
-    if not _chat_service:
-        # Try to initialize with current running model
-        status = model_manager.get_status()
-        if status["model_running"] and status["endpoint"]:
-            # Use model_id (full Foundry model ID) for API calls, not the alias
-            model_id = status.get("current_model_id") or status["current_model"]
-            _chat_service = ChatService(endpoint=status["endpoint"], model=model_id)
-        else:
-            raise HTTPException(status_code=503, detail="No model is running. Start a model first.")
-
-    result = await _chat_service.chat(user_message=request.message, dry_run=request.dry_run)
+    result = await _get_chat_service().chat(user_message=request.message, dry_run=request.dry_run)
 
-    return ChatResponse(
+    # Built from our own service output, so skip re-validating every field
+    return ChatResponse.model_construct(
         success=result["success"],
-        response=result["response"],
+        response=result["response"] or "",
         tools_executed=result.get("tools_executed", []),
         model=result.get("model"),
         error=result.get("error"),
     )
 
 
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest) -> StreamingResponse:
+    """
+    Stream a chat reply as NDJSON events.
+
+    Each line is one event: ``token`` (reply text), ``tool`` (an executed tool),
+    then a final ``done`` (same fields as ``/chat``) or ``error``.
+    """
+    service = _get_chat_service()
+
+    async def generate() -> AsyncIterator[bytes]:
+        async for event in service.chat_stream(
+            user_message=request.message, dry_run=request.dry_run
+        ):
+            yield json.dumps(event).encode() + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.post("/chat/reset")
 async def reset_chat() -> dict[str, Any]:
     """Reset the conversation history."""
@@ -252,12 +295,12 @@ async def list_tools() -> dict[str, Any]:
 
 
 @router.post("/tools/{tool_name}/execute")
-async def execute_tool(tool_name: str, arguments: dict[str, Any] = {}) -> dict[str, Any]:
+async def execute_tool(
+    tool_name: str, arguments: dict[str, Any] | None = Body(default=None)
+) -> dict[str, Any]:
     """Execute a specific MCP tool directly."""
-    from server.chat_service import execute_tool as exec_tool
-
     if tool_name not in TOOL_REGISTRY:
         raise HTTPException(status_code=404, detail=f"Tool not found: {tool_name}")
 
-    result = await exec_tool(tool_name, arguments)
+    result = await exec_tool(tool_name, arguments or {})
     return result
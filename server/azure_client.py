@@ -0,0 +1,194 @@
+"""
+Azure Resource Manager REST client.
+
+Talks to ARM directly over one pooled ``httpx.AsyncClient`` instead of starting
+an Azure CLI process per request. Tokens come from ``azure-identity`` when it is
+installed, otherwise from ``az account get-access-token``, and are reused until
+shortly before they expire.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import logging
+import subprocess
+import time
+from typing import Any, Callable
+
+import httpx
+
+from server.azure_context import AzureContext, run_async
+
+_json_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+ARM_ENDPOINT = "https://management.azure.com"
+ARM_SCOPE = f"{ARM_ENDPOINT}/.default"
+CONNECTED_CLUSTERS_API_VERSION = "2024-01-01"
+
+# Refresh tokens this many seconds before they expire
+_TOKEN_REFRESH_MARGIN = 300.0
+
+
+class AzureRestError(Exception):
+    """Raised when an ARM request or token acquisition fails."""
+
+
+_client: httpx.AsyncClient | None = None
+_token: tuple[str, float] | None = None  # (access token, expires_on epoch seconds)
+_token_lock = asyncio.Lock()
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide ARM client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=ARM_ENDPOINT,
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _reset_token_cache() -> None:
+    """Forget the cached access token (for tests)."""
+    global _token
+    _token = None
+
+
+async def _token_from_identity() -> tuple[str, float] | None:
+    """Get an ARM token via azure-identity, if installed."""
+    try:
+        from azure.identity.aio import DefaultAzureCredential
+    except ImportError:
+        return None
+
+    try:
+        async with DefaultAzureCredential() as credential:
+            token = await credential.get_token(ARM_SCOPE)
+    except Exception as e:
+        logger.debug("azure-identity could not get a token, trying Azure CLI: %s", e)
+        return None
+    return token.token, float(token.expires_on)
+
+
+async def _token_from_cli() -> tuple[str, float]:
+    """Get an ARM token from the Azure CLI's login session."""
+    az_cmd = AzureContext.find_az_cli()
+    if not az_cmd:
+        raise AzureRestError("Azure CLI not found")
+
+    cmd = [
+        az_cmd,
+        "account",
+        "get-access-token",
+        "--resource",
+        f"{ARM_ENDPOINT}/",
+        "-o",
+        "json",
+        "--only-show-errors",
+    ]
+    try:
+        result = await run_async(cmd, timeout=30)
+    except subprocess.TimeoutExpired:
+        raise AzureRestError("Timed out getting an access token from Azure CLI")
+    if result.returncode != 0:
+        raise AzureRestError(result.stderr.decode(errors="replace").strip())
+
+    try:
+        data = _json_loads(result.stdout)
+        # Newer CLIs report epoch seconds; older ones only a local timestamp
+        expires_on = data.get("expires_on") or time.time() + 30 * 60
+        return data["accessToken"], float(expires_on)
+    except (ValueError, KeyError, TypeError) as e:
+        raise AzureRestError(f"Unexpected get-access-token output: {e}") from e
+
+
+async def get_token() -> str:
+    """Return a cached ARM access token, refreshing it when close to expiry."""
+    global _token
+    if _token and _token[1] - time.time() > _TOKEN_REFRESH_MARGIN:
+        return _token[0]
+
+    async with _token_lock:
+        if _token and _token[1] - time.time() > _TOKEN_REFRESH_MARGIN:
+            return _token[0]
+        _token = await _token_from_identity() or await _token_from_cli()
+        return _token[0]
+
+
+async def arm_list(path: str, api_version: str) -> list[dict[str, Any]]:
+    """GET an ARM collection, following ``nextLink`` pages.
+
+    Args:
+        path: Resource path below the ARM endpoint, e.g. ``/subscriptions/<id>/...``
+        api_version: Resource provider API version
+
+    Raises:
+        AzureRestError: On authentication or HTTP failure
+    """
+    client = get_client()
+    headers = {"Authorization": f"Bearer {await get_token()}"}
+    items: list[dict[str, Any]] = []
+    url: str | None = path
+    params: dict[str, str] | None = {"api-version": api_version}
+
+    while url:
+        try:
+            response = await client.get(url, params=params, headers=headers)
+        except httpx.HTTPError as e:
+            raise AzureRestError(f"ARM request failed: {e}") from e
+        if response.status_code >= 400:
+            try:
+                message = _json_loads(response.content)["error"]["message"]
+            except Exception:
+                message = response.text
+            raise AzureRestError(f"ARM returned {response.status_code}: {message}")
+
+        page = _json_loads(response.content)
+        items.extend(page.get("value", []))
+        # nextLink already carries api-version and the skip token
+        url, params = page.get("nextLink"), None
+
+    return items
+
+
+def _flatten_resource(resource: dict[str, Any]) -> dict[str, Any]:
+    """Shape an ARM resource like Azure CLI output (properties hoisted, resourceGroup set)."""
+    parts = (resource.get("id") or "").split("/")
+    resource_group = parts[4] if len(parts) > 4 else None
+    return {
+        **resource.get("properties", {}),
+        "id": resource.get("id"),
+        "name": resource.get("name"),
+        "location": resource.get("location"),
+        "resourceGroup": resource_group,
+    }
+
+
+async def list_connected_clusters(subscription_id: str) -> list[dict[str, Any]]:
+    """List Arc-connected Kubernetes clusters in a subscription.
+
+    Returns rows in the same shape as ``az connectedk8s list``.
+    """
+    resources = await arm_list(
+        f"/subscriptions/{subscription_id}/providers/Microsoft.Kubernetes/connectedClusters",
+        CONNECTED_CLUSTERS_API_VERSION,
+    )
+    return [_flatten_resource(r) for r in resources]
@@ -7,17 +7,213 @@ getting subscription context, and ensuring tools have proper access.
 
 from __future__ import annotations
 
+import asyncio
+import getpass
+import io
 import json
 import logging
+import os
 import shutil
 import subprocess
+import time
+import uuid
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Literal, TypeGuard, overload
+
+_json_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+# Most output accepted from one CLI call before the child is killed
+MAX_OUTPUT_BYTES = 16 * 1024 * 1024
+
+# How long a signed-in status / subscription list is reused before asking az again
+AUTH_CACHE_TTL = 60.0
+SUBSCRIPTIONS_CACHE_TTL = 300.0
+
+# Fields kept from ``az connectedk8s list`` for each cluster
+CLUSTER_FIELDS = (
+    "name",
+    "resourceGroup",
+    "location",
+    "connectivityStatus",
+    "provisioningState",
+    "kubernetesVersion",
+    "agentVersion",
+    "distribution",
+    "infrastructure",
+    "totalNodeCount",
+    "lastConnectivityTime",
+)
+
+
+class OutputLimitExceeded(subprocess.SubprocessError):
+    """Raised when a child process writes more output than ``run_async`` allows."""
+
+    def __init__(self, cmd: list[str], limit: int):
+        super().__init__(f"{cmd[0]} produced more than {limit} bytes of output")
+        self.cmd = cmd
+        self.limit = limit
+
+
+async def _read_capped(stream: asyncio.StreamReader, limit: int) -> bytes | None:
+    """Read ``stream`` to EOF, or return None once it exceeds ``limit`` bytes."""
+    try:
+        await stream.readexactly(limit + 1)
+    except asyncio.IncompleteReadError as e:
+        return e.partial
+    return None
+
+
+@overload
+async def run_async(
+    cmd: list[str],
+    timeout: float,
+    *,
+    cwd: str | None = ...,
+    env: dict[str, str] | None = ...,
+    text: Literal[False] = ...,
+    max_output: int = ...,
+) -> subprocess.CompletedProcess[bytes]: ...
+
+
+@overload
+async def run_async(
+    cmd: list[str],
+    timeout: float,
+    *,
+    cwd: str | None = ...,
+    env: dict[str, str] | None = ...,
+    text: Literal[True],
+    max_output: int = ...,
+) -> subprocess.CompletedProcess[str]: ...
+
+
+@overload
+async def run_async(
+    cmd: list[str],
+    timeout: float,
+    *,
+    cwd: str | None = ...,
+    env: dict[str, str] | None = ...,
+    text: bool,
+    max_output: int = ...,
+) -> subprocess.CompletedProcess[Any]: ...
+
+
+async def run_async(
+    cmd: list[str],
+    timeout: float,
+    *,
+    cwd: str | None = None,
+    env: dict[str, str] | None = None,
+    text: bool = False,
+    max_output: int = MAX_OUTPUT_BYTES,
+) -> subprocess.CompletedProcess[Any]:
+    """Run a command without blocking the event loop.
+
+    Mirrors ``subprocess.run(cmd, capture_output=True, timeout=timeout)``: output is
+    returned as bytes (or str when ``text`` is set) and ``subprocess.TimeoutExpired``
+    is raised (after killing the child) when the timeout elapses. A child writing
+    more than ``max_output`` bytes to either stream is killed and
+    ``OutputLimitExceeded`` raised.
+
+    Event loops without subprocess support (the SelectorEventLoop uvicorn uses on
+    Windows with ``--workers`` or ``--reload``) fall back to ``subprocess.run`` in a
+    worker thread; output is then only checked against ``max_output`` once the
+    child has exited.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+            env=env,
+        )
+    except NotImplementedError:
+        result = await asyncio.to_thread(
+            subprocess.run, cmd, capture_output=True, timeout=timeout, cwd=cwd, env=env
+        )
+        if len(result.stdout) > max_output or len(result.stderr) > max_output:
+            raise OutputLimitExceeded(cmd, max_output) from None
+        if text:
+            return subprocess.CompletedProcess(
+                cmd,
+                result.returncode,
+                result.stdout.decode(errors="replace"),
+                result.stderr.decode(errors="replace"),
+            )
+        return result
+
+    async def read(stream: asyncio.StreamReader) -> bytes | None:
+        data = await _read_capped(stream, max_output)
+        if data is None:
+            # Stop the child so the other pipe reaches EOF too
+            proc.kill()
+        return data
+
+    async def communicate() -> tuple[bytes | None, bytes | None]:
+        assert proc.stdout is not None and proc.stderr is not None  # both are PIPEs
+        stdout, stderr = await asyncio.gather(read(proc.stdout), read(proc.stderr))
+        await proc.wait()
+        return stdout, stderr
+
+    try:
+        stdout, stderr = await asyncio.wait_for(communicate(), timeout=timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if stdout is None or stderr is None:
+        raise OutputLimitExceeded(cmd, max_output)
+    if text:
+        return subprocess.CompletedProcess(
+            cmd,
+            proc.returncode or 0,
+            stdout.decode(errors="replace"),
+            stderr.decode(errors="replace"),
+        )
+    return subprocess.CompletedProcess(cmd, proc.returncode or 0, stdout, stderr)
+
+
+def _cluster_summaries(data: bytes) -> list[dict[str, Any]]:
+    """Project ``az connectedk8s list`` output down to CLUSTER_FIELDS.
+
+    With ijson installed the array is parsed one cluster at a time, so the full
+    object graph of a large listing is never built.
+
+    Raises:
+        ValueError: If the output is not a JSON array
+    """
+    try:
+        import ijson
+    except ImportError:  # pragma: no cover - optional speedup
+        return [{k: c.get(k) for k in CLUSTER_FIELDS} for c in _json_loads(data)]
+
+    try:
+        return [
+            {k: c.get(k) for k in CLUSTER_FIELDS}
+            for c in ijson.items(io.BytesIO(data), "item", use_float=True)
+        ]
+    except ijson.JSONError as e:
+        raise ValueError(str(e)) from e
+
+
+def _is_subscription_id(value: str | None) -> TypeGuard[str]:
+    """Whether ``value`` is a subscription GUID (the CLI also accepts names)."""
+    try:
+        uuid.UUID(value or "")
+    except ValueError:
+        return False
+    return True
+
+
 @dataclass
 class AzureAuthStatus:
     """Azure authentication status."""
@@ -42,34 +238,71 @@ class AzureContext:
     """
 
     _az_cmd: str | None = None
+    _az_searched: bool = False
+    _WINDOWS_CANDIDATES: tuple[str, ...] | None = None
+
+    # az binary -> (monotonic timestamp, result)
+    _auth_cache: dict[str, tuple[float, AzureAuthStatus]] = {}
+    _subscriptions_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop cached auth status and subscription list (e.g. after switching account)."""
+        cls._auth_cache.clear()
+        cls._subscriptions_cache.clear()
 
     @classmethod
     def find_az_cli(cls) -> str | None:
-        """Find Azure CLI executable, checking common paths."""
-        if cls._az_cmd:
+        """Find Azure CLI executable, checking common paths.
+
+        The result (including "not installed") is cached for the life of the
+        process. ``ARCOPS_AZ_CLI_PATH`` (or the older ``AZ_CLI_PATH``) is trusted
+        as-is and skips the search.
+        """
+        env_path = os.environ.get("ARCOPS_AZ_CLI_PATH") or os.environ.get("AZ_CLI_PATH")
+        if env_path:
+            return env_path
+
+        if cls._az_searched:
             return cls._az_cmd
 
+        cls._az_cmd = cls._search_az_cli()
+        cls._az_searched = True
+        return cls._az_cmd
+
+    @classmethod
+    def _reset_az_cli_cache(cls) -> None:
+        """Forget the cached Azure CLI location (for tests)."""
+        cls._az_cmd = None
+        cls._az_searched = False
+
+    @staticmethod
+    def _search_az_cli() -> str | None:
+        """Locate the Azure CLI on disk."""
         # Try standard PATH first
         az_cmd = shutil.which("az")
         if az_cmd:
-            cls._az_cmd = az_cmd
             return az_cmd
 
         # Try common Windows paths
-        windows_paths = [
-            r"C:\Program Files\Microsoft SDKs\Azure\CLI2\wbin\az.cmd",
-            r"C:\Program Files (x86)\Microsoft SDKs\Azure\CLI2\wbin\az.cmd",
-            r"C:\Users\{}\AppData\Local\Programs\Microsoft VS Code\bin\az.cmd",
-        ]
-
-        for path in windows_paths:
-            expanded = Path(path.format(Path.home().name))
-            if expanded.exists():
-                cls._az_cmd = str(expanded)
-                return cls._az_cmd
+        for path in AzureContext._windows_candidates():
+            if os.path.exists(path):
+                return path
 
         return None
 
+    @classmethod
+    def _windows_candidates(cls) -> tuple[str, ...]:
+        """Common Windows install locations, resolved for the current user once."""
+        if cls._WINDOWS_CANDIDATES is None:
+            user = os.environ.get("USERNAME") or getpass.getuser()
+            cls._WINDOWS_CANDIDATES = (
+                r"C:\Program Files\Microsoft SDKs\Azure\CLI2\wbin\az.cmd",
+                r"C:\Program Files (x86)\Microsoft SDKs\Azure\CLI2\wbin\az.cmd",
+                rf"C:\Users\{user}\AppData\Local\Programs\Microsoft VS Code\bin\az.cmd",
+            )
+        return cls._WINDOWS_CANDIDATES
+
     @classmethod
     async def check_auth(cls) -> AzureAuthStatus:
         """
@@ -88,13 +321,25 @@ class AzureContext:
                 hint="Install Azure CLI: https://docs.microsoft.com/cli/azure/install-azure-cli",
             )
 
+        cached = cls._auth_cache.get(az_cmd)
+        if cached and time.monotonic() - cached[0] < AUTH_CACHE_TTL:
+            return cached[1]
+
+        status = await cls._fetch_auth(az_cmd)
+        # Only a signed-in status is kept so a fresh 'az login' is seen immediately
+        if status.authenticated:
+            cls._auth_cache[az_cmd] = (time.monotonic(), status)
+        return status
+
+    @classmethod
+    async def _fetch_auth(cls, az_cmd: str) -> AzureAuthStatus:
+        """Run ``az account show`` and interpret the result."""
         try:
             # Check current account
-            result = subprocess.run(
-                [az_cmd, "account", "show", "-o", "json"],
-                capture_output=True,
-                text=True,
+            result = await run_async(
+                [az_cmd, "account", "show", "-o", "json", "--only-show-errors"],
                 timeout=30,
+                text=True,
             )
 
             if result.returncode != 0:
@@ -157,12 +402,23 @@ class AzureContext:
         if not az_cmd:
             return {"success": False, "subscriptions": [], "error": "Azure CLI not found"}
 
+        cached = cls._subscriptions_cache.get(az_cmd)
+        if cached and time.monotonic() - cached[0] < SUBSCRIPTIONS_CACHE_TTL:
+            return cached[1]
+
+        result = await cls._fetch_subscriptions(az_cmd)
+        if result["success"]:
+            cls._subscriptions_cache[az_cmd] = (time.monotonic(), result)
+        return result
+
+    @classmethod
+    async def _fetch_subscriptions(cls, az_cmd: str) -> dict[str, Any]:
+        """Run ``az account list``."""
         try:
-            result = subprocess.run(
-                [az_cmd, "account", "list", "-o", "json"],
-                capture_output=True,
-                text=True,
+            result = await run_async(
+                [az_cmd, "account", "list", "-o", "json", "--only-show-errors"],
                 timeout=30,
+                text=True,
             )
 
             if result.returncode != 0:
@@ -194,16 +450,17 @@ class AzureContext:
             return {"success": False, "error": "Azure CLI not found"}
 
         try:
-            result = subprocess.run(
-                [az_cmd, "account", "set", "--subscription", subscription_id],
-                capture_output=True,
-                text=True,
+            result = await run_async(
+                [az_cmd, "account", "set", "--subscription", subscription_id, "--only-show-errors"],
                 timeout=30,
+                text=True,
             )
 
             if result.returncode != 0:
                 return {"success": False, "error": result.stderr}
 
+            # The default subscription (and isDefault flags) just changed
+            cls.invalidate_cache()
             return {"success": True, "subscription_id": subscription_id}
 
         except Exception as e:
@@ -230,8 +487,17 @@ class AzureContext:
                 "hint": "Install Azure CLI: https://docs.microsoft.com/cli/azure/install-azure-cli",
             }
 
-        # First verify we're authenticated
-        auth_status = await cls.check_auth()
+        # An explicit subscription doesn't depend on the login check, so list while
+        # checking; otherwise the signed-in account decides what to list.
+        listing: dict[str, Any] | None = None
+        if subscription:
+            auth_status, listing = await asyncio.gather(
+                cls.check_auth(), cls._list_clusters(az_cmd, subscription)
+            )
+        else:
+            auth_status = await cls.check_auth()
+
+        # A listing made without a valid login is discarded
         if not auth_status.authenticated:
             return {
                 "success": False,
@@ -240,16 +506,39 @@ class AzureContext:
                 "hint": auth_status.hint,
             }
 
+        if listing is None:
+            listing = await cls._list_clusters(az_cmd, auth_status.subscription_id)
+        return listing
+
+    @classmethod
+    async def _list_clusters(cls, az_cmd: str, subscription: str | None) -> dict[str, Any]:
+        """List connected clusters over ARM, falling back to ``az connectedk8s list``."""
+        if _is_subscription_id(subscription):
+            from server import azure_client
+
+            try:
+                clusters = await azure_client.list_connected_clusters(subscription)
+            except azure_client.AzureRestError as e:
+                logger.warning("ARM cluster listing failed, using Azure CLI: %s", e)
+            else:
+                return {
+                    "success": True,
+                    "count": len(clusters),
+                    "clusters": [{k: c.get(k) for k in CLUSTER_FIELDS} for c in clusters],
+                    "subscription": subscription,
+                }
+
         try:
-            cmd = [az_cmd, "connectedk8s", "list", "-o", "json"]
+            cmd = [az_cmd, "connectedk8s", "list", "-o", "json", "--only-show-errors"]
             if subscription:
                 cmd.extend(["--subscription", subscription])
 
-            logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running: %s", " ".join(cmd))
+            result = await run_async(cmd, timeout=120)
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip()
+                error_msg = result.stderr.decode(errors="replace").strip()
                 # Check for common errors
                 if "extension" in error_msg.lower() and "not installed" in error_msg.lower():
                     return {
@@ -264,36 +553,19 @@ class AzureContext:
                     "error": error_msg,
                 }
 
-            clusters = json.loads(result.stdout)
-
-            # Extract key info for each cluster
-            cluster_summaries = [
-                {
-                    "name": c.get("name"),
-                    "resourceGroup": c.get("resourceGroup"),
-                    "location": c.get("location"),
-                    "connectivityStatus": c.get("connectivityStatus"),
-                    "provisioningState": c.get("provisioningState"),
-                    "kubernetesVersion": c.get("kubernetesVersion"),
-                    "agentVersion": c.get("agentVersion"),
-                    "distribution": c.get("distribution"),
-                    "infrastructure": c.get("infrastructure"),
-                    "totalNodeCount": c.get("totalNodeCount"),
-                    "lastConnectivityTime": c.get("lastConnectivityTime"),
-                }
-                for c in clusters
-            ]
+            # Cluster listings can run to megabytes - stream them into summaries
+            cluster_summaries = _cluster_summaries(result.stdout)
 
             return {
                 "success": True,
-                "count": len(clusters),
+                "count": len(cluster_summaries),
                 "clusters": cluster_summaries,
-                "subscription": subscription or auth_status.subscription_id,
+                "subscription": subscription,
             }
 
         except subprocess.TimeoutExpired:
             return {"success": False, "clusters": [], "error": "Command timed out"}
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             return {"success": False, "clusters": [], "error": f"Failed to parse response: {e}"}
         except Exception as e:
             logger.exception("Error listing clusters")
@@ -10,11 +10,23 @@ Design principles:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import hashlib
+import importlib.util
 import json
 import logging
-from typing import Any
-
-from openai import OpenAI
+import os
+import re
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import httpx
+from openai import AsyncOpenAI
 
 from server.tools import (
     # Existing diagnostic tools
@@ -34,24 +46,44 @@ from server.tools import (
     GpuCheckTool,
     FoundryValidateTool,
 )
+from server.tools.base import BaseTool
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speedup
+    xxhash = None
 
 logger = logging.getLogger(__name__)
 
+# Tool results go back to the model as compact JSON text - orjson when available.
+# Results may carry datetimes or numpy values, which orjson encodes natively.
+if orjson is not None:
+    _json_loads = orjson.loads
+    _ORJSON_OPTS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_UTC_Z
+        | orjson.OPT_NAIVE_UTC
+    )
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"), default=str)
+
 
 # System prompt that teaches the LLM when to use each tool
 SYSTEM_PROMPT = """You are ArcOps Assistant, a diagnostic AI for Azure Local and AKS Arc environments.
 
-AVAILABLE TOOLS:
-1. arc.connectivity.check - Check network connectivity to 52+ Azure endpoints (DNS, TLS, firewall)
-2. arc.gateway.egress - Check TLS/Proxy/FQDN reachability for Arc gateway endpoints
-3. azlocal.envcheck - Run Azure Local Environment Checker for host validation
-4. azlocal.tsg.search - Search troubleshooting guides for ANY error message or symptom
-5. aks.arc.validate - Validate AKS Arc cluster configuration (extensions, CNI, versions)
-6. aksarc.support.diagnose - Detect known AKS Arc issues (MOC, certs, VMMS)
-7. aksarc.logs.collect - Collect diagnostic logs from AKS Arc cluster nodes
-8. arcops.diagnostics.bundle - Create support bundle with evidence files
-9. arcops.explain - Get educational content about Azure Local/AKS Arc topics
-
 WHEN TO USE TOOLS:
 - Connectivity/firewall/proxy issues → arc.connectivity.check
 - Gateway/egress/proxy problems → arc.gateway.egress
@@ -109,7 +141,7 @@ TOOL_REGISTRY = {
 }
 
 
-def get_tools_schema() -> list[dict]:
+def _build_tools_schema() -> list[dict]:
     """Generate OpenAI-compatible tools schema from registry."""
     tools = []
     for name, tool in TOOL_REGISTRY.items():
@@ -119,29 +151,239 @@ def get_tools_schema() -> list[dict]:
                 "function": {
                     "name": name,
                     "description": tool.description,
-                    "parameters": tool.input_schema,
+                    # Own copy, so later edits to a tool's class attribute can't
+                    # change the schema (and the cached prompt prefix) mid-process
+                    "parameters": copy.deepcopy(tool.input_schema),
                 },
             }
         )
     return tools
 
 
+# Completed turns kept in the prompt; older ones are dropped so prompt size stays bounded
+MAX_HISTORY_TURNS = max(1, int(os.environ.get("CHAT_HISTORY_TURNS", "20")))
+
+# Rough prompt budget (~4 characters per token); beyond it the older half of the
+# history is folded into a model-written summary before the next turn
+HISTORY_TOKEN_BUDGET = int(os.environ.get("CHAT_HISTORY_TOKENS", "6000"))
+
+_SUMMARY_PROMPT = (
+    "Summarize this earlier part of an Azure Local / AKS Arc troubleshooting chat in a "
+    "few bullet points. Keep cluster names, error codes, findings and decisions."
+)
+# Characters kept from each message when building the summary transcript
+_SUMMARY_SNIPPET_CHARS = 500
+
+# Streamed reply text is sent on in batches of at least this many characters
+_STREAM_FLUSH_CHARS = 64
+
+# Fields of an assistant message echoed back to the model alongside tool results
+_ASSISTANT_WIRE_FIELDS = {"role", "content", "tool_calls"}
+
+# The registry is fixed at import time, so build the schema and system message once.
+# Both open every request unchanged, keeping the prompt prefix cacheable server-side;
+# tool descriptions live only in the schema, not repeated in the system prompt.
+TOOLS_SCHEMA: tuple[dict[str, Any], ...] = tuple(_build_tools_schema())
+SYSTEM_MSG: dict[str, str] = {"role": "system", "content": SYSTEM_PROMPT}
+
+
+# Exact-match cache of tool-free replies, keyed by model + full prompt + dry_run.
+# Shared by all ChatService instances so a conversation reset doesn't empty it.
+RESPONSE_CACHE_SIZE = int(os.environ.get("CHAT_CACHE_SIZE", "512"))
+RESPONSE_CACHE_TTL = float(os.environ.get("CHAT_CACHE_TTL", "600"))
+
+_response_cache: OrderedDict[bytes, tuple[float, str]] = OrderedDict()  # key -> (ts, reply)
+
+
+def _blake2b_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# Keys aren't security sensitive, so a fast non-cryptographic hash will do when installed
+_digest: Callable[[bytes], bytes] = (
+    xxhash.xxh3_128_digest if xxhash is not None else _blake2b_digest
+)
+
+
+def _response_cache_key(model: str, messages: list[dict[str, Any]], dry_run: bool) -> bytes:
+    """Digest of everything that determines the model's reply."""
+    return _digest(_json_dumps([model, messages, dry_run]).encode())
+
+
+def _response_cache_get(key: bytes) -> str | None:
+    """Return a fresh cached reply, refreshing its LRU position."""
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > RESPONSE_CACHE_TTL:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return entry[1]
+
+
+def _response_cache_put(key: bytes, reply: str) -> None:
+    """Store a reply, evicting the least recently used entries over capacity."""
+    if RESPONSE_CACHE_SIZE <= 0:
+        return
+    _response_cache[key] = (time.monotonic(), reply)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+
+# One connection pool to the model endpoint, shared by every ChatService, and one
+# OpenAI client per endpoint on top of it
+_http_client: httpx.AsyncClient | None = None
+_openai_clients: dict[str, AsyncOpenAI] = {}
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide HTTP client for model calls, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _openai_clients.clear()
+        _http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+    return _http_client
+
+
+def get_openai_client(base_url: str) -> AsyncOpenAI:
+    """Return the shared OpenAI client for an endpoint, creating it on first use."""
+    http_client = get_http_client()
+    client = _openai_clients.get(base_url)
+    if client is None:
+        client = _openai_clients[base_url] = AsyncOpenAI(
+            base_url=base_url,
+            api_key="foundry-local",  # Foundry doesn't require a real key
+            http_client=http_client,
+        )
+    return client
+
+
+async def aclose() -> None:
+    """Close the shared client (called on application shutdown)."""
+    global _http_client
+    _openai_clients.clear()
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Indexed dispatch over the fixed registry: name -> slot -> bound execute method.
+# Names are interned so lookups with an interned name match on identity.
+_TOOL_NAMES: tuple[str, ...] = tuple(sys.intern(name) for name in TOOL_REGISTRY)
+_TOOL_EXECUTORS: tuple[Callable[[dict[str, Any]], Awaitable[dict[str, Any]]], ...] = tuple(
+    tool.execute for tool in TOOL_REGISTRY.values()
+)
+_TOOL_INDEX: dict[str, int] = {name: i for i, name in enumerate(_TOOL_NAMES)}
+
+
 async def execute_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Execute an MCP tool and return the result."""
-    tool = TOOL_REGISTRY.get(name)
-    if not tool:
+    index = _TOOL_INDEX.get(name)
+    if index is None:
         return {"error": f"Unknown tool: {name}"}
 
     try:
-        logger.info(f"Executing tool: {name} with args: {arguments}")
-        result = await tool.execute(arguments)
-        logger.info(f"Tool {name} completed successfully")
+        logger.info("Executing tool: %s", name)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Tool %s arguments: %s", name, _json_dumps(arguments))
+        result = await _TOOL_EXECUTORS[index](arguments)
+        logger.info("Tool %s completed successfully", name)
         return result
     except Exception as e:
-        logger.error(f"Tool {name} failed: {e}")
+        logger.error("Tool %s failed: %s", name, e)
         return {"error": str(e), "tool": name}
 
 
+def _parse_args(tool_call: Any, dry_run: bool) -> dict[str, Any]:
+    """Decode a tool call's JSON arguments, forcing dryRun when requested."""
+    try:
+        tool_args: dict[str, Any] = _json_loads(tool_call.function.arguments)
+    except json.JSONDecodeError:
+        tool_args = {}
+
+    # Note: dryRun is only added if explicitly requested via API
+    # The tool schemas no longer expose dryRun to prevent LLM misuse
+    if dry_run:
+        tool_args["dryRun"] = True
+    return tool_args
+
+
+# Opt-in: send messages carrying an HRESULT-style error code or "validation failed"
+# straight to the TSG search, skipping the model call that would only pick that tool
+FAST_ROUTE = os.environ.get("ARCOPS_FAST_ROUTE") == "1"
+
+_HEX_ERR = re.compile(r"0x[0-9a-fA-F]{7,8}")
+_FAST_ROUTE_PHRASES = ("validation failed",)
+
+
+def _fast_route(user_message: str) -> list[SimpleNamespace] | None:
+    """Return a synthesized ``azlocal.tsg.search`` call when the tool choice is obvious."""
+    if not FAST_ROUTE:
+        return None
+    lowered = user_message.lower()
+    if not (_HEX_ERR.search(user_message) or any(p in lowered for p in _FAST_ROUTE_PHRASES)):
+        return None
+    return [
+        SimpleNamespace(
+            id=f"call_{uuid.uuid4().hex[:24]}",
+            function=SimpleNamespace(
+                name="azlocal.tsg.search", arguments=_json_dumps({"query": user_message})
+            ),
+        )
+    ]
+
+
+def _tool_call_message(tool_calls: list[Any], content: str | None = None) -> dict[str, Any]:
+    """Build the assistant message that records tool calls in the conversation."""
+    message: dict[str, Any] = {
+        "role": "assistant",
+        "tool_calls": [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {"name": tc.function.name, "arguments": tc.function.arguments},
+            }
+            for tc in tool_calls
+        ],
+    }
+    if content:
+        message["content"] = content
+    return message
+
+
+async def _run_tool_calls(calls: list[tuple[Any, dict[str, Any]]]) -> list[dict[str, Any]]:
+    """Execute tool calls, returning results in call order.
+
+    Independent tools run concurrently. Tools marked ``parallel_safe = False``
+    run one at a time alongside them, so they never overlap each other.
+    """
+    results: list[dict[str, Any]] = [{}] * len(calls)
+    concurrent: list[int] = []
+    serial: list[int] = []
+    for i, (tool_call, _) in enumerate(calls):
+        tool = TOOL_REGISTRY.get(tool_call.function.name)
+        (concurrent if tool is None or tool.parallel_safe else serial).append(i)
+
+    async def run_concurrent() -> None:
+        done = await asyncio.gather(
+            *(execute_tool(calls[i][0].function.name, calls[i][1]) for i in concurrent)
+        )
+        for i, result in zip(concurrent, done):
+            results[i] = result
+
+    async def run_serial() -> None:
+        for i in serial:
+            results[i] = await execute_tool(calls[i][0].function.name, calls[i][1])
+
+    await asyncio.gather(run_concurrent(), run_serial())
+    return results
+
+
 class ChatService:
     """
     Simple chat service that uses Foundry Local for LLM and executes MCP tools.
@@ -160,18 +402,88 @@ class ChatService:
         if base_url.endswith("/v1"):
             base_url = base_url[:-3]
 
-        self.client = OpenAI(
-            base_url=f"{base_url}/v1", api_key="foundry-local"  # Foundry doesn't require a real key
-        )
+        self.client = get_openai_client(f"{base_url}/v1")
         self.model = model
-        self.tools_schema = get_tools_schema()
-        self.conversation_history: list[dict] = []
+        self.tools_schema = TOOLS_SCHEMA
+        # Full wire-format conversation; each turn is built on a snapshot and
+        # spliced in only once it completes, so concurrent turns never interleave
+        self._messages: list[dict] = [SYSTEM_MSG]
 
     def reset_conversation(self):
         """Clear conversation history."""
-        self.conversation_history = []
+        self._messages = [SYSTEM_MSG]
+
+    def _trim_history(self) -> None:
+        """Keep the system message plus the last MAX_HISTORY_TURNS turns.
+
+        A turn starts at a user message and includes any tool traffic it caused,
+        so tool results are never separated from the call that produced them.
+        """
+        turn_starts = [i for i, m in enumerate(self._messages) if m["role"] == "user"]
+        if len(turn_starts) > MAX_HISTORY_TURNS:
+            del self._messages[1 : turn_starts[-MAX_HISTORY_TURNS]]
+
+    async def _compact_history(self) -> None:
+        """Fold the older half of the conversation into a summary when over budget.
+
+        Cuts happen at turn boundaries so tool results stay with their calls. If
+        the summary request fails, the older turns are simply dropped.
+        """
+        estimated_tokens = sum(len(str(m.get("content") or "")) for m in self._messages) // 4
+        if estimated_tokens <= HISTORY_TOKEN_BUDGET:
+            return
+        turn_starts = [i for i, m in enumerate(self._messages) if m["role"] == "user"]
+        if len(turn_starts) < 2:
+            return
+
+        cut = turn_starts[len(turn_starts) // 2]
+        older = self._messages[1:cut]
+        transcript = "\n".join(
+            f"{m['role']}: {str(m['content'])[:_SUMMARY_SNIPPET_CHARS]}"
+            for m in older
+            if m.get("content")
+        )
+        summary = None
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": _SUMMARY_PROMPT},
+                    {"role": "user", "content": transcript},
+                ],
+            )
+            summary = response.choices[0].message.content
+        except Exception as e:
+            logger.warning("History summary failed, dropping older turns: %s", e)
+
+        # Another turn may have trimmed or compacted history while we waited
+        current = self._messages[1:cut]
+        if len(current) != len(older) or any(a is not b for a, b in zip(current, older)):
+            return
+
+        replacement = []
+        if summary:
+            replacement = [
+                {"role": "system", "content": f"Summary of the earlier conversation:\n{summary}"}
+            ]
+        self._messages[1:cut] = replacement
+
+    def _cache_lookup(
+        self, user_message: str, dry_run: bool, cache: bool
+    ) -> tuple[bytes, str | None]:
+        """Return the cache key for this turn and any cached reply.
+
+        The key is taken from the history as it stands, before compaction, so a
+        hit never pays for a summary request.
+        """
+        cache_key = _response_cache_key(
+            self.model, [*self._messages, {"role": "user", "content": user_message}], dry_run
+        )
+        return cache_key, _response_cache_get(cache_key) if cache else None
 
-    async def chat(self, user_message: str, dry_run: bool = False) -> dict[str, Any]:
+    async def chat(
+        self, user_message: str, dry_run: bool = False, cache: bool = True
+    ) -> dict[str, Any]:
         """
         Process a user message and return the assistant's response.
 
@@ -183,95 +495,88 @@ class ChatService:
         Args:
             user_message: The user's input
             dry_run: If True, tools will use fixture data
+            cache: If False, neither reuse nor store a cached reply for this prompt
 
         Returns:
             Dictionary with response, tool_calls, and metadata
         """
-        # Build messages array
-        messages = [{"role": "system", "content": SYSTEM_PROMPT}]
-        messages.extend(self.conversation_history)
-        messages.append({"role": "user", "content": user_message})
-
         # Track what tools were called
-        tools_executed = []
+        tools_executed: list[dict[str, Any]] = []
+
+        # A prompt already answered without tools gets the same reply
+        cache_key, cached = self._cache_lookup(user_message, dry_run, cache)
+        if cached is not None:
+            logger.info("Serving cached reply from %s", self.model)
+            self._messages.append({"role": "user", "content": user_message})
+            self._messages.append({"role": "assistant", "content": cached})
+            self._trim_history()
+            return {
+                "success": True,
+                "response": cached,
+                "tools_executed": tools_executed,
+                "model": self.model,
+                "cached": True,
+            }
 
-        try:
-            # First call to LLM with tools
-            logger.info(f"Sending message to {self.model}: {user_message[:100]}...")
-            response = self.client.chat.completions.create(
-                model=self.model, messages=messages, tools=self.tools_schema, tool_choice="auto"
-            )
+        await self._compact_history()
+
+        # Build the turn on a snapshot; it joins the conversation only on success
+        messages = [*self._messages, {"role": "user", "content": user_message}]
+        turn_start = len(messages) - 1
 
-            assistant_message = response.choices[0].message
-
-            # Check if LLM wants to call tools
-            if assistant_message.tool_calls:
-                logger.info(f"LLM requested {len(assistant_message.tool_calls)} tool(s)")
-
-                # Add assistant message with tool calls to history
-                messages.append(
-                    {
-                        "role": "assistant",
-                        "content": assistant_message.content or "",
-                        "tool_calls": [
-                            {
-                                "id": tc.id,
-                                "type": "function",
-                                "function": {
-                                    "name": tc.function.name,
-                                    "arguments": tc.function.arguments,
-                                },
-                            }
-                            for tc in assistant_message.tool_calls
-                        ],
-                    }
+        try:
+            tool_calls = _fast_route(user_message)
+            if tool_calls:
+                logger.info("Fast-routing message to %s", tool_calls[0].function.name)
+                messages.append(_tool_call_message(tool_calls))
+            else:
+                # First call to LLM with tools
+                logger.info("Sending message to %s: %.100s...", self.model, user_message)
+                response = await self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    tools=self.tools_schema,
+                    tool_choice="auto",
                 )
 
-                # Execute each tool
-                for tool_call in assistant_message.tool_calls:
-                    tool_name = tool_call.function.name
-                    try:
-                        tool_args = json.loads(tool_call.function.arguments)
-                    except json.JSONDecodeError:
-                        tool_args = {}
-
-                    # Note: dryRun is only added if explicitly requested via API
-                    # The tool schemas no longer expose dryRun to prevent LLM misuse
-                    if dry_run:
-                        tool_args["dryRun"] = True
-
-                    # Execute the tool
-                    tool_result = await execute_tool(tool_name, tool_args)
-                    tools_executed.append(
-                        {
-                            "name": tool_name,
-                            "arguments": tool_args,
-                            "result_summary": self._summarize_result(tool_result),
-                        }
-                    )
+                assistant_message = response.choices[0].message
+                tool_calls = assistant_message.tool_calls
+
+                # Check if LLM wants to call tools
+                if tool_calls:
+                    logger.info("LLM requested %d tool(s)", len(tool_calls))
 
-                    # Add tool result to messages
+                    # Add assistant message with tool calls to history
                     messages.append(
-                        {
-                            "role": "tool",
-                            "tool_call_id": tool_call.id,
-                            "content": json.dumps(tool_result),
-                        }
+                        assistant_message.model_dump(
+                            include=_ASSISTANT_WIRE_FIELDS, exclude_none=True, mode="json"
+                        )
                     )
 
-                # Second call to LLM with tool results
-                logger.info("Sending tool results back to LLM...")
-                final_response = self.client.chat.completions.create(
-                    model=self.model, messages=messages
-                )
-                final_content = final_response.choices[0].message.content
+            if tool_calls:
+                calls = [(tool_call, _parse_args(tool_call, dry_run)) for tool_call in tool_calls]
+                results = await _run_tool_calls(calls)
+
+                tools_executed.extend(self._record_tool_results(messages, calls, results))
+
+                final_content = self._direct_response(calls, results)
+                if final_content is None:
+                    # Second call to LLM with tool results
+                    logger.info("Sending tool results back to LLM...")
+                    final_response = await self.client.chat.completions.create(
+                        model=self.model, messages=messages
+                    )
+                    final_content = final_response.choices[0].message.content
             else:
                 # No tools needed, use direct response
                 final_content = assistant_message.content
+                if final_content and cache:
+                    # Tool results are live diagnostics, so only tool-free replies are reused
+                    _response_cache_put(cache_key, final_content)
 
-            # Update conversation history
-            self.conversation_history.append({"role": "user", "content": user_message})
-            self.conversation_history.append({"role": "assistant", "content": final_content})
+            messages.append({"role": "assistant", "content": final_content})
+            self._messages.extend(messages[turn_start:])
+            self._trim_history()
 
             return {
                 "success": True,
@@ -281,7 +586,7 @@ class ChatService:
             }
 
         except Exception as e:
-            logger.error(f"Chat failed: {e}")
+            logger.error("Chat failed: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -289,15 +594,170 @@ class ChatService:
                 "tools_executed": tools_executed,
             }
 
-    def _summarize_result(self, result: dict) -> str:
-        """Create a brief summary of a tool result."""
-        if "error" in result:
-            return f"Error: {result['error']}"
-        if "summary" in result:
-            summary = result["summary"]
-            return f"Pass: {summary.get('pass', 0)}, Fail: {summary.get('fail', 0)}, Warn: {summary.get('warn', 0)}"
-        if "resultCount" in result:
-            return f"Found {result['resultCount']} results"
-        if "success" in result:
-            return "Success" if result["success"] else "Failed"
-        return "Completed"
+    async def chat_stream(
+        self, user_message: str, dry_run: bool = False, cache: bool = True
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Like :meth:`chat`, but yield events while the reply is produced.
+
+        Both completions are streamed, so the first words of an answer arrive
+        as soon as the model emits them. Events are dicts with a ``type`` of
+        ``token`` (a batch of reply text), ``tool`` (one executed tool, as in
+        ``tools_executed``), ``done`` (the same fields :meth:`chat` returns)
+        or ``error``.
+        """
+        tools_executed: list[dict[str, Any]] = []
+        cache_key, cached = self._cache_lookup(user_message, dry_run, cache)
+        if cached is not None:
+            self._messages.append({"role": "user", "content": user_message})
+            self._messages.append({"role": "assistant", "content": cached})
+            self._trim_history()
+            yield {"type": "token", "content": cached}
+            yield {
+                "type": "done",
+                "response": cached,
+                "tools_executed": tools_executed,
+                "model": self.model,
+                "cached": True,
+            }
+            return
+
+        await self._compact_history()
+        # Failed or abandoned turns are never spliced into the conversation
+        messages = [*self._messages, {"role": "user", "content": user_message}]
+        turn_start = len(messages) - 1
+
+        try:
+            state: dict[str, Any] = {"content": "", "tool_calls": _fast_route(user_message)}
+            if state["tool_calls"]:
+                logger.info("Fast-routing message to %s", state["tool_calls"][0].function.name)
+            else:
+                logger.info("Streaming message to %s: %.100s...", self.model, user_message)
+                async for text in self._stream_completion(
+                    state, messages=messages, tools=self.tools_schema, tool_choice="auto"
+                ):
+                    yield {"type": "token", "content": text}
+            final_content = state["content"]
+
+            if state["tool_calls"]:
+                logger.info("Running %d tool(s)", len(state["tool_calls"]))
+                messages.append(_tool_call_message(state["tool_calls"], final_content))
+
+                calls = [(tc, _parse_args(tc, dry_run)) for tc in state["tool_calls"]]
+                results = await _run_tool_calls(calls)
+                for record in self._record_tool_results(messages, calls, results):
+                    tools_executed.append(record)
+                    yield {"type": "tool", **record}
+
+                final_content = self._direct_response(calls, results)
+                if final_content is not None:
+                    yield {"type": "token", "content": final_content}
+                else:
+                    state = {}
+                    async for text in self._stream_completion(state, messages=messages):
+                        yield {"type": "token", "content": text}
+                    final_content = state["content"]
+            elif final_content and cache:
+                _response_cache_put(cache_key, final_content)
+
+            messages.append({"role": "assistant", "content": final_content})
+            self._messages.extend(messages[turn_start:])
+            self._trim_history()
+            yield {
+                "type": "done",
+                "response": final_content,
+                "tools_executed": tools_executed,
+                "model": self.model,
+            }
+
+        except Exception as e:
+            logger.error("Chat stream failed: %s", e)
+            yield {"type": "error", "error": str(e), "tools_executed": tools_executed}
+
+    async def _stream_completion(self, state: dict[str, Any], **kwargs: Any) -> AsyncIterator[str]:
+        """Stream one completion, yielding its text in batches.
+
+        Text is flushed every ``_STREAM_FLUSH_CHARS`` characters rather than per
+        token. The full text and any tool calls (assembled from their deltas) are
+        left in ``state["content"]`` and ``state["tool_calls"]``.
+        """
+        stream = await self.client.chat.completions.create(model=self.model, stream=True, **kwargs)
+        text: list[str] = []
+        pending: list[str] = []
+        pending_len = 0
+        tool_calls: dict[int, SimpleNamespace] = {}
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                text.append(delta.content)
+                pending.append(delta.content)
+                pending_len += len(delta.content)
+                if pending_len >= _STREAM_FLUSH_CHARS:
+                    yield "".join(pending)
+                    pending, pending_len = [], 0
+            for part in delta.tool_calls or ():
+                call = tool_calls.setdefault(
+                    part.index,
+                    SimpleNamespace(id="", function=SimpleNamespace(name="", arguments="")),
+                )
+                call.id = call.id or part.id or ""
+                if part.function:
+                    call.function.name = call.function.name or part.function.name or ""
+                    call.function.arguments += part.function.arguments or ""
+
+        if pending:
+            yield "".join(pending)
+        state["content"] = "".join(text)
+        state["tool_calls"] = [tool_calls[i] for i in sorted(tool_calls)]
+
+    def _record_tool_results(
+        self,
+        messages: list[dict[str, Any]],
+        calls: list[tuple[Any, dict[str, Any]]],
+        results: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Append tool results to the turn's ``messages`` and return their summaries."""
+        records = []
+        for (tool_call, tool_args), tool_result in zip(calls, results):
+            records.append(
+                {
+                    "name": tool_call.function.name,
+                    "arguments": tool_args,
+                    "result_summary": self._summarize_result(tool_call.function.name, tool_result),
+                }
+            )
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "content": _json_dumps(tool_result),
+                }
+            )
+        return records
+
+    @staticmethod
+    def _direct_response(
+        calls: list[tuple[Any, dict[str, Any]]], results: list[dict[str, Any]]
+    ) -> str | None:
+        """Return the tools' own text when every call produced a final response.
+
+        Skips the second LLM round trip for tools such as ``arcops.explain`` whose
+        output is already written for the user.
+        """
+        contents = []
+        for (tool_call, _), result in zip(calls, results):
+            tool = TOOL_REGISTRY.get(tool_call.function.name)
+            content = result.get("content")
+            if not (tool and tool.returns_final_response and isinstance(content, str)):
+                return None
+            contents.append(content)
+        return "\n\n".join(contents) or None
+
+    @staticmethod
+    def _summarize_result(name: str, result: dict) -> str:
+        """Create a brief summary of a tool result, as formatted by the tool itself."""
+        tool = TOOL_REGISTRY.get(name)
+        return (tool.result_summary if tool else BaseTool.result_summary)(result)
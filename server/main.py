@@ -7,16 +7,22 @@ Now includes official MCP SDK integration for spec-compliant clients.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, AsyncIterator
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import Body, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, Field, ValidationError
 
 from server.tools.aks_arc_validate import AksArcValidateTool
 from server.tools.aksarc_logs_tool import AksArcLogsTool
@@ -25,7 +31,28 @@ from server.tools.arc_connectivity_check import ArcConnectivityCheckTool
 from server.tools.azlocal_tsg_tool import AzLocalTsgTool
 from server.tools.diagnostics_bundle import DiagnosticsBundleTool
 from server.tools.educational_tool import ArcOpsEducationalTool
-from server.api_routes import router as api_router
+from server import azure_client
+from server.azure_context import AzureContext, run_async
+from server.api_routes import _load_endpoints_config, router as api_router
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=str, option=option)
+
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+        return json.dumps(obj, default=str, indent=2 if indent else None).encode()
+
 
 # Configure logging
 logging.basicConfig(
@@ -34,6 +61,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Development mode (ARCOPS_DEV=1): auto-reload, error details in responses, live manifest edits
+DEV_MODE = os.getenv("ARCOPS_DEV") == "1"
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Load the manifest up front and release shared connections on shutdown."""
+    _manifest_bytes()
+    yield
+    await azure_client.aclose()
+
+
 # FastAPI app
 app = FastAPI(
     title="ArcOps MCP Server",
@@ -41,6 +80,7 @@ app = FastAPI(
     version="0.2.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware for UI access
@@ -100,17 +140,38 @@ TOOL_REGISTRY: dict[str, Any] = {
     "arcops.diagnostics.bundle": DiagnosticsBundleTool(),  # Diagnostic bundle
     "arcops.explain": ArcOpsEducationalTool(),  # Educational content
 }
+# Interned keys, so lookups with names interned elsewhere (e.g. literals) match on identity
+TOOL_REGISTRY = {sys.intern(name): tool for name, tool in TOOL_REGISTRY.items()}
+
+
+MANIFEST_PATH = Path(__file__).parent / "mcp_manifest.json"
+
+# (manifest file mtime, encoded manifest) - loaded at startup; in development mode
+# the file is re-read when it changes
+_manifest_cache: tuple[float, bytes] | None = None
 
 
 def load_mcp_manifest() -> dict[str, Any]:
     """Load the MCP manifest from JSON file."""
-    manifest_path = Path(__file__).parent / "mcp_manifest.json"
-    if manifest_path.exists():
-        with open(manifest_path, "r", encoding="utf-8") as f:
-            return json.load(f)  # type: ignore[no-any-return]
+    if MANIFEST_PATH.exists():
+        return _json_loads(MANIFEST_PATH.read_bytes())  # type: ignore[no-any-return]
     return {"tools": [], "schemas": {}}
 
 
+def _manifest_bytes() -> bytes:
+    """Return the JSON-encoded manifest, reloading it if the file was modified."""
+    global _manifest_cache
+    if _manifest_cache is not None and not DEV_MODE:
+        return _manifest_cache[1]
+    try:
+        mtime = MANIFEST_PATH.stat().st_mtime
+    except OSError:
+        mtime = -1.0
+    if _manifest_cache is None or _manifest_cache[0] != mtime:
+        _manifest_cache = (mtime, _json_dumps(load_mcp_manifest()))
+    return _manifest_cache[1]
+
+
 @app.get("/")
 async def root() -> dict[str, str]:
     """Root endpoint with server info."""
@@ -130,9 +191,9 @@ async def health() -> dict[str, str]:
 
 
 @app.get("/mcp/manifest")
-async def get_manifest() -> dict[str, Any]:
+async def get_manifest() -> Response:
     """Return the MCP manifest with available tools and schemas."""
-    return load_mcp_manifest()
+    return Response(content=_manifest_bytes(), media_type="application/json")
 
 
 @app.get("/mcp/tools")
@@ -174,11 +235,86 @@ MCP_SERVER_INFO = {
 }
 
 
+def _tool_definition(name: str, tool: Any) -> dict[str, Any]:
+    """Describe a tool in MCP tools/list format."""
+    tool_def = {
+        "name": name,
+        "description": tool.description,
+        "inputSchema": tool.input_schema,
+    }
+    # Add output schema if available
+    if getattr(tool, "output_schema", None):
+        tool_def["outputSchema"] = tool.output_schema
+    return tool_def
+
+
+# The tool registry, resources and prompts are fixed, so their list results are built once
+_TOOLS_LIST_RESULT: dict[str, Any] = {
+    "tools": [_tool_definition(name, tool) for name, tool in TOOL_REGISTRY.items()]
+}
+_RESOURCES_LIST_RESULT: dict[str, Any] = {
+    "resources": [
+        {
+            "uri": "arcops://tools",
+            "name": "Available Tools",
+            "description": "List of all ArcOps diagnostic tools",
+            "mimeType": "application/json",
+        },
+        {
+            "uri": "arcops://endpoints",
+            "name": "Monitored Endpoints",
+            "description": "Azure endpoints checked by connectivity validation",
+            "mimeType": "application/json",
+        },
+        {
+            "uri": "arcops://cluster/status",
+            "name": "Cluster Status",
+            "description": "Real-time status of connected AKS Arc clusters (requires az CLI)",
+            "mimeType": "application/json",
+        },
+    ]
+}
+_PROMPTS_LIST_RESULT: dict[str, Any] = {
+    "prompts": [
+        {
+            "name": "troubleshoot_connectivity",
+            "description": "Step-by-step guide for diagnosing Azure connectivity issues",
+            "arguments": [],
+        },
+        {
+            "name": "create_support_case",
+            "description": "Gather information needed for a Microsoft support case",
+            "arguments": [
+                {
+                    "name": "issue_description",
+                    "description": "Brief description of the issue",
+                    "required": True,
+                }
+            ],
+        },
+    ]
+}
+
+
+# Largest JSON-RPC batch accepted in one POST
+MAX_BATCH = 64
+
+
+def _rpc_error(request_id: int | str | None, code: int, message: str) -> dict[str, Any]:
+    """Build a JSON-RPC 2.0 error response."""
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
 @app.post("/mcp/rpc")
-async def mcp_rpc(request: JsonRpcRequest) -> dict[str, Any]:
+async def mcp_rpc(
+    payload: JsonRpcRequest | list[Any] = Body(...),
+) -> dict[str, Any] | list[dict[str, Any]]:
     """
     MCP-compliant JSON-RPC 2.0 endpoint.
 
+    Accepts a single request or a batch (array) of up to ``MAX_BATCH``
+    requests; batch entries are dispatched concurrently and answered in order.
+
     Supports:
     - initialize: Capability negotiation
     - tools/list: List available tools with schemas
@@ -186,6 +322,26 @@ async def mcp_rpc(request: JsonRpcRequest) -> dict[str, Any]:
     - resources/list: List available resources
     - prompts/list: List available prompts
     """
+    if isinstance(payload, JsonRpcRequest):
+        return await _dispatch_rpc(payload)
+
+    if not payload:
+        return _rpc_error(None, -32600, "Invalid Request: empty batch")
+    if len(payload) > MAX_BATCH:
+        return _rpc_error(None, -32600, f"Invalid Request: batch exceeds {MAX_BATCH} entries")
+
+    async def dispatch(entry: Any) -> dict[str, Any]:
+        try:
+            request = JsonRpcRequest.model_validate(entry)
+        except ValidationError:
+            return _rpc_error(None, -32600, "Invalid Request")
+        return await _dispatch_rpc(request)
+
+    return list(await asyncio.gather(*(dispatch(entry) for entry in payload)))
+
+
+async def _dispatch_rpc(request: JsonRpcRequest) -> dict[str, Any]:
+    """Handle one JSON-RPC request."""
     response_base = {"jsonrpc": "2.0", "id": request.id}
 
     # MCP Initialize - capability negotiation
@@ -203,19 +359,7 @@ async def mcp_rpc(request: JsonRpcRequest) -> dict[str, Any]:
         }
 
     if request.method == "tools/list":
-        # Return tools in MCP format with output schemas
-        tools_list = []
-        for name, tool in TOOL_REGISTRY.items():
-            tool_def = {
-                "name": name,
-                "description": tool.description,
-                "inputSchema": tool.input_schema,
-            }
-            # Add output schema if available
-            if hasattr(tool, "output_schema") and tool.output_schema:
-                tool_def["outputSchema"] = tool.output_schema
-            tools_list.append(tool_def)
-        return {**response_base, "result": {"tools": tools_list}}
+        return {**response_base, "result": _TOOLS_LIST_RESULT}
 
     elif request.method == "tools/call":
         tool_name = request.params.get("name")
@@ -233,14 +377,15 @@ async def mcp_rpc(request: JsonRpcRequest) -> dict[str, Any]:
         tool = TOOL_REGISTRY[tool_name]
         try:
             result = await tool.execute(arguments)
-            return {
-                **response_base,
-                "result": {
-                    "content": [{"type": "text", "text": json.dumps(result)}],
-                    "structuredContent": result,
-                    "isError": False,
-                },
+            tool_result: dict[str, Any] = {
+                "content": [{"type": "text", "text": _json_dumps(result).decode()}],
+                "isError": False,
             }
+            # structuredContent repeats the result; clients that only read the text can
+            # pass includeStructured=false so large results aren't encoded twice
+            if request.params.get("includeStructured", True):
+                tool_result["structuredContent"] = result
+            return {**response_base, "result": tool_result}
         except Exception as e:
             return {
                 **response_base,
@@ -251,28 +396,7 @@ async def mcp_rpc(request: JsonRpcRequest) -> dict[str, Any]:
             }
 
     elif request.method == "resources/list":
-        # Return available MCP resources
-        resources = [
-            {
-                "uri": "arcops://tools",
-                "name": "Available Tools",
-                "description": "List of all ArcOps diagnostic tools",
-                "mimeType": "application/json",
-            },
-            {
-                "uri": "arcops://endpoints",
-                "name": "Monitored Endpoints",
-                "description": "Azure endpoints checked by connectivity validation",
-                "mimeType": "application/json",
-            },
-            {
-                "uri": "arcops://cluster/status",
-                "name": "Cluster Status",
-                "description": "Real-time status of connected AKS Arc clusters (requires az CLI)",
-                "mimeType": "application/json",
-            },
-        ]
-        return {**response_base, "result": {"resources": resources}}
+        return {**response_base, "result": _RESOURCES_LIST_RESULT}
 
     elif request.method == "resources/read":
         uri = request.params.get("uri", "")
@@ -284,109 +408,95 @@ async def mcp_rpc(request: JsonRpcRequest) -> dict[str, Any]:
                     {
                         "uri": uri,
                         "mimeType": "application/json",
-                        "text": json.dumps(content, indent=2),
+                        "text": _json_dumps(content, indent=True).decode(),
                     }
                 ]
             },
         }
 
     elif request.method == "prompts/list":
-        # Return available prompts
-        prompts = [
-            {
-                "name": "troubleshoot_connectivity",
-                "description": "Step-by-step guide for diagnosing Azure connectivity issues",
-                "arguments": [],
-            },
-            {
-                "name": "create_support_case",
-                "description": "Gather information needed for a Microsoft support case",
-                "arguments": [
-                    {
-                        "name": "issue_description",
-                        "description": "Brief description of the issue",
-                        "required": True,
-                    }
-                ],
-            },
-        ]
-        return {**response_base, "result": {"prompts": prompts}}
+        return {**response_base, "result": _PROMPTS_LIST_RESULT}
 
     else:
-        return {
-            **response_base,
-            "error": {
-                "code": -32601,
-                "message": f"Method not found: {request.method}",
-            },
-        }
+        return _rpc_error(request.id, -32601, f"Method not found: {request.method}")
 
 
 async def _read_resource(uri: str) -> dict[str, Any]:
     """Read an MCP resource by URI."""
-    import subprocess
-    import yaml
-
     if uri == "arcops://tools":
         return {name: tool.description for name, tool in TOOL_REGISTRY.items()}
 
     elif uri == "arcops://endpoints":
-        config_path = Path(__file__).parent / "config" / "endpoints.yaml"
-        if config_path.exists():
-            with open(config_path) as f:
-                config = yaml.safe_load(f)
-                return {
-                    "endpoints": config.get("endpoints", []),
-                    "count": len(config.get("endpoints", [])),
-                }
-        return {"endpoints": [], "count": 0, "error": "Config not found"}
-
-    elif uri == "arcops://cluster/status":
-        # REAL: Get actual cluster status from Azure CLI
+        # Parsed once (libyaml when available) and shared with /api/endpoints
         try:
-            result = subprocess.run(
-                ["az", "connectedk8s", "list", "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-            if result.returncode == 0:
-                clusters = json.loads(result.stdout)
-                return {
-                    "source": "azure_cli",
-                    "clusterCount": len(clusters),
-                    "clusters": [
-                        {
-                            "name": c.get("name"),
-                            "resourceGroup": c.get("resourceGroup"),
-                            "connectivityStatus": c.get("connectivityStatus"),
-                            "provisioningState": c.get("provisioningState"),
-                            "kubernetesVersion": c.get("kubernetesVersion"),
-                        }
-                        for c in clusters
-                    ],
-                }
-            else:
-                return {
-                    "source": "azure_cli",
-                    "error": "az connectedk8s list failed",
-                    "stderr": result.stderr[:500],
-                    "hint": "Ensure az CLI is installed and authenticated (az login)",
-                }
+            endpoints = _load_endpoints_config()["endpoints"]
         except FileNotFoundError:
+            return {"endpoints": [], "count": 0, "error": "Config not found"}
+        return {"endpoints": endpoints, "count": len(endpoints)}
+
+    elif uri == "arcops://cluster/status":
+        return await _cluster_status()
+
+
+# Polling clients re-read the cluster status resource; a successful listing is
+# reused for this many seconds
+CLUSTER_STATUS_TTL = 10.0
+
+_cluster_status_cache: tuple[float, dict[str, Any]] | None = None
+
+
+async def _cluster_status() -> dict[str, Any]:
+    """Summarise Arc-connected clusters from ``az connectedk8s list``."""
+    global _cluster_status_cache
+    if _cluster_status_cache and time.monotonic() - _cluster_status_cache[0] < CLUSTER_STATUS_TTL:
+        return _cluster_status_cache[1]
+
+    # REAL: Get actual cluster status from Azure CLI, without blocking the event loop
+    try:
+        result = await run_async(
+            [AzureContext.find_az_cli() or "az", "connectedk8s", "list", "-o", "json"],
+            timeout=60,
+            text=True,
+        )
+        if result.returncode == 0:
+            clusters = _json_loads(result.stdout)
+            status = {
+                "source": "azure_cli",
+                "clusterCount": len(clusters),
+                "clusters": [
+                    {
+                        "name": c.get("name"),
+                        "resourceGroup": c.get("resourceGroup"),
+                        "connectivityStatus": c.get("connectivityStatus"),
+                        "provisioningState": c.get("provisioningState"),
+                        "kubernetesVersion": c.get("kubernetesVersion"),
+                    }
+                    for c in clusters
+                ],
+            }
+            _cluster_status_cache = (time.monotonic(), status)
+            return status
+        else:
             return {
                 "source": "azure_cli",
-                "error": "Azure CLI (az) not found",
-                "hint": "Install: https://docs.microsoft.com/cli/azure/install-azure-cli",
+                "error": "az connectedk8s list failed",
+                "stderr": result.stderr[:500],
+                "hint": "Ensure az CLI is installed and authenticated (az login)",
             }
-        except subprocess.TimeoutExpired:
-            return {"source": "azure_cli", "error": "Command timed out"}
-        except Exception as e:
-            return {"source": "azure_cli", "error": str(e)}
+    except FileNotFoundError:
+        return {
+            "source": "azure_cli",
+            "error": "Azure CLI (az) not found",
+            "hint": "Install: https://docs.microsoft.com/cli/azure/install-azure-cli",
+        }
+    except subprocess.TimeoutExpired:
+        return {"source": "azure_cli", "error": "Command timed out"}
+    except Exception as e:
+        return {"source": "azure_cli", "error": str(e)}
 
 
-@app.post("/mcp/tools/{tool_name}")
-async def invoke_tool(tool_name: str, request: ToolRequest) -> ToolResponse:
+@app.post("/mcp/tools/{tool_name}", response_model=ToolResponse)
+async def invoke_tool(tool_name: str, request: ToolRequest) -> Response:
     """
     Invoke an MCP tool by name.
 
@@ -397,21 +507,26 @@ async def invoke_tool(tool_name: str, request: ToolRequest) -> ToolResponse:
     Returns:
         ToolResponse with findings or error
     """
-    if tool_name not in TOOL_REGISTRY:
+    tool = TOOL_REGISTRY.get(tool_name)
+    if tool is None:
         raise HTTPException(
             status_code=404,
             detail=f"Tool '{tool_name}' not found. Available: {list(TOOL_REGISTRY.keys())}",
         )
 
-    tool = TOOL_REGISTRY[tool_name]
-    logger.info("Invoking tool: %s with args: %s", tool_name, request.arguments)
+    logger.info("Invoking tool: %s", tool_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Tool %s arguments: %s", tool_name, _json_dumps(request.arguments).decode())
 
+    # The body is built from our own tool output, so it's encoded directly rather
+    # than validated and re-encoded through ToolResponse (kept for the OpenAPI schema)
     try:
         result = await tool.execute(request.arguments)
-        return ToolResponse(success=True, result=result)
+        content = _json_dumps({"success": True, "result": result, "error": None})
     except Exception as e:
         logger.exception("Tool '%s' failed", tool_name)
-        return ToolResponse(success=False, error=str(e))
+        content = _json_dumps({"success": False, "result": None, "error": str(e)})
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/mcp/tools/{tool_name}/schema")
@@ -429,24 +544,79 @@ async def get_tool_schema(tool_name: str) -> dict[str, Any]:
     }
 
 
+# Unhandled-error logging is rate limited (token bucket) so an error storm can't
+# flood the log; tracebacks are only rendered at DEBUG
+ERROR_LOG_BURST = 10
+ERROR_LOG_PER_SECOND = 1.0
+
+_error_log_bucket = [float(ERROR_LOG_BURST), time.monotonic()]  # [tokens, last refill]
+_errors_suppressed = 0
+
+
+def _error_log_allowed() -> bool:
+    """Take a token from the error-log bucket, if one is available."""
+    now = time.monotonic()
+    tokens = min(
+        ERROR_LOG_BURST, _error_log_bucket[0] + (now - _error_log_bucket[1]) * ERROR_LOG_PER_SECOND
+    )
+    _error_log_bucket[1] = now
+    if tokens < 1:
+        _error_log_bucket[0] = tokens
+        return False
+    _error_log_bucket[0] = tokens - 1
+    return True
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    """Global exception handler for unhandled errors."""
-    logger.exception("Unhandled exception: %s", exc)
-    return JSONResponse(
-        status_code=500,
-        content={"detail": "Internal server error", "error": str(exc)},
-    )
+    """Global exception handler for unhandled errors.
+
+    The exception text is only returned to clients with ``ARCOPS_DEV=1``.
+    """
+    global _errors_suppressed
+    if _error_log_allowed():
+        logger.error(
+            "Unhandled exception on %s: %r (%d similar suppressed)",
+            request.url.path,
+            exc,
+            _errors_suppressed,
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        _errors_suppressed = 0
+    else:
+        _errors_suppressed += 1
+
+    content = {"detail": "Internal server error"}
+    if DEV_MODE:
+        content["error"] = str(exc)
+    return JSONResponse(status_code=500, content=content)
 
 
 def main() -> None:
-    """Run the MCP server."""
+    """Run the MCP server.
+
+    Auto-reload and INFO logging are only enabled with ``ARCOPS_DEV=1``;
+    ``ARCOPS_WORKERS`` (or ``WEB_CONCURRENCY``) sets the worker count otherwise.
+
+    On Windows, uvicorn runs reload and multi-worker servers on a SelectorEventLoop,
+    which can't spawn subprocesses: one-shot commands fall back to threads (see
+    ``run_async``) but the streaming cluster listing and connectivity progress
+    endpoints fail, so keep a single worker there if you use them.
+    """
     uvicorn.run(
         "server.main:app",
         host="0.0.0.0",
         port=8080,
-        reload=True,
-        log_level="info",
+        reload=DEV_MODE,
+        workers=(
+            None
+            if DEV_MODE
+            else int(os.getenv("ARCOPS_WORKERS") or os.getenv("WEB_CONCURRENCY") or "1")
+        ),
+        # uvloop is picked automatically where installed; it doesn't support Windows
+        loop="auto",
+        http="httptools",
+        log_level="info" if DEV_MODE else "warning",
     )
 
 
@@ -7,10 +7,14 @@ Simple, reliable server for the ArcOps UI.
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from server import chat_service
+
 # Use the clean API routes
 from server.api_routes_clean import router as api_router
 
@@ -21,6 +25,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Release shared connections on shutdown."""
+    yield
+    await chat_service.aclose()
+
+
 # FastAPI app
 app = FastAPI(
     title="ArcOps MCP Server",
@@ -28,6 +40,7 @@ app = FastAPI(
     version="0.3.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware for UI access
@@ -69,4 +82,7 @@ async def health():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8081)
+    # Chat sessions and reply caches are per process, so stay on one worker; "auto"
+    # runs the loop on uvloop when installed (perf extra, not on Windows). httptools
+    # comes with uvicorn[standard].
+    uvicorn.run(app, host="0.0.0.0", port=8081, workers=1, loop="auto", http="httptools")
@@ -685,25 +685,37 @@ def create_support_case_prompt() -> str:
 # =============================================================================
 
 
-def run_sse():
-    """Run MCP server with SSE transport (for web clients)."""
+def _run(coro: Any) -> None:
+    """Run ``coro`` on uvloop when it is installed, else on the default asyncio loop.
+
+    uvicorn picks uvloop by itself for ``server.main``; these transports start
+    their own loop, so they have to ask for it.
+    """
     import asyncio
 
-    asyncio.run(mcp.run_sse_async())
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - optional speedup (not available on Windows)
+        asyncio.run(coro)
+        return
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(coro)
+
+
+def run_sse():
+    """Run MCP server with SSE transport (for web clients)."""
+    _run(mcp.run_sse_async())
 
 
 def run_stdio():
     """Run MCP server with stdio transport (for CLI tools like Claude Desktop)."""
-    import asyncio
-
-    asyncio.run(mcp.run_stdio_async())
+    _run(mcp.run_stdio_async())
 
 
 def run_http():
     """Run MCP server with streamable HTTP transport."""
-    import asyncio
-
-    asyncio.run(mcp.run_streamable_http_async())
+    _run(mcp.run_streamable_http_async())
 
 
 # Expose the MCP app for ASGI mounting
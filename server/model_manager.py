@@ -134,7 +134,7 @@ class ModelManager:
             )
 
             if result.returncode != 0:
-                logger.error(f"foundry model list failed: {result.stderr}")
+                logger.error("foundry model list failed: %s", result.stderr)
                 return {}
 
             return self._parse_model_list(result.stdout)
@@ -143,7 +143,7 @@ class ModelManager:
             logger.error("Foundry CLI not found")
             return {}
         except Exception as e:
-            logger.error(f"Failed to list models: {e}")
+            logger.error("Failed to list models: %s", e)
             return {}
 
     def _parse_model_list(self, output: str) -> dict[str, dict]:
@@ -245,7 +245,7 @@ class ModelManager:
                                 break
 
         except Exception as e:
-            logger.error(f"Failed to get downloaded models: {e}")
+            logger.error("Failed to get downloaded models: %s", e)
 
         return downloaded
 
@@ -271,7 +271,7 @@ class ModelManager:
                 self._current_model_id = model_id  # Store the full model ID for API calls
                 return alias
         except Exception as e:
-            logger.debug(f"FoundryLocalManager check failed: {e}")
+            logger.debug("FoundryLocalManager check failed: %s", e)
 
         return None
 
@@ -285,7 +285,7 @@ class ModelManager:
         Returns:
             Dictionary with success status and endpoint
         """
-        logger.info(f"Starting model: {alias}")
+        logger.info("Starting model: %s", alias)
 
         try:
             # Use foundry-local-python for proper model management
@@ -305,7 +305,7 @@ class ModelManager:
             }
 
         except Exception as e:
-            logger.error(f"Failed to start model {alias}: {e}")
+            logger.error("Failed to start model %s: %s", alias, e)
             return {
                 "success": False,
                 "error": str(e),
@@ -325,7 +325,7 @@ class ModelManager:
             return {"success": True, "message": "Model stopped"}
 
         except Exception as e:
-            logger.error(f"Failed to stop model: {e}")
+            logger.error("Failed to stop model: %s", e)
             return {"success": False, "error": str(e)}
 
     def get_status(self) -> dict[str, Any]:
@@ -14,10 +14,17 @@ import os
 import subprocess
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from server.azure_context import run_async
 from server.tools.base import BaseTool
 
+_json_loads: Callable[[str | bytes], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -51,12 +58,12 @@ class AksArcValidateTool(BaseTool):
     }
 
     # Expected Arc extensions
-    EXPECTED_EXTENSIONS = [
+    EXPECTED_EXTENSIONS = (
         "microsoft.azuremonitor.containers",
         "microsoft.arc.containerstorage",
         "microsoft.flux",
         "microsoft.azure.policy",
-    ]
+    )
 
     async def execute(self, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute AKS Arc validation checks."""
@@ -187,17 +194,18 @@ class AksArcValidateTool(BaseTool):
         # 1. Get Kubernetes version
         try:
             cmd = kubectl_base + ["version", "-o", "json"]
-            logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running: %s", " ".join(cmd))
+            result = await run_async(cmd, timeout=30)
 
             if result.returncode == 0:
-                version_data = json.loads(result.stdout)
+                version_data = _json_loads(result.stdout)
                 server_version = version_data.get("serverVersion", {})
                 cluster_data["versions"]["kubernetes"] = server_version.get(
                     "gitVersion", "unknown"
                 ).lstrip("v")
             else:
-                logger.warning("kubectl version failed: %s", result.stderr)
+                logger.warning("kubectl version failed: %s", result.stderr.decode(errors="replace"))
                 cluster_data["versions"]["kubernetes"] = "unknown"
         except Exception as e:
             logger.error("Failed to get kubernetes version: %s", e)
@@ -206,11 +214,12 @@ class AksArcValidateTool(BaseTool):
         # 2. Get CNI configuration from kube-system pods
         try:
             cmd = kubectl_base + ["get", "pods", "-n", "kube-system", "-o", "json"]
-            logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running: %s", " ".join(cmd))
+            result = await run_async(cmd, timeout=30)
 
             if result.returncode == 0:
-                pods_data = json.loads(result.stdout)
+                pods_data = _json_loads(result.stdout)
                 cni_plugin = "unknown"
 
                 for pod in pods_data.get("items", []):
@@ -236,11 +245,12 @@ class AksArcValidateTool(BaseTool):
         # 3. Get Arc agent info from azure-arc namespace
         try:
             cmd = kubectl_base + ["get", "pods", "-n", "azure-arc", "-o", "json"]
-            logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running: %s", " ".join(cmd))
+            result = await run_async(cmd, timeout=30)
 
             if result.returncode == 0:
-                pods_data = json.loads(result.stdout)
+                pods_data = _json_loads(result.stdout)
                 for pod in pods_data.get("items", []):
                     containers = pod.get("spec", {}).get("containers", [])
                     for container in containers:
@@ -252,7 +262,9 @@ class AksArcValidateTool(BaseTool):
                                 cluster_data["versions"]["arcAgent"] = version
                                 break
             else:
-                logger.warning("No azure-arc namespace or pods: %s", result.stderr)
+                logger.warning(
+                    "No azure-arc namespace or pods: %s", result.stderr.decode(errors="replace")
+                )
         except Exception as e:
             logger.error("Failed to get Arc agent version: %s", e)
 
@@ -268,13 +280,13 @@ class AksArcValidateTool(BaseTool):
                 "-o",
                 "json",
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = await run_async(cmd, timeout=30)
 
             cluster_name = None
             resource_group = None
 
             if result.returncode == 0:
-                config_data = json.loads(result.stdout)
+                config_data = _json_loads(result.stdout)
                 data = config_data.get("data", {})
                 cluster_name = data.get("AZURE_RESOURCE_NAME")
                 resource_group = data.get("AZURE_RESOURCE_GROUP")
@@ -296,10 +308,10 @@ class AksArcValidateTool(BaseTool):
         # 5. Check for Flux GitOps
         try:
             cmd = kubectl_base + ["get", "pods", "-n", "flux-system", "-o", "json"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = await run_async(cmd, timeout=30)
 
             if result.returncode == 0:
-                pods_data = json.loads(result.stdout)
+                pods_data = _json_loads(result.stdout)
                 flux_pods = pods_data.get("items", [])
 
                 cluster_data["flux"]["installed"] = len(flux_pods) > 0
@@ -316,14 +328,14 @@ class AksArcValidateTool(BaseTool):
 
                 # Count GitRepositories
                 cmd_repos = kubectl_base + ["get", "gitrepositories", "-A", "--no-headers"]
-                result_repos = subprocess.run(cmd_repos, capture_output=True, text=True, timeout=30)
+                result_repos = await run_async(cmd_repos, timeout=30, text=True)
                 if result_repos.returncode == 0:
                     repos = [line for line in result_repos.stdout.strip().split("\n") if line]
                     cluster_data["flux"]["gitRepositories"] = len(repos)
 
                 # Count Kustomizations
                 cmd_kust = kubectl_base + ["get", "kustomizations", "-A", "--no-headers"]
-                result_kust = subprocess.run(cmd_kust, capture_output=True, text=True, timeout=30)
+                result_kust = await run_async(cmd_kust, timeout=30, text=True)
                 if result_kust.returncode == 0:
                     kusts = [line for line in result_kust.stdout.strip().split("\n") if line]
                     cluster_data["flux"]["kustomizations"] = len(kusts)
@@ -358,18 +370,21 @@ class AksArcValidateTool(BaseTool):
         Uses az connectedk8s list to get actual cluster inventory.
         """
         try:
-            cmd = ["az", "connectedk8s", "list", "-o", "json"]
+            cmd = ["az", "connectedk8s", "list", "-o", "json", "--only-show-errors"]
             if subscription:
                 cmd.extend(["--subscription", subscription])
 
-            logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running: %s", " ".join(cmd))
+            result = await run_async(cmd, timeout=60)
 
             if result.returncode != 0:
-                logger.error("az connectedk8s list failed: %s", result.stderr)
+                logger.error(
+                    "az connectedk8s list failed: %s", result.stderr.decode(errors="replace")
+                )
                 return []
 
-            clusters = json.loads(result.stdout)
+            clusters = _json_loads(result.stdout)
             logger.info("Found %d connected clusters", len(clusters))
             return clusters
 
@@ -400,16 +415,22 @@ class AksArcValidateTool(BaseTool):
                 "connectedClusters",
                 "-o",
                 "json",
+                "--only-show-errors",
             ]
 
-            logger.info("Running: %s", " ".join(cmd))
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Running: %s", " ".join(cmd))
+            result = await run_async(cmd, timeout=60)
 
             if result.returncode != 0:
-                logger.warning("Failed to get extensions for %s: %s", cluster_name, result.stderr)
+                logger.warning(
+                    "Failed to get extensions for %s: %s",
+                    cluster_name,
+                    result.stderr.decode(errors="replace"),
+                )
                 return []
 
-            return json.loads(result.stdout)
+            return _json_loads(result.stdout)
 
         except Exception as e:
             logger.error("Error getting extensions for %s: %s", cluster_name, e)
@@ -420,14 +441,17 @@ class AksArcValidateTool(BaseTool):
     ) -> None:
         """Check Arc extension presence and health."""
         start_time = time.time()
-        extensions = cluster_data.get("extensions", [])
-        extension_names = {ext.get("name") for ext in extensions}
+        # First entry per name, so each expected extension is a single lookup
+        extensions_by_name: dict[str | None, dict[str, Any]] = {}
+        for ext in cluster_data.get("extensions", []):
+            extensions_by_name.setdefault(ext.get("name"), ext)
 
         # Check for expected extensions
         for expected in self.EXPECTED_EXTENSIONS:
             check_id = f"aks.arc.extension.{expected.replace('.', '_')}"
 
-            if expected not in extension_names:
+            ext_data = extensions_by_name.get(expected)
+            if ext_data is None:
                 self.add_check(
                     findings,
                     check_id=check_id,
@@ -443,8 +467,6 @@ class AksArcValidateTool(BaseTool):
                     duration_ms=int((time.time() - start_time) * 1000),
                 )
             else:
-                # Find extension details
-                ext_data = next((e for e in extensions if e.get("name") == expected), {})
                 healthy = ext_data.get("healthy", True)
 
                 self.add_check(
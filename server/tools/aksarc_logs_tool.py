@@ -10,6 +10,7 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import shutil
@@ -18,6 +19,7 @@ import time
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
+from server.azure_context import run_async
 from server.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -95,7 +97,7 @@ class AksArcLogsTool(BaseTool):
             )
 
         # Check if az aksarc extension is available
-        cli_info = self._check_az_aksarc_available()
+        cli_info = await asyncio.to_thread(self._check_az_aksarc_available)
 
         if dry_run:
             return await self._run_dry_run(
@@ -206,14 +208,14 @@ class AksArcLogsTool(BaseTool):
 
         cmd.extend(["--out-dir", out_dir])
 
-        logger.info("Running: %s", " ".join(cmd))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Running: %s", " ".join(cmd))
 
         try:
-            result = subprocess.run(
+            result = await run_async(
                 cmd,
-                capture_output=True,
-                text=True,
                 timeout=600,  # 10 minutes for log collection
+                text=True,
             )
 
             duration_ms = int((time.time() - start_time) * 1000)
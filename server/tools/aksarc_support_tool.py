@@ -11,6 +11,7 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import subprocess
@@ -18,6 +19,7 @@ import time
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
+from server.azure_context import run_async
 from server.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -83,7 +85,7 @@ class AksArcSupportTool(BaseTool):
             )
 
         # Check if module is installed
-        module_info = self._check_module_installed()
+        module_info = await asyncio.to_thread(self._check_module_installed)
         findings["metadata"]["module"] = module_info
 
         if dry_run:
@@ -173,11 +175,10 @@ class AksArcSupportTool(BaseTool):
             $results | ConvertTo-Json -Depth 10
             """
 
-            result = subprocess.run(
+            result = await run_async(
                 ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_cmd],
-                capture_output=True,
-                text=True,
                 timeout=300,
+                text=True,
             )
 
             if result.returncode == 0 and result.stdout.strip():
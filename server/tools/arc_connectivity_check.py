@@ -19,13 +19,12 @@ import ssl
 import subprocess
 import time
 from pathlib import Path
-from queue import Queue, Empty
-from threading import Thread
 from typing import Any, Callable, Coroutine
 
 import httpx
 import yaml
 
+from server.azure_context import run_async
 from server.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -166,7 +165,17 @@ class ArcConnectivityCheckTool(BaseTool):
             install_result = await self._install_environment_checker()
             findings["metadata"]["installAttempt"] = install_result
             if install_result["success"]:
-                checker_info = await self._detect_environment_checker()
+                # The install script reports the module it verified, so only
+                # fall back to a fresh detection pass if that was unparseable
+                module_path = (install_result.get("module") or {}).get("Path")
+                if module_path:
+                    checker_info = {
+                        "installed": True,
+                        "path": module_path,
+                        "source": "powershell-module",
+                    }
+                else:
+                    checker_info = await self._detect_environment_checker()
                 findings["metadata"]["environmentChecker"] = checker_info
 
         # Step 3: Load endpoints
@@ -240,15 +249,14 @@ class ArcConnectivityCheckTool(BaseTool):
 
         # Check if PowerShell module is available
         try:
-            result = subprocess.run(
+            result = await run_async(
                 [
                     "powershell",
                     "-Command",
                     "Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object -ExpandProperty Path",
                 ],
-                capture_output=True,
-                text=True,
                 timeout=30,
+                text=True,
             )
             if result.returncode == 0 and result.stdout.strip():
                 return {
@@ -278,26 +286,38 @@ class ArcConnectivityCheckTool(BaseTool):
                 "Bypass",
                 "-Command",
                 """
+                $module = Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object -First 1 Name, Version, Path
+                if ($module) {
+                    Write-Host "ALREADY_INSTALLED"
+                    $module | ConvertTo-Json
+                    exit 0
+                }
                 Set-PSRepository -Name PSGallery -InstallationPolicy Trusted -ErrorAction SilentlyContinue
                 Install-Module -Name AzStackHci.EnvironmentChecker -Force -AllowClobber -Scope CurrentUser
-                Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object Name, Version, Path | ConvertTo-Json
+                Get-Module -ListAvailable AzStackHci.EnvironmentChecker | Select-Object -First 1 Name, Version, Path | ConvertTo-Json
                 """,
             ]
 
-            result = subprocess.run(
+            result = await run_async(
                 install_cmd,
-                capture_output=True,
-                text=True,
                 timeout=300,  # 5 minutes for install
+                text=True,
             )
 
             if result.returncode == 0:
+                stdout = result.stdout.strip()
+                already_installed = stdout.startswith("ALREADY_INSTALLED")
                 try:
-                    module_info = json.loads(result.stdout.strip())
+                    module_info = json.loads(stdout.removeprefix("ALREADY_INSTALLED"))
                     return {
                         "success": True,
+                        "alreadyInstalled": already_installed,
                         "module": module_info,
-                        "message": "Environment Checker installed successfully",
+                        "message": (
+                            "Environment Checker already installed"
+                            if already_installed
+                            else "Environment Checker installed successfully"
+                        ),
                     }
                 except json.JSONDecodeError:
                     return {
@@ -420,38 +440,25 @@ class ArcConnectivityCheckTool(BaseTool):
 
             # Run with streaming if callback provided
             if progress_callback:
-                # Use Popen for streaming
-                process = subprocess.Popen(
-                    ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_cmd],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
+                # Stream stderr for progress while stdout is collected alongside it
+                process = await asyncio.create_subprocess_exec(
+                    "powershell",
+                    "-ExecutionPolicy",
+                    "Bypass",
+                    "-Command",
+                    ps_cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
                 )
+                assert process.stdout is not None and process.stderr is not None
+                stdout_task = asyncio.create_task(process.stdout.read())
 
-                stdout_lines: list[str] = []
                 stderr_lines: list[str] = []
                 check_count = 0
 
-                # Thread-safe queue for stderr
-                stderr_queue: Queue[str | None] = Queue()
-
-                def read_stderr() -> None:
-                    if process.stderr:
-                        for line in process.stderr:
-                            stderr_queue.put(line)
-                    stderr_queue.put(None)  # Signal done
-
-                stderr_thread = Thread(target=read_stderr)
-                stderr_thread.start()
-
-                # Process stderr in async loop
-                while True:
-                    try:
-                        line = stderr_queue.get_nowait()
-                        if line is None:
-                            break
-                        line = line.strip()
+                try:
+                    async for raw_line in process.stderr:
+                        line = raw_line.decode(errors="replace").strip()
                         stderr_lines.append(line)
 
                         # Parse progress from verbose output
@@ -473,36 +480,23 @@ class ArcConnectivityCheckTool(BaseTool):
                                     "checksProcessed": check_count,
                                 }
                             )
-                    except Empty:
-                        await asyncio.sleep(0.1)
-                        if process.poll() is not None:
-                            # Process finished, drain remaining
-                            while True:
-                                try:
-                                    remaining = stderr_queue.get_nowait()
-                                    if remaining is None:
-                                        break
-                                    stderr_lines.append(remaining.strip())
-                                except Empty:
-                                    break
-                            break
-
-                stderr_thread.join(timeout=5)
-                stdout_data = process.stdout.read() if process.stdout else ""
-                process.wait(timeout=30)
-
-                return_code = process.returncode
+
+                    stdout_data = (await stdout_task).decode(errors="replace")
+                    return_code = await asyncio.wait_for(process.wait(), timeout=30)
+                finally:
+                    stdout_task.cancel()
+                    if process.returncode is None:
+                        process.kill()
 
                 await progress_callback(
                     {"type": "status", "message": "Processing results...", "phase": "parsing"}
                 )
             else:
                 # Non-streaming mode
-                result = subprocess.run(
+                result = await run_async(
                     ["powershell", "-ExecutionPolicy", "Bypass", "-Command", ps_cmd],
-                    capture_output=True,
-                    text=True,
                     timeout=300,
+                    text=True,
                 )
                 stdout_data = result.stdout
                 return_code = result.returncode
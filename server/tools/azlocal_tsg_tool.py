@@ -11,6 +11,7 @@ References:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import subprocess
@@ -18,6 +19,7 @@ import time
 from pathlib import Path
 from typing import Any, Callable, Coroutine
 
+from server.azure_context import run_async
 from server.tools.base import BaseTool
 
 logger = logging.getLogger(__name__)
@@ -50,6 +52,13 @@ class AzLocalTsgTool(BaseTool):
         },
     }
 
+    @classmethod
+    def result_summary(cls, result: dict[str, Any]) -> str:
+        """Summarise a search by its match count."""
+        if "resultCount" in result and "error" not in result:
+            return f"Found {result['resultCount']} results"
+        return super().result_summary(result)
+
     async def execute(
         self,
         arguments: dict[str, Any],
@@ -78,7 +87,7 @@ class AzLocalTsgTool(BaseTool):
             )
 
         # Check if module is installed
-        module_info = self._check_module_installed()
+        module_info = await asyncio.to_thread(self._check_module_installed)
 
         if dry_run:
             return await self._run_dry_run(query, progress_callback)
@@ -187,10 +196,8 @@ class AzLocalTsgTool(BaseTool):
             }}
             """
 
-            result = subprocess.run(
+            result = await run_async(
                 ["pwsh", "-ExecutionPolicy", "Bypass", "-Command", ps_cmd],
-                capture_output=True,
-                text=False,  # Use bytes to avoid encoding issues
                 timeout=120,
             )
 
@@ -69,6 +69,9 @@ FINDINGS_OUTPUT_SCHEMA = {
 }
 
 
+_FINDINGS_SUMMARY = "Pass: {}, Fail: {}, Warn: {}".format
+
+
 class BaseTool(ABC):
     """Abstract base class for MCP tools."""
 
@@ -78,6 +81,26 @@ class BaseTool(ABC):
     output_schema: dict[str, Any] = (
         FINDINGS_OUTPUT_SCHEMA  # MCP compliance: declare output structure
     )
+    # Successful results carry finished user-facing text in "content", so chat can
+    # show it directly instead of asking the model to restate it
+    returns_final_response: bool = False
+    # False for tools that must not run concurrently with another call of the same
+    # kind (e.g. they write to shared output locations)
+    parallel_safe: bool = True
+
+    @classmethod
+    def result_summary(cls, result: dict[str, Any]) -> str:
+        """One-line summary of a result from this tool, for chat transcripts."""
+        if "error" in result:
+            return f"Error: {result['error']}"
+        summary = result.get("summary")
+        if isinstance(summary, dict):
+            return _FINDINGS_SUMMARY(
+                summary.get("pass", 0), summary.get("fail", 0), summary.get("warn", 0)
+            )
+        if "success" in result:
+            return "Success" if result["success"] else "Failed"
+        return "Completed"
 
     def generate_run_id(self) -> str:
         """Generate a unique run ID."""
@@ -33,6 +33,7 @@ class DiagnosticsBundleTool(BaseTool):
         "Create a diagnostics bundle ZIP with findings.json, raw logs, and SHA256 manifest. "
         "Optional signing support."
     )
+    parallel_safe = False
     input_schema = {
         "type": "object",
         "properties": {
@@ -24,6 +24,7 @@ class ArcOpsEducationalTool(BaseTool):
 
     name = "arcops.explain"
     description = "Get educational content about Azure Local and AKS Arc topics"
+    returns_final_response = True
     input_schema = {
         "type": "object",
         "properties": {
@@ -12,6 +12,7 @@ import time
 from pathlib import Path
 from typing import Any
 
+from server.azure_context import run_async
 from server.services.artifact_signer import sign_artifact
 from server.tools.base import BaseTool
 
@@ -229,13 +230,10 @@ class FoundryValidateTool(BaseTool):
             return "1.0.0-mock"
 
         try:
-            import subprocess
-
-            result = subprocess.run(
+            result = await run_async(
                 ["foundry", "--version"],
-                capture_output=True,
-                text=True,
                 timeout=10,
+                text=True,
             )
             if result.returncode == 0:
                 return result.stdout.strip()
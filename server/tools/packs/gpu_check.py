@@ -11,6 +11,7 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from server.azure_context import run_async
 from server.services.artifact_signer import sign_artifact
 from server.tools.base import BaseTool
 
@@ -184,15 +185,14 @@ class GpuCheckTool(BaseTool):
         """Detect GPUs using nvidia-smi."""
         try:
             # Query nvidia-smi for GPU info
-            result = subprocess.run(
+            result = await run_async(
                 [
                     "nvidia-smi",
                     "--query-gpu=index,name,uuid,pci.bus_id,memory.total,memory.used,memory.free,driver_version,temperature.gpu,utilization.gpu,utilization.memory,power.draw,power.limit",
                     "--format=csv,noheader,nounits",
                 ],
-                capture_output=True,
-                text=True,
                 timeout=30,
+                text=True,
             )
 
             if result.returncode != 0:
@@ -212,7 +212,7 @@ class GpuCheckTool(BaseTool):
                 if len(parts) < 13:
                     continue
 
-                gpu = {
+                gpu: dict[str, Any] = {
                     "index": int(parts[0]),
                     "name": parts[1],
                     "uuid": parts[2],
@@ -265,7 +265,7 @@ class GpuCheckTool(BaseTool):
                 "totalMemoryMb": total_memory,
                 "availableMemoryMb": available_memory,
                 "driverVersion": driver_version,
-                "cudaVersion": self._get_cuda_version(),
+                "cudaVersion": await self._get_cuda_version(),
                 "migEnabled": any(g["mig"]["enabled"] for g in gpus),
             }
 
@@ -295,14 +295,13 @@ class GpuCheckTool(BaseTool):
 
         return artifact
 
-    def _get_cuda_version(self) -> str:
+    async def _get_cuda_version(self) -> str:
         """Get CUDA version from nvidia-smi."""
         try:
-            result = subprocess.run(
+            result = await run_async(
                 ["nvidia-smi", "--query-gpu=cuda_version", "--format=csv,noheader"],
-                capture_output=True,
-                text=True,
                 timeout=10,
+                text=True,
             )
             if result.returncode == 0:
                 return result.stdout.strip().split("\n")[0]
@@ -15,11 +15,11 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from server.azure_context import run_async
 from server.services.artifact_signer import sign_artifact
 from server.services.policy_engine import PolicyEngine
 from server.tools.base import BaseTool
 
-
 # Output schema for supply chain gate
 APPROVAL_OUTPUT_SCHEMA = {
     "type": "object",
@@ -304,11 +304,10 @@ class SupplyChainGateTool(BaseTool):
         """Get image digest from registry."""
         # Try using crane/skopeo if available
         try:
-            result = subprocess.run(
+            result = await run_async(
                 ["crane", "digest", image_ref],
-                capture_output=True,
-                text=True,
                 timeout=30,
+                text=True,
             )
             if result.returncode == 0:
                 return result.stdout.strip()
@@ -341,11 +340,10 @@ class SupplyChainGateTool(BaseTool):
 
         # Try cosign verify
         try:
-            result = subprocess.run(
+            result = await run_async(
                 ["cosign", "verify", "--key", pub_key, image_ref],
-                capture_output=True,
-                text=True,
                 timeout=60,
+                text=True,
             )
 
             if result.returncode == 0:
@@ -443,11 +441,10 @@ class SupplyChainGateTool(BaseTool):
         # Try syft/grype for SBOM generation and scanning
         try:
             # Generate SBOM with syft
-            syft_result = subprocess.run(
+            syft_result = await run_async(
                 ["syft", image_ref, "-o", "json"],
-                capture_output=True,
-                text=True,
                 timeout=120,
+                text=True,
             )
 
             if syft_result.returncode == 0:
@@ -455,11 +452,10 @@ class SupplyChainGateTool(BaseTool):
                 packages = len(sbom_data.get("artifacts", []))
 
                 # Scan with grype
-                grype_result = subprocess.run(
+                grype_result = await run_async(
                     ["grype", image_ref, "-o", "json"],
-                    capture_output=True,
-                    text=True,
                     timeout=120,
+                    text=True,
                 )
 
                 vulns = {"critical": 0, "high": 0, "medium": 0, "low": 0}
@@ -0,0 +1,1197 @@
+"""Tests for the web UI API route helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import types
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from starlette.requests import Request
+from starlette.responses import Response
+
+from server import api_routes
+from server.api_routes import ChatMessage, ToolResult, _summarize_tool_results
+from server.azure_context import OutputLimitExceeded
+
+
+def _http(headers: dict[str, str] | None = None) -> dict:
+    """Request/response pair for calling endpoints that take them directly."""
+    raw = [(k.encode(), v.encode()) for k, v in (headers or {}).items()]
+    return {"request": Request({"type": "http", "headers": raw}), "response": Response()}
+
+
+class TestChatDataclasses:
+    """Tests for chat message and tool result structures."""
+
+    def test_chat_message_has_no_instance_dict(self):
+        """Test ChatMessage uses slots."""
+        msg = ChatMessage(role="user", content="hello")
+
+        assert msg.role == "user"
+        assert not hasattr(msg, "__dict__")
+
+    def test_tool_result_to_dict(self):
+        """Test ToolResult serializes to the wire format."""
+        tr = ToolResult(tool="search_tsg", result={"output": "x"})
+
+        assert tr.to_dict() == {"tool": "search_tsg", "result": {"output": "x"}}
+
+
+class TestSummarizeToolResults:
+    """Tests for _summarize_tool_results."""
+
+    def test_all_passed(self):
+        """Test healthy results produce a positive summary."""
+        summary = _summarize_tool_results(
+            [
+                ToolResult(
+                    "run_connectivity_check",
+                    {"checks": [{"status": "pass"}], "summary": {"pass": 1, "total": 1}},
+                )
+            ]
+        )
+
+        assert "All 1 checks passed" in summary
+        assert "Suggested Troubleshooting" not in summary
+
+    def test_issues_suggest_tsg(self):
+        """Test failed checks are listed with TSG suggestions."""
+        summary = _summarize_tool_results(
+            [
+                ToolResult(
+                    "run_connectivity_check",
+                    {
+                        "checks": [{"id": "arc.dns", "title": "DNS Resolution", "status": "fail"}],
+                        "summary": {"fail": 1, "total": 1},
+                    },
+                )
+            ]
+        )
+
+        assert "DNS Resolution" in summary
+        assert "Suggested Troubleshooting Guide Searches" in summary
+
+    def test_error_result(self):
+        """Test tool errors are surfaced."""
+        summary = _summarize_tool_results([ToolResult("validate_cluster", {"error": "boom"})])
+
+        assert "Error - boom" in summary
+
+    @pytest.mark.parametrize("results", [[], [ToolResult("validate_cluster", {})]])
+    def test_unparseable_results(self, results):
+        """Test fallback message when nothing could be summarized."""
+        assert "couldn't parse the results" in _summarize_tool_results(results)
+
+    def test_summary_only_result(self):
+        """Test results with a summary but no checks skip the issue scan."""
+        summary = _summarize_tool_results(
+            [ToolResult("validate_cluster", {"checks": [], "summary": {"pass": 3, "total": 3}})]
+        )
+
+        assert "All 3 checks passed" in summary
+        assert "Issues found" not in summary
+
+
+class TestStreamSummary:
+    """Tests for streaming the summary as content deltas."""
+
+    RESULTS = [
+        ToolResult("search_tsg", {"output": "", "query": "dns"}),
+        ToolResult(
+            "validate_cluster",
+            {
+                "checks": [{"id": "k8s.node", "title": "Node Ready", "status": "fail"}],
+                "summary": {"fail": 1, "total": 1},
+            },
+        ),
+    ]
+
+    def test_sections_join_to_full_summary(self):
+        """Test one section per tool plus suggestions, concatenating to the summary."""
+        sections = list(api_routes._iter_summary_sections(self.RESULTS))
+
+        assert len(sections) == 3
+        assert sections[0].startswith("\n📚 **TSG Search**")
+        assert "".join(sections) == _summarize_tool_results(self.RESULTS)
+
+    @pytest.mark.asyncio
+    async def test_deltas_then_complete(self):
+        """Test deltas precede a content-free complete frame."""
+        frames = [json.loads(f[6:]) async for f in api_routes._stream_summary(self.RESULTS)]
+
+        assert [f["type"] for f in frames] == ["content_delta"] * 4 + ["complete"]
+        assert "Need more help" in frames[3]["text"]
+        assert "content" not in frames[-1]
+        assert [tc["tool"] for tc in frames[-1]["tool_calls"]] == ["search_tsg", "validate_cluster"]
+
+
+class _FakeModel:
+    def __init__(self, alias: str):
+        self.alias = alias
+        self.id = f"{alias}-generic-cpu"
+        self.file_size = 100
+
+
+class _FakeManager:
+    calls = 0
+    endpoint = "http://localhost:5273/v1"
+
+    def __init__(self, alias: str):
+        type(self).calls += 1
+
+    def list_catalog_models(self):
+        return [_FakeModel("qwen2.5-0.5b"), _FakeModel("qwen2.5-0.5b"), _FakeModel("phi-4")]
+
+    def list_cached_models(self):
+        return [_FakeModel("phi-4")]
+
+    def list_loaded_models(self):
+        return []
+
+
+class TestFoundryModelCache:
+    """Tests for Foundry catalog memoization."""
+
+    @pytest.fixture(autouse=True)
+    def fake_foundry(self):
+        """Install a fake foundry_local SDK and clear the cache."""
+        module = types.ModuleType("foundry_local")
+        module.FoundryLocalManager = _FakeManager
+        _FakeManager.calls = 0
+        api_routes._FOUNDRY_CACHE.clear()
+        with patch.dict(sys.modules, {"foundry_local": module}):
+            yield
+        api_routes._FOUNDRY_CACHE.clear()
+
+    def test_models_deduplicated(self):
+        """Test catalog entries are grouped by alias."""
+        result = api_routes._get_foundry_models()
+
+        assert result["success"] is True
+        assert [m["id"] for m in result["models"]] == ["phi-4", "qwen2.5-0.5b"]
+        assert result["downloaded"] == ["phi-4"]
+
+    def test_repeat_calls_hit_cache(self):
+        """Test a second call within the TTL skips the SDK entirely."""
+        api_routes._get_foundry_models()
+        api_routes._get_foundry_models()
+
+        assert _FakeManager.calls == 1
+
+    def test_loaded_list_expires(self):
+        """Test the loaded list refreshes after its TTL."""
+        api_routes._get_foundry_models()
+        ts, value = api_routes._FOUNDRY_CACHE["loaded"]
+        api_routes._FOUNDRY_CACHE["loaded"] = (ts - api_routes._LOADED_TTL - 1, value)
+
+        api_routes._get_foundry_models()
+
+        assert _FakeManager.calls == 2
+
+
+class TestChatStatus:
+    """Tests for the shared Foundry manager behind /chat/status."""
+
+    @pytest.fixture(autouse=True)
+    def fake_foundry(self):
+        """Install a fake foundry_local SDK and reset the shared manager."""
+        module = types.ModuleType("foundry_local")
+        module.FoundryLocalManager = _FakeManager
+        _FakeManager.calls = 0
+        api_routes._FOUNDRY_MANAGER = None
+        api_routes._chat_status_snapshot = None
+        with patch.dict(sys.modules, {"foundry_local": module}):
+            yield
+        api_routes._FOUNDRY_MANAGER = None
+        api_routes._chat_status_snapshot = None
+
+    @pytest.mark.asyncio
+    async def test_manager_reused_across_polls(self):
+        """Test rapid polling discovers the endpoint only once."""
+        first = await api_routes.chat_status()
+        api_routes._chat_status_snapshot = None
+        second = await api_routes.chat_status()
+
+        assert first == second
+        assert first["available"] is False
+        assert _FakeManager.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_drops_manager(self):
+        """Test an SDK error forces rediscovery on the next call."""
+        manager = MagicMock()
+        manager.list_loaded_models.side_effect = RuntimeError("gone")
+        api_routes._FOUNDRY_MANAGER = manager
+
+        result = await api_routes.chat_status()
+
+        assert result["available"] is False
+        assert result["error"] == "gone"
+        assert api_routes._FOUNDRY_MANAGER is None
+
+
+class TestFoundryCliFallback:
+    """Tests for parsing `foundry cache list` output."""
+
+    def test_cache_list_aliases(self):
+        """Test only the alias column is picked up."""
+        stdout = (
+            "Models cached on device:\n"
+            "   Alias                     Model ID\n"
+            "💾 qwen2.5-0.5b              qwen2.5-0.5b-instruct-generic-cpu\n"
+            "💾 phi-4-mini                Phi-4-mini-instruct-generic-gpu\n"
+        ).encode()
+        completed = MagicMock(returncode=0, stdout=stdout)
+
+        with patch("server.api_routes.subprocess.run", return_value=completed):
+            result = api_routes._get_foundry_models_from_cli("boom")
+
+        assert sorted(result["downloaded"]) == ["phi-4-mini", "qwen2.5-0.5b"]
+        assert result["service_running"] is False
+        by_id = {m["id"]: m for m in result["models"]}
+        assert by_id["qwen2.5-0.5b"]["downloaded"] is True
+        assert by_id["qwen2.5-7b"]["downloaded"] is False
+
+
+class TestAsyncHelpers:
+    """Tests for non-blocking subprocess and polling helpers."""
+
+    @pytest.mark.asyncio
+    async def test_run_async_captures_output(self):
+        """Test output and return code mirror subprocess.run."""
+        result = await api_routes._run_async(
+            [sys.executable, "-c", "import sys; print('hi'); sys.exit(3)"], timeout=30
+        )
+
+        assert result.returncode == 3
+        assert result.stdout.strip() == b"hi"
+
+    @pytest.mark.asyncio
+    async def test_run_async_text_mode(self, tmp_path):
+        """Test text mode decodes output and honours cwd/env."""
+        result = await api_routes._run_async(
+            [sys.executable, "-c", "import os; print(os.getcwd(), os.environ['ARCOPS_T'])"],
+            timeout=30,
+            cwd=str(tmp_path),
+            env={**os.environ, "ARCOPS_T": "ok"},
+            text=True,
+        )
+
+        assert result.stdout.split() == [str(tmp_path), "ok"]
+
+    @pytest.mark.asyncio
+    async def test_run_async_timeout(self):
+        """Test timeouts raise subprocess.TimeoutExpired."""
+        with pytest.raises(subprocess.TimeoutExpired):
+            await api_routes._run_async(
+                [sys.executable, "-c", "import time; time.sleep(10)"], timeout=0.2
+            )
+
+    @pytest.mark.asyncio
+    async def test_run_async_output_cap(self):
+        """Test a child flooding stdout is killed once it passes max_output."""
+        with pytest.raises(OutputLimitExceeded):
+            await api_routes._run_async(
+                [sys.executable, "-c", "import sys\nwhile True: sys.stdout.write('x' * 4096)"],
+                timeout=30,
+                max_output=1024,
+            )
+
+    @pytest.mark.asyncio
+    async def test_run_async_invalid_utf8(self):
+        """Test undecodable bytes are replaced in text mode rather than raising."""
+        result = await api_routes._run_async(
+            [sys.executable, "-c", "import sys; sys.stdout.buffer.write(b'ok\\xff')"],
+            timeout=30,
+            text=True,
+        )
+
+        assert result.stdout == "ok\ufffd"
+
+    @pytest.mark.asyncio
+    async def test_run_async_without_loop_subprocess_support(self, tmp_path):
+        """Test loops that can't spawn children (Windows selector loop) run it in a thread."""
+        with patch(
+            "server.azure_context.asyncio.create_subprocess_exec", side_effect=NotImplementedError
+        ):
+            result = await api_routes._run_async(
+                [sys.executable, "-c", "import os, sys; print(os.getcwd()); sys.exit(3)"],
+                timeout=30,
+                cwd=str(tmp_path),
+                text=True,
+            )
+            with pytest.raises(OutputLimitExceeded):
+                await api_routes._run_async(
+                    [sys.executable, "-c", "print('x' * 4096)"], timeout=30, max_output=1024
+                )
+
+        assert result.returncode == 3
+        assert result.stdout.strip() == str(tmp_path)
+
+    @pytest.mark.asyncio
+    async def test_run_az_coalesces_identical_commands(self):
+        """Test concurrent identical az calls share one process."""
+
+        async def run(cmd, timeout):
+            await asyncio.sleep(0.01)
+            return subprocess.CompletedProcess(cmd, 0, b"[]", b"")
+
+        with patch.object(api_routes, "_run_async", side_effect=run) as run_async:
+            results = await asyncio.gather(
+                api_routes._run_az(["az", "account", "list"], timeout=30),
+                api_routes._run_az(["az", "account", "list"], timeout=30),
+                api_routes._run_az(["az", "extension", "list"], timeout=30),
+            )
+
+        assert run_async.call_count == 2
+        assert results[0] is results[1]
+        assert not api_routes._AZ_INFLIGHT
+
+    @pytest.mark.asyncio
+    async def test_run_az_propagates_errors_to_all_callers(self):
+        """Test a failed shared run raises in every waiting caller."""
+
+        async def run(cmd, timeout):
+            await asyncio.sleep(0.01)
+            raise subprocess.TimeoutExpired(cmd, timeout)
+
+        with patch.object(api_routes, "_run_async", side_effect=run) as run_async:
+            results = await asyncio.gather(
+                api_routes._run_az(["az", "account", "list"], timeout=30),
+                api_routes._run_az(["az", "account", "list"], timeout=30),
+                return_exceptions=True,
+            )
+
+        run_async.assert_called_once()
+        assert all(isinstance(r, subprocess.TimeoutExpired) for r in results)
+        assert not api_routes._AZ_INFLIGHT
+
+    @pytest.mark.asyncio
+    async def test_poll_until_async_check(self):
+        """Test polling stops as soon as the async check matches."""
+        calls = []
+
+        async def check():
+            calls.append(1)
+            return len(calls) < 2
+
+        assert await api_routes._poll_until(check, (0, 0, 0), expected=False) is True
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_poll_until_exhausted(self):
+        """Test polling gives up after the schedule."""
+        assert await api_routes._poll_until(lambda: False, (0, 0)) is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "output,running",
+        [
+            ("🟢 Model management service is running on http://127.0.0.1:5273/openai/status", True),
+            ("🔴 Model management service is not running!", False),
+            ("Service stopped", False),
+        ],
+    )
+    async def test_foundry_service_running(self, output, running):
+        """Test "not running" status output is not mistaken for a running service."""
+        completed = subprocess.CompletedProcess([], 0, output.encode(), b"")
+        with patch.object(api_routes, "_run_async", AsyncMock(return_value=completed)):
+            assert await api_routes._foundry_service_running() is running
+
+
+class TestSseFrames:
+    """Tests for SSE frame construction."""
+
+    def _decode(self, frame: bytes) -> dict:
+        assert frame.startswith(b"data: ") and frame.endswith(b"\n\n")
+        return json.loads(frame[6:-2])
+
+    def test_selected_frame_matches_generic_encoding(self):
+        """Test templated frames decode to the same payload."""
+        meta = api_routes._CHAT_TOOLS_BY_ID["search_tsg"]
+        frame = api_routes._sse_selected(api_routes._tool_meta_bytes(meta))
+
+        assert self._decode(frame) == {"type": "selected", "tool": meta}
+
+    def test_executing_frame_splices_args(self):
+        """Test only args are serialized for known tools."""
+        meta = api_routes._CHAT_TOOLS_BY_ID["validate_cluster"]
+        frame = api_routes._sse_executing(api_routes._tool_meta_bytes(meta), {"checks": ["all"]})
+
+        assert self._decode(frame) == {
+            "type": "executing",
+            "tool": meta,
+            "args": {"checks": ["all"]},
+        }
+
+    @pytest.mark.parametrize("success", [True, False])
+    def test_tool_complete_frame(self, success):
+        """Test tool_complete encodes the success flag as a JSON boolean."""
+        meta = api_routes._CHAT_TOOLS_BY_ID["search_tsg"]
+        frame = api_routes._sse_tool_complete(api_routes._tool_meta_bytes(meta), success)
+
+        assert self._decode(frame) == {"type": "tool_complete", "tool": meta, "success": success}
+
+    def test_unknown_tool_is_serialized(self):
+        """Test tools outside CHAT_TOOLS are encoded on demand."""
+        meta = {"id": "mystery", "name": "mystery", "icon": "🔧"}
+        frame = api_routes._sse_selected(api_routes._tool_meta_bytes(meta))
+
+        assert self._decode(frame)["tool"] == meta
+
+    def test_batcher_coalesces_until_flush(self):
+        """Test frames are buffered and released together."""
+        batch = api_routes._SSEBatcher()
+
+        assert batch.add(b"data: 1\n\n") is None
+        assert batch.add(b"data: 2\n\n") is None
+        assert batch.flush() == b"data: 1\n\ndata: 2\n\n"
+        assert batch.flush() == b""
+
+    def test_batcher_releases_at_limit(self):
+        """Test a full buffer is returned immediately."""
+        batch = api_routes._SSEBatcher(limit=8)
+
+        assert batch.add(b"data: 1\n\n") == b"data: 1\n\n"
+
+    @pytest.mark.parametrize("dtype", ["progress", "custom"])
+    def test_named_event(self, dtype):
+        """Test named events use the cached prefix or build one for unknown types."""
+        frame = api_routes._named_sse_event(dtype, {"n": 1})
+
+        head, data = frame.split(b"\n", 1)
+        assert head == f"event: {dtype}".encode()
+        assert json.loads(data[6:]) == {"n": 1}
+        assert frame.endswith(b"\n\n")
+
+
+class TestFoundryStartStream:
+    """Tests for the streaming model start endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_frames_are_bytes(self):
+        """Test every frame is pre-encoded SSE bytes."""
+        request = MagicMock()
+        request.json = AsyncMock(return_value={"model_id": "phi-4-mini"})
+        process = MagicMock()
+        process.stdout.readline.side_effect = ["loading\n", ""]
+        process.wait.return_value = 0
+
+        with patch("subprocess.Popen", return_value=process):
+            response = await api_routes.start_foundry_model_stream(request)
+            frames = [frame async for frame in response.body_iterator]
+
+        assert all(isinstance(frame, bytes) for frame in frames)
+        assert [json.loads(f[6:])["type"] for f in frames] == ["info", "output", "complete"]
+
+
+class TestSpawnFoundryModelRun:
+    """Tests for the detached foundry model launcher."""
+
+    def test_windows_spawns_without_shell(self):
+        """Test Windows launches foundry directly with list arguments."""
+        flags = {"CREATE_NO_WINDOW": 0x08000000, "DETACHED_PROCESS": 0x00000008}
+        with (
+            patch.object(api_routes.sys, "platform", "win32"),
+            patch.multiple(api_routes.subprocess, create=True, **flags),
+            patch.object(api_routes.subprocess, "Popen") as popen,
+        ):
+            api_routes._spawn_foundry_model_run("phi-4-mini & calc")
+
+        args, kwargs = popen.call_args
+        assert args[0] == ["foundry", "model", "run", "phi-4-mini & calc"]
+        assert "shell" not in kwargs
+        assert kwargs["creationflags"] == 0x08000008
+
+    def test_unix_uses_new_session(self):
+        """Test Unix detaches the child into its own session."""
+        with (
+            patch.object(api_routes.sys, "platform", "linux"),
+            patch.object(api_routes.subprocess, "Popen") as popen,
+        ):
+            api_routes._spawn_foundry_model_run("phi-4-mini")
+
+        args, kwargs = popen.call_args
+        assert args[0] == ["nohup", "foundry", "model", "run", "phi-4-mini"]
+        assert kwargs["start_new_session"] is True
+
+
+class TestExecuteChatTool:
+    """Tests for chat tool dispatch to the MCP registry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Replace MCP tools with async mocks."""
+        from server import main
+
+        tools = {name: MagicMock() for name in set(api_routes._CHAT_TOOL_MCP_NAMES.values())}
+        for tool in tools.values():
+            tool.execute = AsyncMock(return_value={"summary": {"total": 0}})
+        with patch.dict(main.TOOL_REGISTRY, tools):
+            yield tools
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, registry):
+        """Test unmapped tools return an error result."""
+        result = await api_routes._execute_chat_tool("nope", {})
+
+        assert result.result == {"error": "Unknown tool: nope"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "tool_name,args,expected",
+        [
+            ("check_environment", {}, {"dryRun": False, "mode": "quick"}),
+            ("run_connectivity_check", {"mode": "full"}, {"dryRun": False, "mode": "full"}),
+            ("validate_cluster", {}, {"dryRun": False, "checks": ["all"]}),
+            ("search_tsg", {"query": "dns"}, {"dryRun": False, "query": "dns"}),
+        ],
+    )
+    async def test_builds_mcp_args(self, registry, tool_name, args, expected):
+        """Test chat args are translated for the mapped MCP tool."""
+        await api_routes._execute_chat_tool(tool_name, args)
+
+        registry[api_routes._CHAT_TOOL_MCP_NAMES[tool_name]].execute.assert_awaited_once_with(
+            expected
+        )
+
+    @pytest.mark.asyncio
+    async def test_search_requires_query(self, registry):
+        """Test TSG search without a query is rejected before execution."""
+        result = await api_routes._execute_chat_tool("search_tsg", {})
+
+        assert result.result == {"error": "No search query provided"}
+        registry["azlocal.tsg.search"].execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_slow_tools_overlap(self, tmp_path, monkeypatch):
+        """Test two slow tools run together in about max(t), not sum(t)."""
+        from server.tools import aks_arc_validate, azlocal_tsg_tool
+
+        async def slow_run(cmd, timeout, **kwargs):
+            # ~0.3s per tool: five kubectl probes, or one TSG search
+            await asyncio.sleep(0.3 if cmd[0] == "pwsh" else 0.06)
+            return subprocess.CompletedProcess(cmd, 1, b"", b"unavailable")
+
+        kubeconfig = tmp_path / "config"
+        kubeconfig.write_text("")
+        monkeypatch.setenv("KUBECONFIG", str(kubeconfig))
+        with (
+            patch.object(aks_arc_validate, "run_async", slow_run),
+            patch.object(azlocal_tsg_tool, "run_async", slow_run),
+            patch.object(
+                azlocal_tsg_tool.AzLocalTsgTool,
+                "_check_module_installed",
+                return_value={"installed": True},
+            ),
+        ):
+            start = time.perf_counter()
+            await asyncio.gather(
+                api_routes._execute_chat_tool("validate_cluster", {}),
+                api_routes._execute_chat_tool("search_tsg", {"query": "dns"}),
+            )
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+
+
+class TestIsModelLoaded:
+    """Tests for loaded-model matching."""
+
+    @pytest.mark.parametrize(
+        "model_id,expected",
+        [("phi-4", True), ("phi-4-generic-cpu", True), ("phi", True), ("qwen2.5-0.5b", False)],
+    )
+    def test_matches_alias_or_id_prefix(self, model_id, expected):
+        """Test aliases and id prefixes both count as loaded."""
+        assert api_routes._is_model_loaded(model_id, [_FakeModel("phi-4")]) is expected
+
+    def test_nothing_loaded(self):
+        """Test an empty or missing listing is never a match."""
+        assert api_routes._is_model_loaded("phi-4", None) is False
+
+
+class TestStartFoundryModel:
+    """Tests for the non-streaming /foundry/start endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_sdk_calls_leave_the_loop(self):
+        """Test manager discovery and every loaded-model check run in worker threads."""
+        loop_thread = threading.get_ident()
+        threads: list[int] = []
+        spawned: list[str] = []
+
+        class Manager(_FakeManager):
+            def __init__(self, alias: str):
+                threads.append(threading.get_ident())
+
+            def list_loaded_models(self):
+                threads.append(threading.get_ident())
+                return [_FakeModel("phi-4")] if spawned else []
+
+        module = types.ModuleType("foundry_local")
+        module.FoundryLocalManager = Manager
+        with (
+            patch.dict(sys.modules, {"foundry_local": module}),
+            patch.object(api_routes, "_spawn_foundry_model_run", spawned.append),
+        ):
+            result = await api_routes.start_foundry_model({"model_id": "phi-4"})
+
+        assert result["message"] == "Model phi-4 started"
+        assert len(threads) == 3
+        assert loop_thread not in threads
+
+
+class TestBoundedSse:
+    """Tests for per-connection SSE backpressure."""
+
+    @staticmethod
+    async def _source(closed: list[bool], count: int = 5):
+        try:
+            for i in range(count):
+                yield b"data: %d\n\n" % i
+        finally:
+            closed.append(True)
+
+    @pytest.mark.asyncio
+    async def test_relays_all_frames(self):
+        """Test frames pass through in order for a reading client."""
+        closed: list[bool] = []
+        frames = [f async for f in api_routes._bounded_sse(self._source(closed), maxsize=2)]
+
+        assert frames == [b"data: %d\n\n" % i for i in range(5)]
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_closes_source(self):
+        """Test the source is closed when the client stops reading."""
+        closed: list[bool] = []
+        stream = api_routes._bounded_sse(
+            self._source(closed, count=100), maxsize=1, put_timeout=0.01
+        )
+
+        await stream.__anext__()
+        await asyncio.sleep(0.1)
+
+        assert closed == [True]
+        await stream.aclose()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_with_full_queue_ends_pump(self):
+        """Test the pump task finishes when the client leaves with the queue full."""
+        closed: list[bool] = []
+        stream = api_routes._bounded_sse(self._source(closed, count=100), maxsize=2)
+
+        await stream.__anext__()
+        await asyncio.sleep(0.01)  # let the pump fill the queue
+        pump = next(t for t in asyncio.all_tasks() if t.get_coro().__name__ == "pump")
+        await stream.aclose()
+
+        await asyncio.wait({pump}, timeout=1)
+        assert pump.done()
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_full_queue_at_end_still_finishes(self):
+        """Test a source ending while the queue is full still ends the stream."""
+        closed: list[bool] = []
+        stream = api_routes._bounded_sse(self._source(closed, count=4), maxsize=3)
+
+        first = await stream.__anext__()
+        await asyncio.sleep(0.01)  # source finishes with no room for the end marker
+
+        async def rest() -> list[bytes]:
+            return [f async for f in stream]
+
+        frames = [first, *await asyncio.wait_for(rest(), timeout=1)]
+        assert frames == [b"data: %d\n\n" % i for i in range(4)]
+
+
+class TestTTLCache:
+    """Tests for the az CLI response cache."""
+
+    @staticmethod
+    def _fetcher(*responses):
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return responses[min(len(calls), len(responses)) - 1]
+
+        return fetch, calls
+
+    @pytest.mark.asyncio
+    async def test_hit_within_ttl(self):
+        """Test a second call is served from cache and annotated."""
+        cache = api_routes._TTLCache()
+        fetch, calls = self._fetcher({"success": True, "count": 1})
+
+        await cache.get_or_fetch(("k",), 60, fetch)
+        cached = await cache.get_or_fetch(("k",), 60, fetch)
+
+        assert len(calls) == 1
+        assert cached["cached"] is True and cached["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_cache(self):
+        """Test refresh forces a new fetch."""
+        cache = api_routes._TTLCache()
+        fetch, calls = self._fetcher({"success": True, "n": 1}, {"success": True, "n": 2})
+
+        await cache.get_or_fetch(("k",), 60, fetch)
+        result = await cache.get_or_fetch(("k",), 60, fetch, refresh=True)
+
+        assert result == {"success": True, "n": 2}
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_on_error(self):
+        """Test a failed refresh returns the last good response."""
+        cache = api_routes._TTLCache()
+        fetch, _ = self._fetcher({"success": True, "n": 1}, {"success": False, "error": "boom"})
+
+        await cache.get_or_fetch(("k",), 60, fetch)
+        result = await cache.get_or_fetch(("k",), 60, fetch, refresh=True)
+
+        assert result["n"] == 1
+        assert result["stale"] is True
+        assert result["hint"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_failures_not_cached(self):
+        """Test error responses are returned but never stored."""
+        cache = api_routes._TTLCache()
+        fetch, calls = self._fetcher({"success": False, "error": "no login"})
+
+        await cache.get_or_fetch(("k",), 60, fetch)
+        result = await cache.get_or_fetch(("k",), 60, fetch)
+
+        assert result == {"success": False, "error": "no login"}
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self):
+        """Test simultaneous misses share a single fetch."""
+        cache = api_routes._TTLCache()
+        fetch, calls = self._fetcher({"success": True})
+
+        results = await asyncio.gather(*(cache.get_or_fetch(("k",), 60, fetch) for _ in range(5)))
+
+        assert len(calls) == 1
+        assert all(r["success"] for r in results)
+
+
+class TestValidateCluster:
+    """Tests for the cluster validation endpoint."""
+
+    CLUSTER = {
+        "connectivityStatus": "Connected",
+        "provisioningState": "Succeeded",
+        "agentVersion": "1.0",
+    }
+
+    @pytest.fixture(autouse=True)
+    def az_cli(self):
+        """Pretend the Azure CLI is installed."""
+        with patch.object(api_routes, "_find_az_cli", return_value="az"):
+            yield
+
+    @staticmethod
+    def _show(cluster: dict):
+        async def run(cmd, timeout, **kwargs):
+            return subprocess.CompletedProcess(cmd, 0, json.dumps(cluster).encode(), b"")
+
+        return run
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently(self):
+        """Test the extensions lookup starts before cluster details return."""
+        ext_started = asyncio.Event()
+
+        async def show(cmd, timeout, **kwargs):
+            await asyncio.wait_for(ext_started.wait(), 1)
+            return subprocess.CompletedProcess(cmd, 0, json.dumps(self.CLUSTER).encode(), b"")
+
+        async def extensions(*args):
+            ext_started.set()
+            return {"success": True, "count": 0, "extensions": []}
+
+        with (
+            patch.object(api_routes, "_run_async", side_effect=show),
+            patch.object(api_routes, "get_cluster_extensions", side_effect=extensions),
+        ):
+            result = await api_routes.validate_cluster("c1", "rg")
+
+        assert result["success"] is True
+        assert [c["id"] for c in result["checks"]][-1] == "aks.arc.extensions"
+
+    @pytest.mark.asyncio
+    async def test_extension_failure_keeps_other_checks(self):
+        """Test a failed extensions lookup doesn't fail the validation."""
+        with (
+            patch.object(api_routes, "_run_async", side_effect=self._show(self.CLUSTER)),
+            patch.object(api_routes, "get_cluster_extensions", side_effect=RuntimeError("x")),
+        ):
+            result = await api_routes.validate_cluster("c1", "rg")
+
+        assert result["success"] is True
+        assert [c["id"] for c in result["checks"]] == [
+            "aks.arc.connectivity",
+            "aks.arc.provisioning",
+            "aks.arc.agent.version",
+        ]
+
+    def test_summarize_checks(self):
+        """Test statuses are counted, including ones absent from the list."""
+        checks = [{"status": "pass"}, {"status": "fail"}, {"status": "pass"}]
+
+        assert api_routes._summarize_checks(checks) == {
+            "total": 3,
+            "passed": 2,
+            "warnings": 0,
+            "failed": 1,
+        }
+
+
+class TestValidateClusters:
+    """Tests for batch cluster validation."""
+
+    LISTING = {
+        "success": True,
+        "clusters": [
+            {"name": "c1", "resourceGroup": "RG", "connectivityStatus": "Connected"},
+            {"name": "c2", "resourceGroup": "rg", "connectivityStatus": "Offline"},
+        ],
+    }
+
+    @pytest.mark.asyncio
+    async def test_uses_one_listing(self):
+        """Test clusters are resolved from one listing without per-cluster show calls."""
+        listing = AsyncMock(return_value=self.LISTING)
+        extensions = AsyncMock(return_value={"success": False})
+        with (
+            patch.object(api_routes, "list_clusters", listing),
+            patch.object(api_routes, "get_cluster_extensions", extensions),
+            patch.object(api_routes, "_run_async") as run,
+        ):
+            result = await api_routes.validate_clusters(
+                {
+                    "clusters": [
+                        {"name": "c1", "resourceGroup": "rg"},
+                        {"name": "C2", "resourceGroup": "rg"},
+                        {"name": "c3", "resourceGroup": "rg"},
+                    ]
+                }
+            )
+
+        listing.assert_awaited_once()
+        run.assert_not_called()
+        assert extensions.await_count == 2
+        statuses = [r["checks"][0]["status"] if r["checks"] else None for r in result["results"]]
+        assert statuses == ["pass", "fail", None]
+        assert result["results"][2]["error"] == "Cluster not found"
+
+    @pytest.mark.asyncio
+    async def test_listing_failure(self):
+        """Test a failed cluster listing is reported once."""
+        listing = AsyncMock(
+            return_value={"success": False, "error": "no login", "hint": "az login"}
+        )
+        with patch.object(api_routes, "list_clusters", listing):
+            result = await api_routes.validate_clusters({"clusters": [{"name": "c1"}]})
+
+        assert result == {"success": False, "results": [], "error": "no login", "hint": "az login"}
+
+
+class TestListClusters:
+    """Tests for the cluster listing endpoint."""
+
+    @pytest.fixture(autouse=True)
+    def clusters(self):
+        """Serve a fixed listing and keep the az cache isolated."""
+        listing = {
+            "success": True,
+            "count": 1,
+            "clusters": [{"name": "c1", "location": "eastus", "agentVersion": "1.0"}],
+        }
+        api_routes._AZ_CACHE.clear()
+        with patch.object(
+            api_routes.AzureContext, "get_connected_clusters", AsyncMock(return_value=listing)
+        ):
+            yield
+        api_routes._AZ_CACHE.clear()
+
+    @pytest.mark.asyncio
+    async def test_default_objects(self):
+        """Test clusters are objects unless fields are requested."""
+        result = await api_routes.list_clusters()
+
+        assert result["clusters"][0]["name"] == "c1"
+        assert "fields" not in result
+
+    @pytest.mark.asyncio
+    async def test_field_projection(self):
+        """Test fields= returns rows in the requested column order."""
+        result = await api_routes.list_clusters(fields="location,name,missing")
+
+        assert result["fields"] == ["location", "name", "missing"]
+        assert result["clusters"] == [["eastus", "c1", None]]
+
+
+class TestFindModuleManifest:
+    """Tests for PowerShell module manifest discovery."""
+
+    NAME = "AzStackHci.EnvironmentChecker.psd1"
+
+    def test_highest_version_wins(self, tmp_path):
+        """Test versions compare numerically, not lexically."""
+        for version in ("1.2.9", "1.2.10", "0.9"):
+            (tmp_path / version).mkdir()
+            (tmp_path / version / self.NAME).write_text("@{}")
+
+        found = api_routes._find_module_manifest(str(tmp_path), self.NAME)
+
+        assert found == str(tmp_path / "1.2.10" / self.NAME)
+
+    def test_unversioned_install(self, tmp_path):
+        """Test a manifest directly under the module folder is found."""
+        (tmp_path / self.NAME).write_text("@{}")
+
+        assert api_routes._find_module_manifest(str(tmp_path), self.NAME) == str(
+            tmp_path / self.NAME
+        )
+
+    def test_missing(self, tmp_path):
+        """Test missing folders and manifests return None."""
+        (tmp_path / "1.0").mkdir()
+
+        assert api_routes._find_module_manifest(str(tmp_path), self.NAME) is None
+        assert api_routes._find_module_manifest(str(tmp_path / "nope"), self.NAME) is None
+
+
+class TestInstallChecker:
+    """Tests for the Environment Checker install endpoint."""
+
+    MODULE = '{"Name": "AzStackHci.EnvironmentChecker", "Version": "1.2.0", "Path": "C:\\\\m.psd1"}'
+
+    @pytest.mark.parametrize(
+        ("marker", "already"), [("ALREADY_INSTALLED", True), ("SUCCESS: Module installed", False)]
+    )
+    @pytest.mark.asyncio
+    async def test_reports_whether_install_ran(self, marker, already):
+        """Test one PowerShell session reports an existing module without installing."""
+        output = f"{marker}\n{self.MODULE}\n"
+        with patch.object(
+            api_routes,
+            "_run_async",
+            AsyncMock(return_value=subprocess.CompletedProcess([], 0, output, "")),
+        ) as run:
+            result = await api_routes.install_checker()
+
+        run.assert_awaited_once()
+        assert result["success"] is True
+        assert result["alreadyInstalled"] is already
+        assert result["module"]["Version"] == "1.2.0"
+
+
+class TestListEndpoints:
+    """Tests for the endpoints config listing."""
+
+    @pytest.fixture(autouse=True)
+    def config(self, tmp_path):
+        """Point the endpoint listing at a temporary YAML file."""
+        path = tmp_path / "endpoints.yaml"
+        path.write_text(
+            "endpoints:\n"
+            "  - {host: a.example, category: arc}\n"
+            "  - {host: b.example, category: monitor}\n"
+            "  - {host: c.example, category: arc}\n"
+        )
+        with (
+            patch.object(api_routes, "_ENDPOINTS_PATH", path),
+            patch.dict(api_routes._ENDPOINTS_CACHE, {"mtime": None}),
+        ):
+            yield path
+
+    @pytest.mark.asyncio
+    async def test_grouped_and_filtered(self):
+        """Test endpoints are grouped and a category filter uses the index."""
+        everything = await api_routes.list_endpoints(**_http())
+        arc = await api_routes.list_endpoints("arc", **_http())
+
+        assert everything["total"] == 3
+        assert everything["categories"] == ["arc", "monitor"]
+        assert [e["host"] for e in arc["endpoints"]] == ["a.example", "c.example"]
+        assert arc["categories"] == ["arc"]
+
+    @pytest.mark.asyncio
+    async def test_parsed_once_until_modified(self, config):
+        """Test the YAML is only re-read when the file changes."""
+        import yaml
+
+        with patch.object(yaml, "load", wraps=yaml.load) as load:
+            await api_routes.list_endpoints(**_http())
+            await api_routes.list_endpoints(**_http())
+            assert load.call_count == 1
+
+            config.write_text("endpoints:\n  - {host: d.example, category: new}\n")
+            stat = config.stat()
+            os.utime(config, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            result = await api_routes.list_endpoints(**_http())
+
+        assert load.call_count == 2
+        assert result["categories"] == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_etag_and_not_modified(self):
+        """Test responses carry validators and a matching If-None-Match gets 304."""
+        first = _http()
+        await api_routes.list_endpoints(**first)
+        etag = first["response"].headers["etag"]
+
+        assert first["response"].headers["cache-control"] == "public, max-age=300"
+
+        repeat = await api_routes.list_endpoints(**_http({"if-none-match": f"W/{etag}"}))
+        other = await api_routes.list_endpoints("arc", **_http({"if-none-match": etag}))
+
+        assert repeat.status_code == 304
+        assert repeat.headers["etag"] == etag
+        assert other["categories"] == ["arc"]
+
+
+class TestStreamClusters:
+    """Tests for the NDJSON cluster stream."""
+
+    @staticmethod
+    async def _lines(response) -> list[dict]:
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        return [json.loads(line) for line in body.splitlines()]
+
+    @staticmethod
+    def _fake_az(stdout: str, stderr: str = "", code: int = 0) -> list[str]:
+        script = (
+            "import sys; "
+            f"sys.stdout.write({stdout!r}); sys.stderr.write({stderr!r}); sys.exit({code})"
+        )
+        return [sys.executable, "-c", script]
+
+    @pytest.mark.asyncio
+    async def test_one_summary_per_line(self):
+        """Test each cluster becomes one projected NDJSON line."""
+        listing = json.dumps([{"name": "c1", "resourceGroup": "rg", "id": "/x"}, {"name": "c2"}])
+        real_exec = asyncio.create_subprocess_exec
+
+        async def fake_exec(*cmd, **kwargs):
+            return await real_exec(*self._fake_az(listing), **kwargs)
+
+        with (
+            patch.object(api_routes, "_find_az_cli", return_value="az"),
+            patch.object(api_routes.asyncio, "create_subprocess_exec", fake_exec),
+        ):
+            lines = await self._lines(await api_routes.stream_clusters())
+
+        assert [line["name"] for line in lines] == ["c1", "c2"]
+        assert "id" not in lines[0]
+        assert lines[0]["resourceGroup"] == "rg"
+
+    @pytest.mark.asyncio
+    async def test_cli_error_is_last_line(self):
+        """Test a failing az call ends the stream with an error line."""
+        real_exec = asyncio.create_subprocess_exec
+
+        async def fake_exec(*cmd, **kwargs):
+            return await real_exec(*self._fake_az("", "ERROR: not logged in", 1), **kwargs)
+
+        with (
+            patch.object(api_routes, "_find_az_cli", return_value="az"),
+            patch.object(api_routes.asyncio, "create_subprocess_exec", fake_exec),
+        ):
+            lines = await self._lines(await api_routes.stream_clusters())
+
+        assert lines == [{"error": "ERROR: not logged in"}]
+
+
+class _FakeConnectivityTool:
+    """Connectivity tool stand-in that reports progress then returns findings."""
+
+    def __init__(self, delay: float = 0.0, error: str | None = None):
+        self.delay = delay
+        self.error = error
+
+    async def execute(self, arguments, progress_callback=None):
+        await progress_callback({"type": "status", "phase": "running"})
+        await asyncio.sleep(self.delay)
+        await progress_callback({"type": "progress", "check": "dns"})
+        if self.error:
+            raise RuntimeError(self.error)
+        return {"checks": []}
+
+
+class TestConnectivityStream:
+    """Tests for the connectivity check SSE stream."""
+
+    @staticmethod
+    async def _body(tool) -> str:
+        with patch(
+            "server.tools.arc_connectivity_check.ArcConnectivityCheckTool", return_value=tool
+        ):
+            response = await api_routes.run_connectivity_check_stream()
+            chunks = [chunk async for chunk in response.body_iterator]
+        return "".join(c if isinstance(c, str) else c.decode() for c in chunks)
+
+    @pytest.mark.asyncio
+    async def test_progress_then_complete(self):
+        """Test progress events arrive in order before the final result."""
+        body = await self._body(_FakeConnectivityTool())
+
+        blocks = [block.split("\n") for block in body.strip().split("\n\n")]
+        assert [b[0] for b in blocks] == ["event: status", "event: progress", "event: complete"]
+        assert json.loads(blocks[-1][1][6:]) == {"success": True, "findings": {"checks": []}}
+
+    @pytest.mark.asyncio
+    async def test_keepalive_while_idle(self):
+        """Test a keepalive comment is sent when the check goes quiet."""
+        with patch.object(api_routes, "_CONNECTIVITY_KEEPALIVE_S", 0.01):
+            body = await self._body(_FakeConnectivityTool(delay=0.05))
+
+        assert ": keepalive\n\n" in body
+        assert body.rstrip().split("\n\n")[-1].startswith("event: complete")
+
+    @pytest.mark.asyncio
+    async def test_error_event(self):
+        """Test a failing check ends the stream with an error event."""
+        body = await self._body(_FakeConnectivityTool(error="boom"))
+
+        assert "event: progress" in body
+        assert body.rstrip().split("\n\n")[-1].startswith("event: error")
+        assert "boom" in body
+
+    @pytest.mark.asyncio
+    async def test_disconnect_cancels_check(self):
+        """Test closing the stream early stops the background check."""
+        cancelled = asyncio.Event()
+
+        class Tool(_FakeConnectivityTool):
+            async def execute(self, arguments, progress_callback=None):
+                await progress_callback({"type": "status", "phase": "running"})
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        with patch("server.tools.arc_connectivity_check.ArcConnectivityCheckTool", Tool):
+            response = await api_routes.run_connectivity_check_stream()
+            frames = response.body_iterator
+            assert (await anext(frames)).startswith(b"event: status")
+            await frames.aclose()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
@@ -0,0 +1,192 @@
+"""
+Tests for the Azure Resource Manager REST client.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import time
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from server import azure_client
+from server.azure_context import AzureAuthStatus, AzureContext
+
+SUB = "00000000-0000-0000-0000-000000000001"
+CLUSTER_ID = (
+    f"/subscriptions/{SUB}/resourceGroups/rg1/providers/Microsoft.Kubernetes/connectedClusters/c1"
+)
+
+
+@pytest.fixture
+def arm():
+    """Route the shared client through a mock transport with a cached token."""
+    routes: dict[str, httpx.Response] = {}
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return routes[request.url.path]
+
+    azure_client._client = httpx.AsyncClient(
+        base_url=azure_client.ARM_ENDPOINT, transport=httpx.MockTransport(handler)
+    )
+    azure_client._token = ("tok", time.time() + 3600)
+    yield routes, requests
+    azure_client._client = None
+    azure_client._reset_token_cache()
+
+
+class TestArmList:
+    """Tests for ARM collection listing."""
+
+    @pytest.mark.asyncio
+    async def test_follows_next_link_and_flattens(self, arm):
+        """Test pages are followed and rows match the az CLI shape."""
+        routes, requests = arm
+        base = f"/subscriptions/{SUB}/providers/Microsoft.Kubernetes/connectedClusters"
+        routes[base] = httpx.Response(
+            200,
+            json={
+                "value": [
+                    {
+                        "id": CLUSTER_ID,
+                        "name": "c1",
+                        "location": "eastus",
+                        "properties": {"connectivityStatus": "Connected"},
+                    }
+                ],
+                "nextLink": f"{azure_client.ARM_ENDPOINT}/page2?api-version=x&$skiptoken=1",
+            },
+        )
+        routes["/page2"] = httpx.Response(200, json={"value": [{"id": None, "name": "c2"}]})
+
+        clusters = await azure_client.list_connected_clusters(SUB)
+
+        assert [c["name"] for c in clusters] == ["c1", "c2"]
+        assert clusters[0]["resourceGroup"] == "rg1"
+        assert clusters[0]["connectivityStatus"] == "Connected"
+        assert requests[0].headers["Authorization"] == "Bearer tok"
+        assert requests[1].url.params["$skiptoken"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self, arm):
+        """Test ARM errors surface as AzureRestError with the service message."""
+        routes, _ = arm
+        routes["/subscriptions/x"] = httpx.Response(
+            403, json={"error": {"code": "AuthorizationFailed", "message": "denied"}}
+        )
+
+        with pytest.raises(azure_client.AzureRestError, match="403: denied"):
+            await azure_client.arm_list("/subscriptions/x", "2024-01-01")
+
+
+class TestGetToken:
+    """Tests for access token caching."""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        azure_client._reset_token_cache()
+        yield
+        azure_client._reset_token_cache()
+
+    @pytest.mark.asyncio
+    async def test_token_reused_until_near_expiry(self):
+        """Test the token source is only asked once while the token is fresh."""
+        fetch = AsyncMock(return_value=("tok", time.time() + 3600))
+        with (
+            patch.object(azure_client, "_token_from_identity", AsyncMock(return_value=None)),
+            patch.object(azure_client, "_token_from_cli", fetch),
+        ):
+            assert await azure_client.get_token() == "tok"
+            assert await azure_client.get_token() == "tok"
+
+        fetch.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_expiring_token_refreshed(self):
+        """Test a token inside the refresh margin is replaced."""
+        azure_client._token = ("old", time.time() + 60)
+        with (
+            patch.object(azure_client, "_token_from_identity", AsyncMock(return_value=None)),
+            patch.object(
+                azure_client, "_token_from_cli", AsyncMock(return_value=("new", time.time() + 3600))
+            ),
+        ):
+            assert await azure_client.get_token() == "new"
+
+
+class TestConnectedClustersFallback:
+    """Tests for choosing between ARM and the Azure CLI."""
+
+    AUTH = AzureAuthStatus(authenticated=True, az_cli_installed=True, subscription_id=SUB)
+
+    @pytest.mark.asyncio
+    async def test_uses_arm_when_available(self):
+        """Test cluster listing comes from ARM without spawning az."""
+        rows = [{"name": "c1", "resourceGroup": "rg1", "id": CLUSTER_ID}]
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch.object(AzureContext, "check_auth", AsyncMock(return_value=self.AUTH)),
+            patch.object(azure_client, "list_connected_clusters", AsyncMock(return_value=rows)),
+            patch("server.azure_context.run_async") as run,
+        ):
+            result = await AzureContext.get_connected_clusters()
+
+        run.assert_not_called()
+        assert result["success"] is True
+        assert result["subscription"] == SUB
+        assert result["clusters"][0]["name"] == "c1"
+        assert "id" not in result["clusters"][0]
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_cli_on_arm_error(self):
+        """Test an ARM failure falls back to az connectedk8s list."""
+        failing = AsyncMock(side_effect=azure_client.AzureRestError("boom"))
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch.object(AzureContext, "check_auth", AsyncMock(return_value=self.AUTH)),
+            patch.object(azure_client, "list_connected_clusters", failing),
+            patch(
+                "server.azure_context.run_async",
+                AsyncMock(return_value=subprocess.CompletedProcess([], 0, b'[{"name":"c2"}]', b"")),
+            ) as run,
+        ):
+            result = await AzureContext.get_connected_clusters()
+
+        run.assert_awaited_once()
+        assert [c["name"] for c in result["clusters"]] == ["c2"]
+
+    @pytest.mark.asyncio
+    async def test_cli_output_parse_error(self):
+        """Test malformed az output is reported rather than raised."""
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch.object(AzureContext, "check_auth", AsyncMock(return_value=self.AUTH)),
+            patch(
+                "server.azure_context.run_async",
+                AsyncMock(return_value=subprocess.CompletedProcess([], 0, b'[{"name":', b"")),
+            ),
+        ):
+            result = await AzureContext.get_connected_clusters("rg-scoped-name")
+
+        assert result["success"] is False
+        assert result["error"].startswith("Failed to parse response")
+
+    @pytest.mark.asyncio
+    async def test_explicit_subscription_lists_during_auth_check(self):
+        """Test listing starts alongside the login check and is dropped if signed out."""
+        signed_out = AzureAuthStatus(authenticated=False, az_cli_installed=True, error="no")
+        listing = AsyncMock(return_value=[])
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch.object(AzureContext, "check_auth", AsyncMock(return_value=signed_out)),
+            patch.object(azure_client, "list_connected_clusters", listing),
+        ):
+            result = await AzureContext.get_connected_clusters(SUB)
+
+        listing.assert_awaited_once_with(SUB)
+        assert result["success"] is False
+        assert result["error"] == "no"
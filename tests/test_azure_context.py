@@ -0,0 +1,146 @@
+"""
+Tests for the Azure CLI context manager.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from server.azure_context import AzureContext
+
+
+@pytest.fixture(autouse=True)
+def reset_az_cli():
+    """Start every test with empty Azure CLI lookup and result caches."""
+    AzureContext._reset_az_cli_cache()
+    AzureContext.invalidate_cache()
+    yield
+    AzureContext._reset_az_cli_cache()
+    AzureContext.invalidate_cache()
+
+
+class TestFindAzCli:
+    """Tests for Azure CLI discovery."""
+
+    def test_result_is_cached(self):
+        """Test the filesystem is only searched once."""
+        with patch("server.azure_context.shutil.which", return_value="/usr/bin/az") as which:
+            assert AzureContext.find_az_cli() == "/usr/bin/az"
+            assert AzureContext.find_az_cli() == "/usr/bin/az"
+
+        which.assert_called_once()
+
+    def test_missing_cli_is_cached(self):
+        """Test a failed search is not repeated on every request."""
+        with (
+            patch("server.azure_context.shutil.which", return_value=None) as which,
+            patch("server.azure_context.os.path.exists", return_value=False) as exists,
+        ):
+            assert AzureContext.find_az_cli() is None
+            assert AzureContext.find_az_cli() is None
+
+        which.assert_called_once()
+        assert exists.call_count == len(AzureContext._windows_candidates())
+
+    def test_env_override(self, monkeypatch):
+        """Test AZ_CLI_PATH skips the search entirely."""
+        monkeypatch.setenv("AZ_CLI_PATH", "/opt/az/bin/az")
+        with patch("server.azure_context.shutil.which") as which:
+            assert AzureContext.find_az_cli() == "/opt/az/bin/az"
+
+        which.assert_not_called()
+
+    @pytest.mark.parametrize("var", ["ARCOPS_AZ_CLI_PATH", "AZ_CLI_PATH"])
+    def test_env_override_beats_cache(self, monkeypatch, var):
+        """Test either override is honoured even after a cached miss."""
+        with (
+            patch("server.azure_context.shutil.which", return_value=None),
+            patch("server.azure_context.os.path.exists", return_value=False),
+        ):
+            assert AzureContext.find_az_cli() is None
+
+        monkeypatch.setenv(var, r"D:\tools\az.cmd")
+        assert AzureContext.find_az_cli() == r"D:\tools\az.cmd"
+
+    def test_arcops_env_override_wins(self, monkeypatch):
+        """Test ARCOPS_AZ_CLI_PATH takes precedence over the older AZ_CLI_PATH."""
+        monkeypatch.setenv("AZ_CLI_PATH", "/opt/az/bin/az")
+        monkeypatch.setenv("ARCOPS_AZ_CLI_PATH", "/usr/local/bin/az")
+
+        assert AzureContext.find_az_cli() == "/usr/local/bin/az"
+
+
+class TestCheckAuth:
+    """Tests for the Azure CLI login check."""
+
+    @staticmethod
+    def _az(stdout: str = "", stderr: str = "", code: int = 0) -> AsyncMock:
+        return AsyncMock(return_value=subprocess.CompletedProcess([], code, stdout, stderr))
+
+    @pytest.mark.asyncio
+    async def test_signed_in(self):
+        """Test account details are read from az account show without blocking."""
+        account = '{"id": "sub", "name": "Lab", "tenantId": "t", "user": {"name": "me"}}'
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch("server.azure_context.run_async", self._az(account)) as run,
+        ):
+            status = await AzureContext.check_auth()
+
+        assert run.await_args.kwargs["text"] is True
+        assert status.authenticated is True
+        assert (status.subscription_id, status.user) == ("sub", "me")
+
+    @pytest.mark.asyncio
+    async def test_not_logged_in(self):
+        """Test the login hint is returned when az has no session."""
+        stderr = "ERROR: Please run 'az login' to setup account."
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch("server.azure_context.run_async", self._az(stderr=stderr, code=1)),
+        ):
+            status = await AzureContext.check_auth()
+
+        assert status.authenticated is False
+        assert status.hint == "Run 'az login' to authenticate"
+
+    @pytest.mark.asyncio
+    async def test_signed_in_status_cached(self):
+        """Test a signed-in status is reused without spawning az again."""
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch("server.azure_context.run_async", self._az('{"id": "sub"}')) as run,
+        ):
+            await AzureContext.check_auth()
+            status = await AzureContext.check_auth()
+
+        run.assert_awaited_once()
+        assert status.subscription_id == "sub"
+
+    @pytest.mark.asyncio
+    async def test_signed_out_status_not_cached(self):
+        """Test a failed check is retried on the next call."""
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch("server.azure_context.run_async", self._az(stderr="boom", code=1)) as run,
+        ):
+            await AzureContext.check_auth()
+            await AzureContext.check_auth()
+
+        assert run.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_set_subscription_invalidates(self):
+        """Test switching subscription drops the cached status and list."""
+        with (
+            patch.object(AzureContext, "find_az_cli", return_value="az"),
+            patch("server.azure_context.run_async", self._az('{"id": "sub"}')) as run,
+        ):
+            await AzureContext.check_auth()
+            await AzureContext.set_subscription("other")
+            await AzureContext.check_auth()
+
+        assert run.await_count == 3
@@ -0,0 +1,219 @@
+"""
+Tests for the chat service's reply cache and conversation history.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+pytest.importorskip("openai")
+
+from server import chat_service  # noqa: E402
+from server.chat_service import ChatService  # noqa: E402
+
+
+class _FakeCompletions:
+    """Stand-in for ``client.chat.completions`` that returns canned replies."""
+
+    def __init__(self, *replies: str | Exception):
+        self.replies = list(replies)
+        self.seen: list[list[Any]] = []
+
+    async def create(self, **kwargs: Any) -> SimpleNamespace:
+        self.seen.append([m.get("content") for m in kwargs["messages"]])
+        # Give concurrent turns a chance to interleave, as a real request would
+        await asyncio.sleep(0)
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        message = SimpleNamespace(content=reply, tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _service(*replies: str | Exception) -> tuple[ChatService, _FakeCompletions]:
+    service = ChatService("http://127.0.0.1:5273/v1", "phi-4-mini")
+    completions = _FakeCompletions(*replies)
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return service, completions
+
+
+def _plain_turn(label: str) -> list[dict[str, Any]]:
+    return [
+        {"role": "user", "content": f"question {label}"},
+        {"role": "assistant", "content": f"answer {label}"},
+    ]
+
+
+def _tool_turn(label: str) -> list[dict[str, Any]]:
+    call_id = f"call_{label}"
+    return [
+        {"role": "user", "content": f"check {label}"},
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "arcops.explain", "arguments": "{}"},
+                }
+            ],
+        },
+        {"role": "tool", "tool_call_id": call_id, "content": f"result for {label}"},
+        {"role": "assistant", "content": f"done {label}"},
+    ]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty reply cache."""
+    chat_service._response_cache.clear()
+    yield
+    chat_service._response_cache.clear()
+
+
+class TestResponseCache:
+    """Tests for reuse of tool-free replies."""
+
+    @pytest.mark.asyncio
+    async def test_opposite_question_not_served_from_cache(self):
+        """Test a near-identical prompt with the opposite meaning asks the model again."""
+        prompt = "should I {} the arc proxy setting on my azure local cluster nodes"
+        first, _ = _service("Yes, enable it.")
+        await first.chat(prompt.format("enable"))
+
+        second, completions = _service("No, leave it on.")
+        result = await second.chat(prompt.format("disable"))
+
+        assert result["response"] == "No, leave it on."
+        assert "cached" not in result
+        assert len(completions.seen) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_prompt_served_from_cache(self):
+        """Test the same opening prompt in a new conversation reuses the reply."""
+        first, _ = _service("Arc agents talk to Azure over 443.")
+        await first.chat("which port do arc agents use")
+
+        second, completions = _service()
+        result = await second.chat("which port do arc agents use")
+
+        assert result["cached"] is True
+        assert result["response"] == "Arc agents talk to Azure over 443."
+        assert completions.seen == []
+        assert [m["role"] for m in second._messages[1:]] == ["user", "assistant"]
+
+    @pytest.mark.asyncio
+    async def test_same_prompt_later_in_conversation_misses(self):
+        """Test the key covers the history, not just the latest prompt."""
+        service, completions = _service("first", "second")
+
+        await service.chat("status?")
+        result = await service.chat("status?")
+
+        assert result["response"] == "second"
+        assert len(completions.seen) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_reply_is_not_reused(self, monkeypatch):
+        """Test entries older than RESPONSE_CACHE_TTL go back to the model."""
+        first, _ = _service("old answer")
+        await first.chat("hello")
+        monkeypatch.setattr(chat_service, "RESPONSE_CACHE_TTL", -1.0)
+
+        second, completions = _service("new answer")
+        result = await second.chat("hello")
+
+        assert result["response"] == "new answer"
+        assert len(completions.seen) == 1
+
+    def test_least_recently_used_reply_evicted(self, monkeypatch):
+        """Test the cache drops the entry read longest ago once full."""
+        monkeypatch.setattr(chat_service, "RESPONSE_CACHE_SIZE", 2)
+        chat_service._response_cache_put(b"a", "A")
+        chat_service._response_cache_put(b"b", "B")
+        assert chat_service._response_cache_get(b"a") == "A"
+
+        chat_service._response_cache_put(b"c", "C")
+
+        assert chat_service._response_cache_get(b"b") is None
+        assert chat_service._response_cache_get(b"a") == "A"
+        assert chat_service._response_cache_get(b"c") == "C"
+
+    @pytest.mark.asyncio
+    async def test_cache_opt_out(self):
+        """Test cache=False neither stores nor reuses a reply."""
+        first, _ = _service("stored")
+        await first.chat("hello")
+
+        second, completions = _service("fresh")
+        result = await second.chat("hello", cache=False)
+        third, _ = _service("not stored")
+        await third.chat("goodbye", cache=False)
+
+        assert result["response"] == "fresh"
+        assert "cached" not in result
+        assert len(completions.seen) == 1
+        assert len(chat_service._response_cache) == 1
+
+
+class TestConversationHistory:
+    """Tests for how turns are recorded in the conversation."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_turns_do_not_interleave(self):
+        """Test overlapping chats each see only their own question and stay contiguous."""
+        service, completions = _service("first answer", "second answer")
+
+        await asyncio.gather(service.chat("first question"), service.chat("second question"))
+
+        assert completions.seen[1][1:] == ["second question"]
+        assert [m["role"] for m in service._messages[1:]] == [
+            "user",
+            "assistant",
+            "user",
+            "assistant",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_turn_leaves_history_unchanged(self):
+        """Test a model error drops the whole turn, keeping earlier ones."""
+        service, _ = _service("fine", RuntimeError("model offline"))
+        await service.chat("first question")
+        before = list(service._messages)
+
+        result = await service.chat("second question")
+
+        assert result["success"] is False
+        assert service._messages == before
+
+    def test_trim_keeps_whole_turns(self, monkeypatch):
+        """Test trimming drops complete turns, never tool results without their call."""
+        monkeypatch.setattr(chat_service, "MAX_HISTORY_TURNS", 2)
+        service, _ = _service()
+        turns = [_tool_turn("one"), _tool_turn("two"), _plain_turn("three")]
+        service._messages = [chat_service.SYSTEM_MSG, *(m for turn in turns for m in turn)]
+
+        service._trim_history()
+
+        assert service._messages == [chat_service.SYSTEM_MSG, *turns[1], *turns[2]]
+
+    @pytest.mark.asyncio
+    async def test_compact_cuts_at_turn_boundary(self, monkeypatch):
+        """Test the older half is summarized whole and the newer turns are kept as is."""
+        monkeypatch.setattr(chat_service, "HISTORY_TOKEN_BUDGET", 0)
+        service, completions = _service("- checked proxy on node1")
+        turns = [_tool_turn("one"), _plain_turn("two"), _tool_turn("three"), _plain_turn("four")]
+        service._messages = [chat_service.SYSTEM_MSG, *(m for turn in turns for m in turn)]
+
+        await service._compact_history()
+
+        summary = service._messages[1]
+        assert summary["role"] == "system"
+        assert summary["content"].endswith("- checked proxy on node1")
+        assert service._messages[2:] == [*turns[2], *turns[3]]
+        assert "tool: result for one" in completions.seen[0][1]
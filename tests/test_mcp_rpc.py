@@ -0,0 +1,172 @@
+"""
+Tests for the JSON-RPC 2.0 MCP endpoint.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import yaml
+from fastapi.testclient import TestClient
+
+from server import main
+
+
+@pytest.fixture
+def client() -> TestClient:
+    return TestClient(main.app)
+
+
+class TestMcpRpc:
+    """Tests for single and batched JSON-RPC requests."""
+
+    def test_single_request(self, client):
+        """Test a single request object still gets a single response object."""
+        response = client.post("/mcp/rpc", json={"id": 1, "method": "initialize"})
+
+        body = response.json()
+        assert body["id"] == 1
+        assert body["result"]["serverInfo"]["name"] == "arcops-mcp"
+
+    def test_batch_answered_in_order(self, client):
+        """Test batch entries are answered in order, with per-entry errors."""
+        batch = [
+            {"id": 1, "method": "initialize"},
+            {"id": 2, "method": "nope"},
+            {"id": 3},
+        ]
+        response = client.post("/mcp/rpc", json=batch)
+
+        body = response.json()
+        assert [r["id"] for r in body] == [1, 2, None]
+        assert "result" in body[0]
+        assert body[1]["error"]["code"] == -32601
+        assert body[2]["error"]["code"] == -32600
+
+    def test_batch_tool_calls(self, client):
+        """Test several tools/call entries are dispatched from one POST."""
+        execute = AsyncMock(return_value={"ok": True})
+        tool = main.TOOL_REGISTRY["arcops.explain"]
+        with patch.object(tool, "execute", execute):
+            response = client.post(
+                "/mcp/rpc",
+                json=[
+                    {"id": i, "method": "tools/call", "params": {"name": "arcops.explain"}}
+                    for i in range(3)
+                ],
+            )
+
+        assert execute.await_count == 3
+        assert all(r["result"]["structuredContent"] == {"ok": True} for r in response.json())
+
+    def test_structured_content_opt_out(self, client):
+        """Test includeStructured=false returns the result only as text."""
+        tool = main.TOOL_REGISTRY["arcops.explain"]
+        with patch.object(tool, "execute", AsyncMock(return_value={"ok": True})):
+            response = client.post(
+                "/mcp/rpc",
+                json={
+                    "id": 1,
+                    "method": "tools/call",
+                    "params": {"name": "arcops.explain", "includeStructured": False},
+                },
+            )
+
+        result = response.json()["result"]
+        assert "structuredContent" not in result
+        assert json.loads(result["content"][0]["text"]) == {"ok": True}
+
+    @pytest.mark.parametrize("size", [0, main.MAX_BATCH + 1])
+    def test_batch_size_limits(self, client, size):
+        """Test empty and oversized batches are rejected as invalid requests."""
+        response = client.post("/mcp/rpc", json=[{"id": 1, "method": "initialize"}] * size)
+
+        assert response.json()["error"]["code"] == -32600
+
+
+class TestInvokeTool:
+    """Tests for the /mcp/tools/{tool_name} endpoint."""
+
+    def test_non_json_values_stringified(self, client):
+        """Test values without a JSON type are encoded with str()."""
+        tool = main.TOOL_REGISTRY["arcops.explain"]
+        result = {"path": main.MANIFEST_PATH}
+        with patch.object(tool, "execute", AsyncMock(return_value=result)):
+            response = client.post("/mcp/tools/arcops.explain", json={"arguments": {}})
+
+        assert response.json()["result"] == {"path": str(main.MANIFEST_PATH)}
+
+    def test_unencodable_result_is_an_error(self, client):
+        """Test a result that cannot be encoded becomes an error response."""
+        result: dict = {}
+        result["self"] = result
+        tool = main.TOOL_REGISTRY["arcops.explain"]
+        with patch.object(tool, "execute", AsyncMock(return_value=result)):
+            response = client.post("/mcp/tools/arcops.explain", json={"arguments": {}})
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["success"] is False
+        assert body["error"]
+
+
+class TestClusterStatusResource:
+    """Tests for the arcops://cluster/status resource."""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        main._cluster_status_cache = None
+        yield
+        main._cluster_status_cache = None
+
+    @staticmethod
+    def _az(stdout: str = "", stderr: str = "", code: int = 0) -> AsyncMock:
+        return AsyncMock(return_value=subprocess.CompletedProcess([], code, stdout, stderr))
+
+    @pytest.mark.asyncio
+    async def test_listing_cached(self):
+        """Test az runs without blocking and a listing is reused within the TTL."""
+        with (
+            patch.object(main.AzureContext, "find_az_cli", return_value="az"),
+            patch.object(main, "run_async", self._az('[{"name": "c1"}]')) as run,
+        ):
+            first = await main._read_resource("arcops://cluster/status")
+            second = await main._read_resource("arcops://cluster/status")
+
+        run.assert_awaited_once()
+        assert first is second
+        assert first["clusters"][0]["name"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self):
+        """Test a failed listing is retried on the next read."""
+        with (
+            patch.object(main.AzureContext, "find_az_cli", return_value="az"),
+            patch.object(main, "run_async", self._az(stderr="no login", code=1)) as run,
+        ):
+            await main._read_resource("arcops://cluster/status")
+            status = await main._read_resource("arcops://cluster/status")
+
+        assert run.await_count == 2
+        assert status["stderr"] == "no login"
+
+
+class TestEndpointsResource:
+    """Tests for the arcops://endpoints resource."""
+
+    @pytest.mark.asyncio
+    async def test_config_parsed_once(self):
+        """Test endpoints.yaml is parsed once and reused across reads."""
+        from server import api_routes
+
+        api_routes._ENDPOINTS_CACHE["mtime"] = None
+        with patch("yaml.load", wraps=yaml.load) as load:
+            first = await main._read_resource("arcops://endpoints")
+            second = await main._read_resource("arcops://endpoints")
+
+        load.assert_called_once()
+        assert first == second
+        assert first["count"] == len(first["endpoints"]) > 0
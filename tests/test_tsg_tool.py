@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import json
+import subprocess
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -144,23 +145,22 @@ class TestAzLocalTsgTool:
             {"Name": "AzLocalTSGTool", "Version": "0.3.2", "Path": "C:\\Modules"}
         )
 
-        # Mock search result
-        search_mock = MagicMock()
-        search_mock.returncode = 0
-        search_mock.stdout = json.dumps(sample_fixture["results"])
-
-        def run_side_effect(*args, **kwargs):
-            cmd = args[0] if args else kwargs.get("args", [])
-            if isinstance(cmd, list) and len(cmd) > 2:
-                cmd_str = cmd[-1] if isinstance(cmd[-1], str) else ""
-                if "Get-Module" in cmd_str:
-                    return module_mock
-                elif "Search-AzLocalTSG" in cmd_str:
-                    return search_mock
-            return module_mock
-
-        with patch("subprocess.run", side_effect=run_side_effect):
+        # Mock search result (run_async returns bytes by default)
+        search_result = subprocess.CompletedProcess(
+            [], 0, json.dumps(sample_fixture["results"]).encode(), b""
+        )
+
+        with (
+            patch("subprocess.run", return_value=module_mock),
+            patch("server.tools.azlocal_tsg_tool.run_async", AsyncMock(return_value=search_result)),
+        ):
             result = await tool.execute({"query": "connectivity", "dryRun": False})
 
         assert result["success"] is True
         assert result["resultCount"] == len(sample_fixture["results"])
+
+    def test_result_summary(self):
+        """Test chat summaries report the match count, or the error."""
+        summary = AzLocalTsgTool.result_summary
+        assert summary({"success": True, "resultCount": 3}) == "Found 3 results"
+        assert summary({"error": "boom", "resultCount": 0}) == "Error: boom"
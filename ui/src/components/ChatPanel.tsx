@@ -60,6 +60,7 @@ interface StreamEvent {
     | "selected"
     | "executing"
     | "tool_complete"
+    | "content_delta"
     | "complete"
     | "error";
   phase?: string;
@@ -69,6 +70,7 @@ interface StreamEvent {
   args?: Record<string, unknown>;
   success?: boolean;
   content?: string;
+  text?: string;
   tool_calls?: ToolCall[];
   error?: string;
 }
@@ -698,6 +700,7 @@ export function ChatPanel({ serverUrl, onClose }: ChatPanelProps) {
 
       let scannedTools: ToolExecution[] = [];
       let selectedTool: ToolExecution | null = null;
+      let streamedContent = "";
 
       while (true) {
         const { done, value } = await reader.read();
@@ -804,6 +807,26 @@ export function ChatPanel({ serverUrl, onClose }: ChatPanelProps) {
                 }
                 break;
 
+              case "content_delta":
+                // Summary arrives in sections - grow the assistant message in place
+                if (event.text) {
+                  const isFirst = streamedContent === "";
+                  streamedContent += event.text;
+                  const content = streamedContent;
+                  setMessages((prev) =>
+                    isFirst
+                      ? [
+                          ...prev,
+                          { role: "assistant", content, timestamp: new Date() },
+                        ]
+                      : [
+                          ...prev.slice(0, -1),
+                          { ...prev[prev.length - 1], content },
+                        ],
+                  );
+                }
+                break;
+
               case "complete":
                 // Request complete
                 setExecutionComplete(true);
@@ -825,6 +848,17 @@ export function ChatPanel({ serverUrl, onClose }: ChatPanelProps) {
                   );
                   setToolExecutions(executions);
                 }
+                if (streamedContent) {
+                  // Message was built from content_delta events - attach tool calls
+                  const toolCalls = event.tool_calls;
+                  if (toolCalls && toolCalls.length > 0) {
+                    setMessages((prev) => [
+                      ...prev.slice(0, -1),
+                      { ...prev[prev.length - 1], toolCalls },
+                    ]);
+                  }
+                  break;
+                }
                 const newMessage: Message = {
                   role: "assistant",
                   content: event.content || "I've processed your request.",